@@ -1,6 +1,88 @@
+import os
+import sys
+
 from django.apps import AppConfig
 
+try:
+    import fcntl
+except ImportError:  # Windows 에서는 프로세스 간 잠금 없이 서버 프로세스마다 실행
+    fcntl = None
+
+# 백그라운드 작업 잠금 파일 (프로세스가 끝날 때까지 열어 둠)
+_job_lock = None
+
+
+# 백그라운드 작업을 시작하는 WSGI/ASGI 서버 프로그램
+_SERVER_PROGRAMS = ('gunicorn', 'uvicorn', 'daphne', 'hypercorn', 'uwsgi')
+
+
+def _program(argv0):
+    # 실행한 프로그램 이름 (python -m <패키지> 로 실행했으면 패키지 이름)
+    name = os.path.basename(argv0)
+    if name == '__main__.py':
+        name = os.path.basename(os.path.dirname(argv0))
+    return name
+
+
+def _isServerProcess():
+    # runserver(자동 재시작 감시 프로세스 제외, 실제 서버는 RUN_MAIN=true 인 자식)와 알려진 WSGI/ASGI 서버만
+    # migrate/shell 등 관리 명령, pytest, celery, 임의 스크립트에서는 시작하지 않음
+    argv = sys.argv
+    program = _program(argv[0]) if argv else ''
+    if program in _SERVER_PROGRAMS:
+        return True
+    if program in ('manage.py', 'django-admin', 'django') and len(argv) > 1 and argv[1] == 'runserver':
+        return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in argv
+    return False
+
+
+def _backgroundEnabled(setting):
+    # KIS_BACKGROUND_JOBS: 1 이면 항상, 0 이면 시작 안 함, 비우면 서버 프로세스에서만
+    if setting in ('0', 'false', 'False'):
+        return False
+    if setting in ('1', 'true', 'True'):
+        return True
+    return _isServerProcess()
+
+
+def _acquireJobLock(path):
+    # 여러 워커 프로세스 중 잠금을 잡은 하나에서만 백그라운드 작업 실행 (path 를 비우면 잠금 없이 실행)
+    global _job_lock
+    if _job_lock is not None:
+        return True
+    if not path or fcntl is None:
+        return True
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    f = open(path, 'a')
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return False
+    _job_lock = f
+    return True
+
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        from django.conf import settings
+
+        refresh_at = getattr(settings, 'KIS_MASTER_REFRESH_AT', '')
+        watchlist = getattr(settings, 'KIS_MINUTE_WATCHLIST', [])
+        if not (refresh_at or watchlist) or not _backgroundEnabled(getattr(settings, 'KIS_BACKGROUND_JOBS', '')):
+            return
+        if not _acquireJobLock(getattr(settings, 'KIS_BACKGROUND_LOCK', '')):
+            return
+
+        # 종목 마스터 정기 갱신 (KIS_MASTER_REFRESH_AT 이 지정된 경우에만)
+        if refresh_at:
+            from api.data.master_refresh import start_master_refresh
+            start_master_refresh(refresh_at)
+
+        # 당일 분봉 기록 (KIS_MINUTE_WATCHLIST 가 지정된 경우에만)
+        if watchlist:
+            from api.data.minute_recorder import start_minute_recorder
+            start_minute_recorder(watchlist, getattr(settings, 'KIS_MINUTE_INTERVAL', 60))
@@ -0,0 +1,371 @@
+# 로컬 OHLCV 봉 저장소 (sqlite)
+# 국내주식기간별시세(inquire_daily_itemchartprice)는 한 번에 100봉까지만 주므로, 받은 봉과 "이미 조회한 기간"을
+# sqlite 에 저장해 두고 비어 있는 기간만 100봉 단위로 거슬러 올라가며 채웁니다. 읽기는 (종목, 시장, 주기, 수정주가 여부, 일자)
+# 기본키 범위 조회라 디스크에서 바로 응답합니다.
+#
+# 사용 예:
+#     df = ensure_history("005930", "20240101", "20241231")          # 일봉, 수정주가
+#     df = ensure_history("005930", "20200101", "20241231", "W", adjusted=False)   # 주봉, 원주가
+#     df.loc["2024-06-03", "close"]
+#
+# 수정주가는 액면분할/증자 등이 있으면 과거 값이 다시 계산되므로, 새 기간을 받을 때 마지막으로 저장한 봉을 함께 받아
+# 값이 달라졌으면 그 종목의 수정주가 봉을 모두 지우고 다시 받습니다. 당일(주/월/년봉은 진행 중인 기간) 봉은 아직 확정되지
+# 않았으므로 저장은 하되 조회한 기간으로 기록하지 않아, 다음 호출 때 다시 받습니다. 주말/휴장일만으로 이루어진 짧은 빈 기간은
+# 거래일 캘린더(trading_calendar)로 확인해 요청 없이 조회한 기간으로 기록합니다.
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+import pandas as pd
+
+from api.data.trading_calendar import TradingCalendar, get_trading_calendar
+
+logger = logging.getLogger(__name__)
+
+BAR_DB_PATH = os.getenv("KIS_BAR_DB", os.path.join("api", "data", ".bars.sqlite3"))
+
+DAILY_MAX_BARS = 100  # inquire_daily_itemchartprice 한 번에 받는 최대 봉 수
+CALENDAR_GAP_DAYS = 31  # 이 일수 이하의 빈 기간만 거래일 캘린더로 휴장 여부 확인 (긴 기간은 거래일이 있으므로 바로 조회)
+
+BAR_COLUMNS = ["open", "high", "low", "close", "volume", "amount"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    code TEXT NOT NULL,
+    market TEXT NOT NULL,       -- 조건 시장 분류 코드 (J: KRX, NX: NXT, UN: 통합)
+    period TEXT NOT NULL,       -- D/W/M/Y, 분봉은 '1m'
+    adj INTEGER NOT NULL,       -- 1: 수정주가, 0: 원주가
+    dt TEXT NOT NULL,           -- 일/주/월/년봉 YYYYMMDD, 분봉 YYYYMMDDHHMMSS
+    open INTEGER, high INTEGER, low INTEGER, close INTEGER, volume INTEGER, amount INTEGER,
+    PRIMARY KEY (code, market, period, adj, dt)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    code TEXT NOT NULL,
+    market TEXT NOT NULL,
+    period TEXT NOT NULL,
+    adj INTEGER NOT NULL,
+    start TEXT NOT NULL,        -- 조회를 마친 기간 (양 끝 포함)
+    end TEXT NOT NULL,
+    PRIMARY KEY (code, market, period, adj, start)
+) WITHOUT ROWID;
+"""
+
+_KEY = "code = ? AND market = ? AND period = ? AND adj = ?"
+
+
+def _toDate(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value).replace("-", ""), "%Y%m%d").date()
+
+
+def _fmt(d: date) -> str:
+    return d.strftime("%Y%m%d")
+
+
+def _settledUntil(period: str, today: date) -> date:
+    """확정된 봉의 마지막 날 (진행 중인 일/주/월/년은 제외)"""
+    if period == "W":
+        return today - timedelta(days=today.weekday() + 1)
+    if period == "M":
+        return today.replace(day=1) - timedelta(days=1)
+    if period == "Y":
+        return today.replace(month=1, day=1) - timedelta(days=1)
+    return today - timedelta(days=1)
+
+
+def _toInt(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class BarFetchError(Exception):
+    """봉 조회 실패 (응답 rt_cd != 0, HTTP 오류, 서킷 브레이커 등), "조회 결과 없음" 과 구분하기 위해 사용"""
+
+
+def _daily_fetch(code: str, start: str, end: str, period: str, adjusted: bool, market: str) -> pd.DataFrame:
+    # 기본 조회 함수: output2 (최신 봉부터 최대 100개)
+    # inquire_daily_itemchartprice 는 실패해도 빈 DataFrame 을 돌려주므로 같은 요청을 직접 보내 실패를 구분
+    import api.functions.kis_auth as ka
+
+    res = ka._url_fetch("/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice", "FHKST03010100", "", {
+        "FID_COND_MRKT_DIV_CODE": market,
+        "FID_INPUT_ISCD": code,
+        "FID_INPUT_DATE_1": start,
+        "FID_INPUT_DATE_2": end,
+        "FID_PERIOD_DIV_CODE": period,
+        "FID_ORG_ADJ_PRC": "0" if adjusted else "1",
+    })
+    if not res.isOK():
+        raise BarFetchError(f"{code} {start}~{end} {period}: {res.getErrorCode()} {res.getErrorMessage()}")
+    return res.frame("output2")
+
+
+def bars_from_output(df: pd.DataFrame) -> List[tuple]:
+    """inquire_daily_itemchartprice output2 → (dt, open, high, low, close, volume, amount) 목록 (빈 행 제외)"""
+    if df is None or df.empty or "stck_bsop_date" not in df.columns:
+        return []
+    rows = []
+    for rec in df.to_dict("records"):
+        dt = str(rec.get("stck_bsop_date") or "").strip()
+        if len(dt) != 8 or not dt.isdigit():
+            continue
+        rows.append((dt, _toInt(rec.get("stck_oprc")), _toInt(rec.get("stck_hgpr")), _toInt(rec.get("stck_lwpr")),
+                     _toInt(rec.get("stck_clpr")), _toInt(rec.get("acml_vol")), _toInt(rec.get("acml_tr_pbmn"))))
+    return rows
+
+
+def missing_ranges(covered: List[Tuple[date, date]], start: date, end: date) -> List[Tuple[date, date]]:
+    """[start, end] 에서 covered(정렬된 (시작, 끝) 목록) 에 포함되지 않는 구간"""
+    gaps = []
+    cursor = start
+    for s, e in covered:
+        if e < cursor:
+            continue
+        if s > end:
+            break
+        if s > cursor:
+            gaps.append((cursor, s - timedelta(days=1)))
+        cursor = max(cursor, e + timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class BarStore:
+    """
+    sqlite 봉 저장소.
+
+    Args:
+        path (str): DB 파일 경로 (기본 KIS_BAR_DB)
+        fetch (Callable): (code, start, end, period, adjusted, market) → output2 DataFrame,
+            기본은 inquire_daily_itemchartprice (테스트 시 가짜 함수로 대체), 조회 실패 시 BarFetchError
+        calendar (TradingCalendar): 휴장일 확인용 거래일 캘린더 (기본 get_trading_calendar())
+
+    Attributes:
+        api_calls (int): 지금까지 보낸 기간별시세 요청 수
+    """
+
+    def __init__(self, path: str = None, fetch: Callable = None, calendar: TradingCalendar = None):
+        self.path = path or BAR_DB_PATH
+        self.fetch = fetch or _daily_fetch
+        self.calendar = calendar
+        self.api_calls = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        # 스레드마다 연결 하나 (sqlite 연결은 스레드 간 공유 불가)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _connect(self):
+        conn = self._conn()
+        with conn:  # 트랜잭션 (예외 시 rollback)
+            yield conn
+
+    # ----- 저장/조회 -----
+
+    def write_bars(self, code: str, rows: List[tuple], period: str = "D", adjusted: bool = True,
+                   market: str = "J"):
+        """(dt, open, high, low, close, volume, amount) 목록 저장 (같은 시각은 덮어쓰되, 값이 None 인 항목은 기존 값 유지)"""
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (code, market, period, adj, dt) DO UPDATE SET "
+                + ", ".join(f"{c} = COALESCE(excluded.{c}, bars.{c})" for c in BAR_COLUMNS),
+                [(code, market, period, int(adjusted), *row) for row in rows])
+
+    def read(self, code: str, start, end, period: str = "D", adjusted: bool = True,
+             market: str = "J") -> pd.DataFrame:
+        """
+        저장된 봉을 조회합니다. (API 호출 없음)
+
+        Returns:
+            pd.DataFrame: 시각(DatetimeIndex, 오름차순) index, open/high/low/close/volume/amount (int64)
+        """
+        lo, hi = str(start).replace("-", ""), str(end).replace("-", "")
+        if len(hi) == 8 and period.endswith("m"):
+            hi += "999999"  # 분봉은 종료일 하루 전체
+        cur = self._conn().execute(
+            f"SELECT dt, open, high, low, close, volume, amount FROM bars WHERE {_KEY} AND dt BETWEEN ? AND ? "
+            "ORDER BY dt", (code, market, period, int(adjusted), lo, hi))
+        df = pd.DataFrame(cur.fetchall(), columns=["dt"] + BAR_COLUMNS)
+        fmt = "%Y%m%d%H%M%S" if period.endswith("m") else "%Y%m%d"
+        df.index = pd.DatetimeIndex(pd.to_datetime(df.pop("dt"), format=fmt), name="date")
+        return df.astype({c: "Int64" if df[c].isna().any() else "int64" for c in BAR_COLUMNS})
+
+    def coverage(self, code: str, period: str = "D", adjusted: bool = True,
+                 market: str = "J") -> List[Tuple[date, date]]:
+        """조회를 마친 기간 목록 (시작일 순)"""
+        cur = self._conn().execute(f"SELECT start, end FROM coverage WHERE {_KEY} ORDER BY start",
+                                   (code, market, period, int(adjusted)))
+        return [(_toDate(s), _toDate(e)) for s, e in cur.fetchall()]
+
+    def add_coverage(self, code: str, start: date, end: date, period: str = "D", adjusted: bool = True,
+                     market: str = "J"):
+        """조회한 기간을 기록합니다. (겹치거나 맞닿은 기간은 하나로 합침)"""
+        if start > end:
+            return
+        ranges = sorted(self.coverage(code, period, adjusted, market) + [(start, end)])
+        merged = [ranges[0]]
+        for s, e in ranges[1:]:
+            if s <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+            else:
+                merged.append((s, e))
+        key = (code, market, period, int(adjusted))
+        with self._connect() as conn:
+            conn.execute(f"DELETE FROM coverage WHERE {_KEY}", key)
+            conn.executemany("INSERT INTO coverage VALUES (?, ?, ?, ?, ?, ?)",
+                             [(*key, _fmt(s), _fmt(e)) for s, e in merged])
+
+    def clear(self, code: str, period: str = "D", adjusted: bool = True, market: str = "J"):
+        """종목/주기/가격 구분의 봉과 조회 기록을 지웁니다."""
+        key = (code, market, period, int(adjusted))
+        with self._connect() as conn:
+            conn.execute(f"DELETE FROM bars WHERE {_KEY}", key)
+            conn.execute(f"DELETE FROM coverage WHERE {_KEY}", key)
+
+    def latest(self, code: str, period: str = "D", adjusted: bool = True, market: str = "J",
+               before: str = None) -> Optional[Tuple[str, int]]:
+        """before(미포함) 이전의 마지막 저장 봉 (dt, close), 없으면 None"""
+        return self._conn().execute(
+            f"SELECT dt, close FROM bars WHERE {_KEY} AND dt < ? ORDER BY dt DESC LIMIT 1",
+            (code, market, period, int(adjusted), before or "99999999999999")).fetchone()
+
+    # ----- 기간별시세 동기화 -----
+
+    def _hasTradingDay(self, start: date, end: date) -> bool:
+        calendar = self.calendar or get_trading_calendar()
+        return calendar.trading_days_between(start, end) > 0
+
+    def _fetchRange(self, code, start: date, end: date, period, adjusted, market) -> Tuple[List[tuple], bool]:
+        """
+        [start, end] 를 최신 봉부터 100봉씩 거슬러 올라가며 받습니다.
+
+        Returns:
+            (rows, complete): 받은 봉, 기간 끝까지 받았는지 여부 (조회가 실패하면 그때까지 받은 봉과 False)
+        """
+        rows = []
+        cursor = end
+        while cursor >= start:
+            self.api_calls += 1
+            try:
+                output = self.fetch(code, _fmt(start), _fmt(cursor), period, adjusted, market)
+            except BarFetchError as e:
+                logger.warning("Bar fetch failed, leaving %s %s~%s uncovered: %s", code, start, cursor, e)
+                return rows, False
+            page = [r for r in bars_from_output(output) if _fmt(start) <= r[0] <= _fmt(cursor)]
+            if not page:
+                break
+            rows.extend(page)
+            if len(page) < DAILY_MAX_BARS:
+                break
+            cursor = _toDate(min(r[0] for r in page)) - timedelta(days=1)
+        return rows, True
+
+    def ensure_history(self, code: str, start, end=None, period: str = "D", adjusted: bool = True,
+                       market: str = "J") -> pd.DataFrame:
+        """
+        [start, end] 기간의 봉이 저장소에 있도록 비어 있는 기간만 받아 채운 뒤 저장소에서 읽어 반환합니다.
+
+        Args:
+            code (str): 종목코드
+            start, end: 조회 기간 (YYYYMMDD 문자열/date, end 기본 오늘)
+            period (str): D 일봉, W 주봉, M 월봉, Y 년봉
+            adjusted (bool): True 수정주가 (fid_org_adj_prc=0), False 원주가 (1)
+            market (str): 조건 시장 분류 코드 (J: KRX, NX: NXT, UN: 통합)
+
+        Returns:
+            pd.DataFrame: read() 와 같은 형식, 조회가 실패해 빈 기간이 남았으면 attrs["complete"] 가 False
+                (받은 봉만 저장하고 조회한 기간으로 기록하지 않으므로 다음 호출 때 다시 받음)
+        """
+        today = date.today()
+        start = _toDate(start)
+        end = min(_toDate(end) if end else today, today)
+        series = (period, adjusted, market)
+        complete = True
+
+        with self._lock:
+            settled = _settledUntil(period, today)
+            covered = self.coverage(code, *series)
+            for gap_start, gap_end in missing_ranges(covered, start, end):
+                if (gap_end - gap_start).days < CALENDAR_GAP_DAYS and not self._hasTradingDay(gap_start, gap_end):
+                    self.add_coverage(code, gap_start, min(gap_end, settled), *series)
+                    continue
+                fetch_start, last = gap_start, None
+                if adjusted and any(e == gap_start - timedelta(days=1) for _, e in covered):
+                    # 이어지는 기간이면 마지막 저장 봉을 함께 받아 수정주가가 다시 계산되었는지 확인
+                    last = self.latest(code, *series, before=_fmt(gap_start))
+                    if last is not None:
+                        fetch_start = _toDate(last[0])
+                rows, complete = self._fetchRange(code, fetch_start, gap_end, *series)
+
+                overlap = next((r for r in rows if r[0] == last[0]), None) if last is not None else None
+                if overlap is not None and overlap[4] != last[1]:
+                    logger.info("%s adjusted prices changed (%s close %s -> %s), refetching history",
+                                code, last[0], last[1], overlap[4])
+                    self.clear(code, *series)
+                    rows, complete = self._fetchRange(code, start, end, *series)
+                    self.write_bars(code, rows, *series)
+                    if complete:
+                        self.add_coverage(code, start, min(end, settled), *series)
+                    break
+
+                self.write_bars(code, rows, *series)
+                if not complete:
+                    break  # 실패한 기간은 기록하지 않고, 남은 기간도 다음 호출에서 받음
+                self.add_coverage(code, gap_start, min(gap_end, settled), *series)
+
+        df = self.read(code, _fmt(start), _fmt(end), *series)
+        df.attrs["complete"] = complete
+        return df
+
+
+_bar_store: Optional[BarStore] = None
+_bar_store_lock = threading.Lock()
+
+
+def get_bar_store() -> BarStore:
+    """프로세스 전역 저장소 (KIS_BAR_DB)"""
+    global _bar_store
+    if _bar_store is None:
+        with _bar_store_lock:
+            if _bar_store is None:
+                _bar_store = BarStore()
+    return _bar_store
+
+
+def set_bar_store(store: BarStore) -> None:
+    global _bar_store
+    _bar_store = store
+
+
+def ensure_history(code: str, start, end=None, period: str = "D", adjusted: bool = True,
+                   market: str = "J") -> pd.DataFrame:
+    """전역 저장소의 BarStore.ensure_history"""
+    return get_bar_store().ensure_history(code, start, end, period, adjusted, market)
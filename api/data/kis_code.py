@@ -2,200 +2,241 @@
 # https://github.com/koreainvestment/open-trading-api/blob/main/stocks_info/kis_kospi_code_mst.py
 
 
+import io
 import urllib.request
 import ssl
+import tempfile
 import zipfile
 import os
+
+import numpy as np
 import pandas as pd
 
 base_dir = os.getcwd()
 
 
-def kospi_master_download(base_dir, verbose=False):
-    cwd = os.getcwd()
-    if (verbose):
-        print(f"current directory is {cwd}")
-    ssl._create_default_https_context = ssl._create_unverified_context
+# 마스터 다운로드 주소 (테스트 시 로컬 HTTP 서버나 file:// 경로로 대체 가능)
+MASTER_URL = os.getenv("KIS_MASTER_URL", "https://new.real.download.dws.co.kr/common/master")
+
+
+def download_master(market, dest_dir, base_url=None, timeout=30, verify=None):
+    """
+    {base_url}/{market}_code.mst.zip 을 받아 dest_dir 에 .mst 파일로 저장합니다.
+    압축은 메모리에서 풀고 임시 파일에 쓴 뒤 교체하므로 작업 디렉토리(chdir)나
+    프로세스 전역 SSL 설정을 바꾸지 않고, 읽는 쪽이 반쯤 쓰인 파일을 보지 않습니다.
+
+    Args:
+        market (str): 'kospi' | 'kosdaq'
+        dest_dir (str): 저장할 디렉토리
+        base_url (str): 다운로드 주소 (기본 KIS_MASTER_URL)
+        verify (bool): 인증서 검증 여부 (기본 KIS_MASTER_SSL_VERIFY, 이 요청에만 적용)
+
+    Returns:
+        str: 저장한 .mst 파일 경로
+    """
+    file_name = MASTERS[market][0]
+    url = f"{(base_url or MASTER_URL).rstrip('/')}/{file_name}.zip"
+    if verify is None:
+        verify = os.getenv("KIS_MASTER_SSL_VERIFY", "1") != "0"
+    context = None if verify else ssl._create_unverified_context()
+
+    with urllib.request.urlopen(url, timeout=timeout, context=context) as res:
+        payload = res.read()
+    with zipfile.ZipFile(io.BytesIO(payload)) as zf:
+        data = zf.read(file_name)
+
+    os.makedirs(dest_dir, exist_ok=True)
+    path = os.path.join(dest_dir, file_name)
+    fd, tmp = tempfile.mkstemp(prefix=f".{file_name}.", dir=dest_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return path
 
-    urllib.request.urlretrieve("https://new.real.download.dws.co.kr/common/master/kospi_code.mst.zip",
-                               base_dir + "/kospi_code.zip")
 
-    os.chdir(base_dir)
+def kospi_master_download(base_dir, verbose=False):
+    path = download_master('kospi', base_dir)
     if (verbose):
-        print(f"change directory to {base_dir}")
-    kospi_zip = zipfile.ZipFile('kospi_code.zip')
-    kospi_zip.extractall()
-
-    kospi_zip.close()
-
-    if os.path.exists("kospi_code.zip"):
-        os.remove("kospi_code.zip")
+        print(f"downloaded {path}")
 
 
 def kosdaq_master_download(base_dir, verbose=False):
-
-    cwd = os.getcwd()
+    path = download_master('kosdaq', base_dir)
     if (verbose):
-        print(f"current directory is {cwd}")
-    ssl._create_default_https_context = ssl._create_unverified_context
+        print(f"downloaded {path}")
+
+
+# 마스터 파일 레코드 = 단축코드(9) + 표준코드(12) + 한글명(가변, cp949) + 고정폭 필드(ASCII)
+# 고정폭 필드 정의: (컬럼명, 바이트 수, 타입)
+#   s: 문자열/구분코드, i: 정수(가격·수량·금액), f: 실수, b: Y/N 여부, d: 일자(YYYYMMDD)
+KOSPI_FIELDS = [
+    ('그룹코드', 2, 's'), ('시가총액규모', 1, 's'), ('지수업종대분류', 4, 's'), ('지수업종중분류', 4, 's'),
+    ('지수업종소분류', 4, 's'), ('제조업', 1, 'b'), ('저유동성', 1, 'b'), ('지배구조지수종목', 1, 'b'),
+    ('KOSPI200섹터업종', 1, 's'), ('KOSPI100', 1, 'b'), ('KOSPI50', 1, 'b'), ('KRX', 1, 'b'),
+    ('ETP', 1, 's'), ('ELW발행', 1, 'b'), ('KRX100', 1, 'b'), ('KRX자동차', 1, 'b'),
+    ('KRX반도체', 1, 'b'), ('KRX바이오', 1, 'b'), ('KRX은행', 1, 'b'), ('SPAC', 1, 'b'),
+    ('KRX에너지화학', 1, 'b'), ('KRX철강', 1, 'b'), ('단기과열', 1, 's'), ('KRX미디어통신', 1, 'b'),
+    ('KRX건설', 1, 'b'), ('Non1', 1, 'b'), ('KRX증권', 1, 'b'), ('KRX선박', 1, 'b'),
+    ('KRX섹터_보험', 1, 'b'), ('KRX섹터_운송', 1, 'b'), ('SRI', 1, 'b'), ('기준가', 9, 'i'),
+    ('매매수량단위', 5, 'i'), ('시간외수량단위', 5, 'i'), ('거래정지', 1, 'b'), ('정리매매', 1, 'b'),
+    ('관리종목', 1, 'b'), ('시장경고', 2, 's'), ('경고예고', 1, 'b'), ('불성실공시', 1, 'b'),
+    ('우회상장', 1, 'b'), ('락구분', 2, 's'), ('액면변경', 2, 's'), ('증자구분', 2, 's'),
+    ('증거금비율', 3, 'i'), ('신용가능', 1, 'b'), ('신용기간', 3, 'i'), ('전일거래량', 12, 'i'),
+    ('액면가', 12, 'i'), ('상장일자', 8, 'd'), ('상장주수', 15, 'i'), ('자본금', 21, 'i'),
+    ('결산월', 2, 'i'), ('공모가', 7, 'i'), ('우선주', 1, 's'), ('공매도과열', 1, 'b'),
+    ('이상급등', 1, 'b'), ('KRX300', 1, 'b'), ('KOSPI', 1, 'b'), ('매출액', 9, 'i'),
+    ('영업이익', 9, 'i'), ('경상이익', 9, 'i'), ('당기순이익', 5, 'i'), ('ROE', 9, 'f'),
+    ('기준년월', 8, 'd'), ('시가총액', 9, 'i'), ('그룹사코드', 3, 's'), ('회사신용한도초과', 1, 'b'),
+    ('담보대출가능', 1, 'b'), ('대주가능', 1, 'b'),
+]
+
+KOSDAQ_FIELDS = [
+    ('증권그룹구분코드', 2, 's'), ('시가총액 규모 구분 코드 유가', 1, 's'),
+    ('지수업종 대분류 코드', 4, 's'), ('지수 업종 중분류 코드', 4, 's'), ('지수업종 소분류 코드', 4, 's'),
+    ('벤처기업 여부 (Y/N)', 1, 'b'), ('저유동성종목 여부', 1, 'b'), ('KRX 종목 여부', 1, 'b'),
+    ('ETP 상품구분코드', 1, 's'), ('KRX100 종목 여부 (Y/N)', 1, 'b'), ('KRX 자동차 여부', 1, 'b'),
+    ('KRX 반도체 여부', 1, 'b'), ('KRX 바이오 여부', 1, 'b'), ('KRX 은행 여부', 1, 'b'),
+    ('기업인수목적회사여부', 1, 'b'), ('KRX 에너지 화학 여부', 1, 'b'), ('KRX 철강 여부', 1, 'b'),
+    ('단기과열종목구분코드', 1, 's'), ('KRX 미디어 통신 여부', 1, 'b'), ('KRX 건설 여부', 1, 'b'),
+    ('(코스닥)투자주의환기종목여부', 1, 'b'), ('KRX 증권 구분', 1, 'b'), ('KRX 선박 구분', 1, 'b'),
+    ('KRX섹터지수 보험여부', 1, 'b'), ('KRX섹터지수 운송여부', 1, 'b'), ('KOSDAQ150지수여부 (Y,N)', 1, 'b'),
+    ('주식 기준가', 9, 'i'), ('정규 시장 매매 수량 단위', 5, 'i'), ('시간외 시장 매매 수량 단위', 5, 'i'),
+    ('거래정지 여부', 1, 'b'), ('정리매매 여부', 1, 'b'), ('관리 종목 여부', 1, 'b'),
+    ('시장 경고 구분 코드', 2, 's'), ('시장 경고위험 예고 여부', 1, 'b'), ('불성실 공시 여부', 1, 'b'),
+    ('우회 상장 여부', 1, 'b'), ('락구분 코드', 2, 's'), ('액면가 변경 구분 코드', 2, 's'),
+    ('증자 구분 코드', 2, 's'), ('증거금 비율', 3, 'i'), ('신용주문 가능 여부', 1, 'b'), ('신용기간', 3, 'i'),
+    ('전일 거래량', 12, 'i'), ('주식 액면가', 12, 'i'), ('주식 상장 일자', 8, 'd'), ('상장 주수(천)', 15, 'i'),
+    ('자본금', 21, 'i'), ('결산 월', 2, 'i'), ('공모 가격', 7, 'i'), ('우선주 구분 코드', 1, 's'),
+    ('공매도과열종목여부', 1, 'b'), ('이상급등종목여부', 1, 'b'), ('KRX300 종목 여부 (Y/N)', 1, 'b'),
+    ('매출액', 9, 'i'), ('영업이익', 9, 'i'), ('경상이익', 9, 'i'), ('단기순이익', 5, 'i'),
+    ('ROE(자기자본이익률)', 9, 'f'), ('기준년월', 8, 'd'), ('전일기준 시가총액 (억)', 9, 'i'),
+    ('그룹사 코드', 3, 's'), ('회사신용한도초과여부', 1, 'b'), ('담보대출가능여부', 1, 'b'), ('대주가능여부', 1, 'b'),
+]
+
+MASTERS = {
+    # 시장: (파일명, 한글명 컬럼, 고정폭 필드)
+    'kospi': ('kospi_code.mst', '한글명', KOSPI_FIELDS),
+    'kosdaq': ('kosdaq_code.mst', '한글종목명', KOSDAQ_FIELDS),
+}
+
+
+def _typed_column(raw, kind):
+    """고정폭 바이트 컬럼(np.bytes_)을 타입에 맞는 배열로 변환, 빈 값은 결측치"""
+    values = np.char.strip(raw)
+    blank = values == b''
+    if kind == 's':
+        return values.astype('U')
+    if kind == 'b':
+        flags = values == b'Y'
+        return pd.arrays.BooleanArray(flags, blank) if blank.any() else flags
+    values[blank] = b'0'
+    if kind == 'f':
+        floats = values.astype(np.float64)
+        floats[blank] = np.nan
+        return floats
+    ints = values.astype(np.int64)
+    if kind == 'd':
+        dates = pd.to_datetime(ints, format='%Y%m%d', errors='coerce')
+        return dates.where(~blank & (ints > 0))
+    return pd.arrays.IntegerArray(ints, blank) if blank.any() else ints
+
+
+def parse_master(data: bytes, name_column, fields) -> pd.DataFrame:
+    """
+    마스터 파일 내용을 임시 파일 없이 메모리에서 한 번에 파싱합니다.
+
+    각 레코드의 뒤쪽 고정폭 영역을 이어 붙여 NumPy 구조화 배열로 한 번에 잘라내고,
+    컬럼별로 정수/실수/여부/일자 타입으로 변환합니다.
+    """
+    tail = sum(width for _, width, _ in fields)
+    lines = [line for line in data.replace(b'\r', b'').split(b'\n') if len(line) > tail]
+
+    heads = [line[:-tail] for line in lines]
+    columns = {
+        '단축코드': [h[0:9].rstrip().decode('ascii', errors='ignore') for h in heads],
+        '표준코드': [h[9:21].rstrip().decode('ascii', errors='ignore') for h in heads],
+        name_column: [h[21:].strip().decode('cp949', errors='ignore') for h in heads],
+    }
+
+    dtype = np.dtype([(f'f{i}', f'S{width}') for i, (_, width, _) in enumerate(fields)])
+    records = np.frombuffer(b''.join(line[-tail:] for line in lines), dtype=dtype)
+    for i, (column, _, kind) in enumerate(fields):
+        columns[column] = _typed_column(records[f'f{i}'], kind)
+
+    return pd.DataFrame(columns)
+
+
+def get_master_dataframe(base_dir, market):
+    """base_dir 의 kospi/kosdaq 마스터 파일을 타입이 지정된 DataFrame 으로 읽습니다."""
+    file_name, name_column, fields = MASTERS[market]
+    with open(os.path.join(base_dir, file_name), 'rb') as f:
+        return parse_master(f.read(), name_column, fields)
 
-    urllib.request.urlretrieve("https://new.real.download.dws.co.kr/common/master/kosdaq_code.mst.zip",
-                               base_dir + "/kosdaq_code.zip")
 
-    os.chdir(base_dir)
-    if (verbose):
-        print(f"change directory to {base_dir}")
-    kosdaq_zip = zipfile.ZipFile('kosdaq_code.zip')
-    kosdaq_zip.extractall()
+def get_kospi_master_dataframe(base_dir):
+    return get_master_dataframe(base_dir, 'kospi')
 
-    kosdaq_zip.close()
 
-    if os.path.exists("kosdaq_code.zip"):
-        os.remove("kosdaq_code.zip")
+def get_kosdaq_master_dataframe(base_dir):
+    return get_master_dataframe(base_dir, 'kosdaq')
 
 
-def get_kospi_master_dataframe(base_dir):
-    file_name = base_dir + "/kospi_code.mst"
-    tmp_fil1 = base_dir + "/kospi_code_part1.tmp"
-    tmp_fil2 = base_dir + "/kospi_code_part2.tmp"
+# 기존 방식 (cp949 임시 파일 두 개 + read_csv/read_fwf), 벤치마크와 결과 비교용
+def _get_master_dataframe_fwf(base_dir, market):
+    file_name, name_column, fields = MASTERS[market]
+    tail = sum(width for _, width, _ in fields) + 1  # 개행 포함
+    file_name = os.path.join(base_dir, file_name)
+    tmp_fil1 = file_name + "_part1.tmp"
+    tmp_fil2 = file_name + "_part2.tmp"
 
     wf1 = open(tmp_fil1, mode="w", encoding="cp949", errors="ignore")
     wf2 = open(tmp_fil2, mode="w", encoding="cp949", errors="ignore")
 
     with open(file_name, mode="r", encoding="cp949", errors="ignore") as f:
         for row in f:
-            rf1 = row[0:len(row) - 228]
+            rf1 = row[0:len(row) - tail]
             rf1_1 = rf1[0:9].rstrip()
             rf1_2 = rf1[9:21].rstrip()
             rf1_3 = rf1[21:].strip()
             wf1.write(rf1_1 + ',' + rf1_2 + ',' + rf1_3 + '\n')
-            rf2 = row[-228:]
+            rf2 = row[-tail:]
             wf2.write(rf2)
 
     wf1.close()
     wf2.close()
 
-    part1_columns = ['단축코드', '표준코드', '한글명']
     df1 = pd.read_csv(tmp_fil1, header=None,
-                      names=part1_columns, encoding='cp949')
-
-    field_specs = [2, 1, 4, 4, 4,
-                   1, 1, 1, 1, 1,
-                   1, 1, 1, 1, 1,
-                   1, 1, 1, 1, 1,
-                   1, 1, 1, 1, 1,
-                   1, 1, 1, 1, 1,
-                   1, 9, 5, 5, 1,
-                   1, 1, 2, 1, 1,
-                   1, 2, 2, 2, 3,
-                   1, 3, 12, 12, 8,
-                   15, 21, 2, 7, 1,
-                   1, 1, 1, 1, 9,
-                   9, 9, 5, 9, 8,
-                   9, 3, 1, 1, 1
-                   ]
-
-    part2_columns = ['그룹코드', '시가총액규모', '지수업종대분류', '지수업종중분류', '지수업종소분류',
-                     '제조업', '저유동성', '지배구조지수종목', 'KOSPI200섹터업종', 'KOSPI100',
-                     'KOSPI50', 'KRX', 'ETP', 'ELW발행', 'KRX100',
-                     'KRX자동차', 'KRX반도체', 'KRX바이오', 'KRX은행', 'SPAC',
-                     'KRX에너지화학', 'KRX철강', '단기과열', 'KRX미디어통신', 'KRX건설',
-                     'Non1', 'KRX증권', 'KRX선박', 'KRX섹터_보험', 'KRX섹터_운송',
-                     'SRI', '기준가', '매매수량단위', '시간외수량단위', '거래정지',
-                     '정리매매', '관리종목', '시장경고', '경고예고', '불성실공시',
-                     '우회상장', '락구분', '액면변경', '증자구분', '증거금비율',
-                     '신용가능', '신용기간', '전일거래량', '액면가', '상장일자',
-                     '상장주수', '자본금', '결산월', '공모가', '우선주',
-                     '공매도과열', '이상급등', 'KRX300', 'KOSPI', '매출액',
-                     '영업이익', '경상이익', '당기순이익', 'ROE', '기준년월',
-                     '시가총액', '그룹사코드', '회사신용한도초과', '담보대출가능', '대주가능'
-                     ]
-
-    df2 = pd.read_fwf(tmp_fil2, widths=field_specs, names=part2_columns)
+                      names=['단축코드', '표준코드', name_column], encoding='cp949')
+    df2 = pd.read_fwf(tmp_fil2, widths=[width for _, width, _ in fields],
+                      names=[column for column, _, _ in fields])
 
     df = pd.merge(df1, df2, how='outer', left_index=True, right_index=True)
 
-    # clean temporary file and dataframe
-    del (df1)
-    del (df2)
     os.remove(tmp_fil1)
     os.remove(tmp_fil2)
 
-    print("Done")
-
     return df
 
 
-def get_kosdaq_master_dataframe(base_dir):
-    file_name = base_dir + "/kosdaq_code.mst"
-    tmp_fil1 = base_dir + "/kosdaq_code_part1.tmp"
-    tmp_fil2 = base_dir + "/kosdaq_code_part2.tmp"
+def benchmark(base_dir=base_dir, repeat=5):
+    """기존 방식(임시 파일 + read_fwf) 대비 메모리 단일 패스 파서의 파싱 시간 비교"""
+    import timeit
 
-    wf1 = open(tmp_fil1, mode="w", encoding="cp949", errors="ignore")
-    wf2 = open(tmp_fil2, mode="w", encoding="cp949", errors="ignore")
+    for market in MASTERS:
+        old = _get_master_dataframe_fwf(base_dir, market)
+        new = get_master_dataframe(base_dir, market)
+        assert old.shape == new.shape and list(old.columns) == list(new.columns)
+        assert (old['단축코드'].astype(str) == new['단축코드']).all()
 
-    with open(file_name, mode="r", encoding="cp949", errors="ignore") as f:
-        for row in f:
-            rf1 = row[0:len(row) - 222]
-            rf1_1 = rf1[0:9].rstrip()
-            rf1_2 = rf1[9:21].rstrip()
-            rf1_3 = rf1[21:].strip()
-            wf1.write(rf1_1 + ',' + rf1_2 + ',' + rf1_3 + '\n')
-            rf2 = row[-222:]
-            wf2.write(rf2)
-
-    wf1.close()
-    wf2.close()
-
-    part1_columns = ['단축코드', '표준코드', '한글종목명']
-    df1 = pd.read_csv(tmp_fil1, header=None,
-                      names=part1_columns, encoding='cp949')
-
-    field_specs = [2, 1,
-                   4, 4, 4, 1, 1,
-                   1, 1, 1, 1, 1,
-                   1, 1, 1, 1, 1,
-                   1, 1, 1, 1, 1,
-                   1, 1, 1, 1, 9,
-                   5, 5, 1, 1, 1,
-                   2, 1, 1, 1, 2,
-                   2, 2, 3, 1, 3,
-                   12, 12, 8, 15, 21,
-                   2, 7, 1, 1, 1,
-                   1, 9, 9, 9, 5,
-                   9, 8, 9, 3, 1,
-                   1, 1
-                   ]
-
-    part2_columns = ['증권그룹구분코드', '시가총액 규모 구분 코드 유가',
-                     '지수업종 대분류 코드', '지수 업종 중분류 코드', '지수업종 소분류 코드', '벤처기업 여부 (Y/N)',
-                     '저유동성종목 여부', 'KRX 종목 여부', 'ETP 상품구분코드', 'KRX100 종목 여부 (Y/N)',
-                     'KRX 자동차 여부', 'KRX 반도체 여부', 'KRX 바이오 여부', 'KRX 은행 여부', '기업인수목적회사여부',
-                     'KRX 에너지 화학 여부', 'KRX 철강 여부', '단기과열종목구분코드', 'KRX 미디어 통신 여부',
-                     'KRX 건설 여부', '(코스닥)투자주의환기종목여부', 'KRX 증권 구분', 'KRX 선박 구분',
-                     'KRX섹터지수 보험여부', 'KRX섹터지수 운송여부', 'KOSDAQ150지수여부 (Y,N)', '주식 기준가',
-                     '정규 시장 매매 수량 단위', '시간외 시장 매매 수량 단위', '거래정지 여부', '정리매매 여부',
-                     '관리 종목 여부', '시장 경고 구분 코드', '시장 경고위험 예고 여부', '불성실 공시 여부',
-                     '우회 상장 여부', '락구분 코드', '액면가 변경 구분 코드', '증자 구분 코드', '증거금 비율',
-                     '신용주문 가능 여부', '신용기간', '전일 거래량', '주식 액면가', '주식 상장 일자', '상장 주수(천)',
-                     '자본금', '결산 월', '공모 가격', '우선주 구분 코드', '공매도과열종목여부', '이상급등종목여부',
-                     'KRX300 종목 여부 (Y/N)', '매출액', '영업이익', '경상이익', '단기순이익', 'ROE(자기자본이익률)',
-                     '기준년월', '전일기준 시가총액 (억)', '그룹사 코드', '회사신용한도초과여부', '담보대출가능여부', '대주가능여부'
-                     ]
-
-    df2 = pd.read_fwf(tmp_fil2, widths=field_specs, names=part2_columns)
-
-    df = pd.merge(df1, df2, how='outer', left_index=True, right_index=True)
-
-    # clean temporary file and dataframe
-    del (df1)
-    del (df2)
-    os.remove(tmp_fil1)
-    os.remove(tmp_fil2)
-
-    print("Done")
-
-    return df
+        t_old = min(timeit.repeat(lambda: _get_master_dataframe_fwf(base_dir, market), number=1, repeat=repeat))
+        t_new = min(timeit.repeat(lambda: get_master_dataframe(base_dir, market), number=1, repeat=repeat))
+        print(f"{market:7s} rows={len(new):5d}  read_fwf={t_old * 1000:8.1f}ms  "
+              f"single-pass={t_new * 1000:7.1f}ms  x{t_old / t_new:.1f}")
 
 
 if __name__ == "__main__":
@@ -204,4 +245,4 @@ if __name__ == "__main__":
 
     kospi_df = get_kospi_master_dataframe(base_dir)
     kosdaq_df = get_kosdaq_master_dataframe(base_dir)
-    pass
+    benchmark(base_dir)
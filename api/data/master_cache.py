@@ -0,0 +1,188 @@
+# 파싱한 종목 마스터의 바이너리 스냅샷 캐시
+# 모든 컬럼을 구조화 배열 .npy 파일 하나로 저장해 두고 np.load(mmap_mode="r") 로 읽으므로,
+# 워커 프로세스마다 .mst 를 다시 파싱하지 않고 OS 페이지 캐시를 공유합니다.
+#
+# 디렉토리 구조 (KIS_MASTER_CACHE_DIR, 기본 api/data/.master_cache):
+#     kospi.json                        현재 스냅샷 포인터 (원본 mtime/크기/sha256, 스냅샷 디렉토리)
+#     kospi-<sha256 앞 16자리>-v1/       meta.json + data.npy (컬럼마다 필드 하나인 구조화 배열)
+#
+# 원본의 mtime 과 크기가 포인터와 같으면 해시 계산 없이 바로 스냅샷을 사용하고,
+# 다르면 해시를 비교해 내용이 바뀐 경우에만 다시 파싱합니다.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from api.data.kis_code import MASTERS, get_master_dataframe
+
+SNAPSHOT_VERSION = 1  # 스냅샷 형식이나 마스터 스키마가 바뀌면 올려서 기존 스냅샷을 무효화
+
+MASTER_CACHE_DIR = os.getenv("KIS_MASTER_CACHE_DIR", os.path.join("api", "data", ".master_cache"))
+
+
+def _fileHash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _atomicWriteJson(path, data):
+    fd, tmp = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(path) or ".")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _readJson(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _encodeColumn(series):
+    """Series → (kind, {파일 접미사: ndarray})"""
+    dtype = series.dtype
+    if isinstance(dtype, pd.BooleanDtype) or isinstance(dtype, pd.Int64Dtype):
+        kind = "boolean" if isinstance(dtype, pd.BooleanDtype) else "Int64"
+        fill = False if kind == "boolean" else 0
+        return kind, {"": series.to_numpy(dtype=dtype.numpy_dtype, na_value=fill),
+                      ".mask": series.isna().to_numpy()}
+    if dtype.kind in "biufM":
+        return "numpy", {"": series.to_numpy()}
+    return "str", {"": series.to_numpy(dtype=str)}
+
+
+def _decodeColumn(kind, arrays):
+    values = arrays[""]
+    if kind == "boolean":
+        return pd.arrays.BooleanArray(values, arrays[".mask"])
+    if kind == "Int64":
+        return pd.arrays.IntegerArray(values, arrays[".mask"])
+    if kind == "str":
+        return pd.array(values, dtype="str")
+    return values
+
+
+def write_snapshot(df, path):
+    """DataFrame 을 스냅샷 디렉토리로 저장합니다. (임시 디렉토리에 쓴 뒤 rename)"""
+    parent = os.path.dirname(path) or "."
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".tmp.", dir=parent)
+    try:
+        columns, fields = [], {}
+        for i, column in enumerate(df.columns):
+            kind, arrays = _encodeColumn(df[column])
+            for suffix, array in arrays.items():
+                fields[f"c{i}{suffix}"] = array
+            columns.append({"name": column, "kind": kind, "parts": list(arrays)})
+
+        records = np.empty(len(df), dtype=[(name, array.dtype) for name, array in fields.items()])
+        for name, array in fields.items():
+            records[name] = array
+        np.save(os.path.join(tmp, "data.npy"), records, allow_pickle=False)
+        _atomicWriteJson(os.path.join(tmp, "meta.json"), {"version": SNAPSHOT_VERSION, "columns": columns})
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            # 다른 프로세스가 같은 스냅샷을 먼저 만든 경우
+            if not os.path.exists(os.path.join(path, "meta.json")):
+                raise
+            shutil.rmtree(tmp, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def read_snapshot(path, mmap=True):
+    """스냅샷 디렉토리를 DataFrame 으로 읽습니다. (문자열 외 컬럼은 메모리 맵의 view, 복사 없음)"""
+    meta = _readJson(os.path.join(path, "meta.json"))
+    if not meta or meta.get("version") != SNAPSHOT_VERSION:
+        return None
+    records = np.load(os.path.join(path, "data.npy"), mmap_mode="r" if mmap else None, allow_pickle=False)
+    if isinstance(records, np.memmap):
+        records = records.view(np.ndarray)  # 같은 메모리를 가리키는 일반 ndarray
+    data = {}
+    for i, column in enumerate(meta["columns"]):
+        arrays = {suffix: records[f"c{i}{suffix}"] for suffix in column["parts"]}
+        data[column["name"]] = _decodeColumn(column["kind"], arrays)
+    return pd.DataFrame(data, copy=False)
+
+
+def load_master(base_dir, market, cache_dir=None):
+    """
+    kospi/kosdaq 마스터를 스냅샷에서 읽고, 없거나 원본이 바뀌었으면 파싱해서 스냅샷을 만듭니다.
+
+    Args:
+        base_dir (str): .mst 파일이 있는 디렉토리
+        market (str): 'kospi' | 'kosdaq'
+        cache_dir (str): 스냅샷 디렉토리 (기본 KIS_MASTER_CACHE_DIR, 빈 문자열이면 캐시 없이 파싱)
+
+    Returns:
+        pd.DataFrame: kis_code.get_master_dataframe 과 같은 컬럼/타입
+    """
+    cache_dir = MASTER_CACHE_DIR if cache_dir is None else cache_dir
+    if not cache_dir:
+        return get_master_dataframe(base_dir, market)
+
+    source = os.path.join(base_dir, MASTERS[market][0])
+    st = os.stat(source)
+    pointer_path = os.path.join(cache_dir, f"{market}.json")
+    pointer = _readJson(pointer_path) or {}
+
+    if pointer.get("mtime_ns") != st.st_mtime_ns or pointer.get("size") != st.st_size:
+        digest = _fileHash(source)
+        pointer = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest,
+                   "snapshot": f"{market}-{digest[:16]}-v{SNAPSHOT_VERSION}"}
+        os.makedirs(cache_dir, exist_ok=True)
+        _atomicWriteJson(pointer_path, pointer)
+
+    snapshot = os.path.join(cache_dir, pointer["snapshot"])
+    df = read_snapshot(snapshot) if os.path.isdir(snapshot) else None
+    if df is None:
+        df = get_master_dataframe(base_dir, market)
+        write_snapshot(df, snapshot)
+    return df
+
+
+def prune_snapshots(market, cache_dir=None):
+    """현재 포인터가 가리키지 않는 market 의 이전 스냅샷을 지웁니다. (이미 메모리 맵으로 연 쪽은 계속 유효)"""
+    cache_dir = MASTER_CACHE_DIR if cache_dir is None else cache_dir
+    pointer = _readJson(os.path.join(cache_dir, f"{market}.json")) if cache_dir else None
+    if not pointer:
+        return
+    for name in os.listdir(cache_dir):
+        if name.startswith(f"{market}-") and name != pointer["snapshot"]:
+            shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+
+
+def benchmark(base_dir="api/data", repeat=20):
+    """.mst 파싱 대비 스냅샷(mmap) 로드 시간 비교"""
+    import timeit
+
+    cache_dir = tempfile.mkdtemp(prefix="kis_master_bench.")
+    try:
+        for market in MASTERS:
+            parsed = get_master_dataframe(base_dir, market)
+            load_master(base_dir, market, cache_dir)  # 스냅샷 생성
+            cached = load_master(base_dir, market, cache_dir)
+            pd.testing.assert_frame_equal(parsed, cached)
+
+            t_parse = min(timeit.repeat(lambda: get_master_dataframe(base_dir, market), number=1, repeat=repeat))
+            t_cache = min(timeit.repeat(lambda: load_master(base_dir, market, cache_dir), number=1, repeat=repeat))
+            print(f"{market:7s} rows={len(parsed):5d}  parse={t_parse * 1000:7.1f}ms  "
+                  f"snapshot={t_cache * 1000:6.1f}ms  x{t_parse / t_cache:.1f}")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,200 @@
+# 종목 마스터 정기 갱신
+# 임시 디렉토리에 내려받아 파싱까지 끝낸 뒤에만 기존 파일을 교체하고, 검색 인덱스는 새로 만든 것으로
+# 참조만 바꿔 끼우므로(set_symbol_index) 조회하는 쪽은 락을 기다리거나 만들다 만 인덱스를 보지 않습니다.
+#
+# 사용 예:
+#     diffs = MasterRefresher().refresh()
+#     diffs["kospi"].listed      # 신규 상장 종목코드
+#     start_master_refresh("08:30")   # 개장일 08:30 마다 백그라운드 갱신
+
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple
+
+import pandas as pd
+
+from api.data.kis_code import MASTERS, download_master, get_master_dataframe
+from api.data.master_cache import load_master, prune_snapshots
+from api.data.symbol_index import load_symbol_index, set_symbol_index
+from api.data.trading_calendar import get_trading_calendar
+
+try:
+    import fcntl
+except ImportError:  # Windows 에서는 프로세스 간 잠금 없이 프로세스 내 락만 사용
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 시장별 상태 컬럼: (거래정지 여부, 경고/관리 상태 컬럼들)
+STATUS_COLUMNS = {
+    'kospi': ('거래정지', ['관리종목', '시장경고', '경고예고', '불성실공시', '단기과열']),
+    'kosdaq': ('거래정지 여부', ['관리 종목 여부', '시장 경고 구분 코드', '시장 경고위험 예고 여부',
+                             '불성실 공시 여부', '단기과열종목구분코드', '(코스닥)투자주의환기종목여부']),
+}
+
+
+class MasterDiff(NamedTuple):
+    listed: List[str]  # 신규 상장
+    delisted: List[str]  # 상장 폐지 (마스터에서 빠진 종목)
+    halted: List[str]  # 거래정지 지정
+    resumed: List[str]  # 거래정지 해제
+    warning_changed: List[str]  # 관리종목/시장경고/불성실공시 등 상태 변경
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return self._asdict()
+
+    def __bool__(self) -> bool:
+        return any(self)
+
+
+def diff_master(old: pd.DataFrame, new: pd.DataFrame, market: str) -> MasterDiff:
+    """기존 마스터와 새 마스터를 단축코드 기준으로 비교합니다."""
+    halt_col, warning_cols = STATUS_COLUMNS[market]
+    old = old.drop_duplicates('단축코드').set_index('단축코드')
+    new = new.drop_duplicates('단축코드').set_index('단축코드')
+
+    listed = new.index.difference(old.index)
+    delisted = old.index.difference(new.index)
+    common = new.index.intersection(old.index)
+
+    old_halt = old.loc[common, halt_col].fillna(False).astype(bool)
+    new_halt = new.loc[common, halt_col].fillna(False).astype(bool)
+    halted = common[(~old_halt & new_halt).to_numpy()]
+    resumed = common[(old_halt & ~new_halt).to_numpy()]
+
+    changed = pd.Series(False, index=common)
+    for column in warning_cols:
+        before = old.loc[common, column].astype(object).where(old.loc[common, column].notna(), None)
+        after = new.loc[common, column].astype(object).where(new.loc[common, column].notna(), None)
+        changed |= before != after
+
+    return MasterDiff(listed.tolist(), delisted.tolist(), halted.tolist(), resumed.tolist(),
+                      common[changed.to_numpy()].tolist())
+
+
+class MasterRefresher:
+    """
+    마스터 파일 다운로드 → 파싱 → 비교 → 파일 교체 → 검색 인덱스 교체를 수행합니다.
+
+    Args:
+        base_dir (str): 마스터 파일 디렉토리
+        base_url (str): 다운로드 주소 (기본 KIS_MASTER_URL, 테스트 시 로컬 서버나 file:// 경로)
+        cache_dir (str): 스냅샷 캐시 디렉토리 (기본 KIS_MASTER_CACHE_DIR)
+        min_interval (float): 다른 워커가 이 시간(초) 안에 이미 갱신했으면 다운로드 없이 인덱스만 다시 읽음
+    """
+
+    def __init__(self, base_dir="api/data", base_url=None, cache_dir=None, min_interval=3600.0):
+        self.base_dir = base_dir
+        self.base_url = base_url
+        self.cache_dir = cache_dir
+        self.min_interval = min_interval
+        self.last_diffs: Dict[str, MasterDiff] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @contextmanager
+    def _refreshLock(self):
+        # 같은 디렉토리를 갱신하는 워커 프로세스가 동시에 다운로드/교체하지 않도록 파일 잠금
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.base_dir, exist_ok=True)
+            with open(os.path.join(self.base_dir, ".master_refresh.lock"), "a+b") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _recentlyRefreshed(self):
+        now = datetime.now().timestamp()
+        for file_name, _, _ in MASTERS.values():
+            path = os.path.join(self.base_dir, file_name)
+            if not os.path.exists(path) or now - os.path.getmtime(path) >= self.min_interval:
+                return False
+        return True
+
+    def refresh(self, force=False) -> Dict[str, MasterDiff]:
+        """
+        마스터를 갱신하고 시장별 변경 내역을 반환합니다.
+        다운로드나 파싱에 실패하면 기존 파일과 인덱스를 그대로 두고 예외를 올립니다.
+        """
+        with self._refreshLock():
+            if not force and self._recentlyRefreshed():
+                # 다른 워커가 방금 갱신한 파일로 이 프로세스의 인덱스만 교체
+                set_symbol_index(load_symbol_index(self.base_dir, self.cache_dir))
+                return {}
+
+            diffs = {}
+            with tempfile.TemporaryDirectory(prefix=".master_refresh.", dir=self.base_dir) as tmp:
+                new = {}
+                for market in MASTERS:
+                    download_master(market, tmp, self.base_url)
+                    new[market] = get_master_dataframe(tmp, market)
+
+                for market, df in new.items():
+                    file_name, _, _ = MASTERS[market]
+                    if os.path.exists(os.path.join(self.base_dir, file_name)):
+                        old = load_master(self.base_dir, market, self.cache_dir)
+                    else:
+                        old = df.iloc[0:0]
+                    diffs[market] = diff_master(old, df, market)
+
+                # 모두 파싱에 성공한 뒤에만 같은 파일시스템 안에서 rename 으로 교체
+                for market in MASTERS:
+                    file_name, _, _ = MASTERS[market]
+                    os.replace(os.path.join(tmp, file_name), os.path.join(self.base_dir, file_name))
+
+            set_symbol_index(load_symbol_index(self.base_dir, self.cache_dir))
+            for market in MASTERS:
+                prune_snapshots(market, self.cache_dir)
+
+        self.last_diffs = diffs
+        for market, diff in diffs.items():
+            logger.info("%s master refreshed: %s", market, {k: len(v) for k, v in diff.to_dict().items()})
+        return diffs
+
+    def _run(self, at):
+        hour, minute = (int(x) for x in at.split(":"))
+        while True:
+            now = datetime.now()
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            if self._stop.wait((next_run - now).total_seconds()):
+                return
+            if not get_trading_calendar().is_open(next_run.date()):
+                logger.info("Skipping master refresh on non-trading day %s", next_run.date())
+                continue
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Master refresh failed")
+
+    def start(self, at="08:30"):
+        """개장일마다 at(HH:MM) 에 갱신하는 백그라운드 스레드를 시작합니다."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(at,), name="kis-master-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+
+_refresher = None
+
+
+def start_master_refresh(at, base_dir="api/data"):
+    """프로세스 전역 MasterRefresher 를 만들어 개장일마다 at(HH:MM) 에 갱신을 시작합니다."""
+    global _refresher
+    if _refresher is None:
+        _refresher = MasterRefresher(base_dir).start(at)
+    return _refresher
@@ -0,0 +1,227 @@
+# 당일 분봉 기록기
+# 주식당일분봉조회(inquire_time_itemchartprice)는 당일 분봉만, 한 번에 30개씩만 주므로 저녁이 되면 장중 분봉을 다시 받을 수 없습니다.
+# 관심 종목마다 fid_input_hour_1 을 30분씩 거슬러 올라가며 장 시작까지 채우고, 이후에는 주기적으로 최신 30개만 받아
+# 이미 저장한 분까지 이어 붙여 봉 저장소(bar_store, period='1m', 원주가)에 저장합니다.
+#
+# 사용 예:
+#     recorder = MinuteBarRecorder(["005930", "000660"])
+#     recorder.sync_all()                 # 지금까지의 당일 분봉 채우기
+#     recorder.start()                    # 장중 60초마다 새 분봉 기록
+#     get_bar_store().read("005930", "20250102", "20250102", period="1m", adjusted=False)
+#
+# 가장 최근 분봉은 아직 진행 중이므로 저장했다가 다음 조회 때 덮어씁니다. 분봉별 거래대금은 누적 거래대금의 차이이며,
+# 조회 범위의 첫 분봉(이미 저장된 분)은 기존 값을 유지합니다.
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from api.data.bar_store import BarFetchError, BarStore, get_bar_store
+from api.data.trading_calendar import get_trading_calendar
+
+logger = logging.getLogger(__name__)
+
+MINUTE_PERIOD = "1m"
+MINUTE_MAX_BARS = 30  # inquire_time_itemchartprice 한 번에 받는 최대 분봉 수
+KRX_SESSION = ("090000", "153000")  # 정규장 첫 분봉 / 마지막 분봉 시각
+
+
+def _minute_fetch(code: str, hour: str, market: str) -> pd.DataFrame:
+    # 기본 조회 함수: output2 (hour 이전 최신 분봉부터 최대 30개)
+    # inquire_time_itemchartprice 는 실패해도 빈 DataFrame 을 돌려주므로 같은 요청을 직접 보내 실패를 구분
+    import api.functions.kis_auth as ka
+
+    res = ka._url_fetch("/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice", "FHKST03010200", "", {
+        "FID_COND_MRKT_DIV_CODE": market,
+        "FID_INPUT_ISCD": code,
+        "FID_INPUT_HOUR_1": hour,
+        "FID_PW_DATA_INCU_YN": "Y",
+        "FID_ETC_CLS_CODE": "",
+    })
+    if not res.isOK():
+        raise BarFetchError(f"{code} {hour} minute bars: {res.getErrorCode()} {res.getErrorMessage()}")
+    return res.frame("output2")
+
+
+def _toInt(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_minute_output(df: pd.DataFrame, day: str = None) -> List[dict]:
+    """output2 → 시각 오름차순 분봉 목록 (dt, open, high, low, close, volume, cum_amount), day 가 있으면 그 날짜만"""
+    if df is None or df.empty or "stck_cntg_hour" not in df.columns:
+        return []
+    bars = {}
+    for rec in df.to_dict("records"):
+        bsop_date = str(rec.get("stck_bsop_date") or "").strip()
+        hour = str(rec.get("stck_cntg_hour") or "").strip()
+        if len(bsop_date) != 8 or len(hour) != 6 or (day and bsop_date != day):
+            continue
+        bars[bsop_date + hour] = {
+            "dt": bsop_date + hour, "open": _toInt(rec.get("stck_oprc")), "high": _toInt(rec.get("stck_hgpr")),
+            "low": _toInt(rec.get("stck_lwpr")), "close": _toInt(rec.get("stck_prpr")),
+            "volume": _toInt(rec.get("cntg_vol")), "cum_amount": _toInt(rec.get("acml_tr_pbmn")),
+        }
+    return [bars[dt] for dt in sorted(bars)]
+
+
+def to_bar_rows(bars: List[dict], session_start: str) -> List[tuple]:
+    """
+    이어진 분봉 목록 → bar_store 행. 거래대금은 누적 거래대금의 차이로 계산하고,
+    앞 분봉을 모르는 첫 분봉은 장 시작 분봉이면 누적값 그대로, 아니면 None(기존 값 유지)
+    """
+    rows = []
+    prev = None
+    for bar in bars:
+        if prev is not None and bar["cum_amount"] is not None and prev["cum_amount"] is not None:
+            amount = bar["cum_amount"] - prev["cum_amount"]
+        elif prev is None and bar["dt"][8:] <= session_start:
+            amount = bar["cum_amount"]
+        else:
+            amount = None
+        rows.append((bar["dt"], bar["open"], bar["high"], bar["low"], bar["close"], bar["volume"], amount))
+        prev = bar
+    return rows
+
+
+class MinuteBarRecorder:
+    """
+    관심 종목의 당일 분봉을 봉 저장소에 기록합니다.
+
+    Args:
+        codes (Iterable[str]): 관심 종목코드
+        store (BarStore): 저장소 (기본 get_bar_store())
+        market (str): 조건 시장 분류 코드 (J: KRX, NX: NXT, UN: 통합)
+        interval (float): start() 후 갱신 주기(초)
+        fetch (Callable): (code, hour, market) → output2 DataFrame, 기본 inquire_time_itemchartprice, 조회 실패 시 BarFetchError
+        session (tuple): (첫 분봉 시각, 마지막 분봉 시각) HHMMSS
+
+    Attributes:
+        api_calls (int): 지금까지 보낸 분봉 조회 요청 수
+    """
+
+    def __init__(self, codes: Iterable[str], store: BarStore = None, market: str = "J", interval: float = 60.0,
+                 fetch: Callable = None, session=KRX_SESSION):
+        self.codes = list(dict.fromkeys(codes))
+        self.store = store
+        self.market = market
+        self.interval = interval
+        self.fetch = fetch or _minute_fetch
+        self.session = session
+        self.api_calls = 0
+        self._incomplete: Dict[str, tuple] = {}  # 종목코드 → (일자, 가장 이른 분봉) 장 시작까지 채우지 못한 당일 분봉
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _store(self) -> BarStore:
+        return self.store or get_bar_store()
+
+    def sync(self, code: str, now: datetime = None) -> int:
+        """
+        현재 시각부터 fid_input_hour_1 을 거슬러 올라가며, 이미 저장한 마지막 분봉(없으면 장 시작)까지 받아 저장합니다.
+
+        중간에 조회가 실패하면 아무것도 저장하지 않아 다음 호출에서 같은 범위를 다시 받습니다. (이후 분봉만 저장하면
+        다음 호출이 그 분봉에서 멈춰 앞쪽 분봉을 영영 받지 못하므로) 장 시작 전에 짧은 페이지로 끝나면 받은 분봉은 저장하되
+        다음 호출에서 장 시작까지 다시 거슬러 올라가고, 두 번 연속 같은 분봉에서 끝나면 그 앞은 없는 것으로 봅니다.
+
+        Returns:
+            int: 저장한 분봉 수
+        """
+        now = now or datetime.now()
+        day = now.strftime("%Y%m%d")
+        start, end = self.session
+        cursor = min(now.strftime("%H%M%S"), end)
+        if cursor < start:
+            return 0
+
+        store = self._store()
+        last = store.latest(code, MINUTE_PERIOD, False, self.market, before=day + "999999")
+        last_dt = last[0] if last is not None and last[0].startswith(day) else None
+        incomplete = self._incomplete.get(code)
+        if incomplete is not None and incomplete[0] == day:
+            last_dt = None  # 지난번에 장 시작까지 채우지 못했으면 처음부터 다시
+
+        bars: Dict[str, dict] = {}
+        while True:
+            self.api_calls += 1
+            try:
+                output = self.fetch(code, cursor, self.market)
+            except BarFetchError as e:
+                logger.warning("Minute bar fetch failed, retrying %s on the next poll: %s", code, e)
+                return 0
+            page = [b for b in parse_minute_output(output, day) if b["dt"][8:] <= cursor]
+            if page:
+                for bar in page:
+                    bars[bar["dt"]] = bar
+                oldest = page[0]["dt"]
+                if (last_dt and oldest <= last_dt) or oldest[8:] <= start:
+                    self._incomplete.pop(code, None)
+                    break
+                if len(page) == MINUTE_MAX_BARS:
+                    cursor = (datetime.strptime(oldest, "%Y%m%d%H%M%S") - timedelta(minutes=1)).strftime("%H%M%S")
+                    continue
+            # 장 시작(또는 저장한 분봉) 전에 끝남: 같은 곳에서 두 번 끝나면 그 앞은 없는 것으로 봄
+            oldest = min(bars) if bars else None
+            if incomplete is not None and incomplete == (day, oldest):
+                self._incomplete.pop(code, None)
+            else:
+                self._incomplete[code] = (day, oldest)
+            break
+
+        rows = to_bar_rows([bars[dt] for dt in sorted(bars)], start)
+        store.write_bars(code, rows, MINUTE_PERIOD, False, self.market)
+        return len(rows)
+
+    def sync_all(self, now: datetime = None) -> Dict[str, int]:
+        """관심 종목 모두 sync (종목별 실패는 기록만 하고 계속)"""
+        result = {}
+        for code in self.codes:
+            try:
+                result[code] = self.sync(code, now)
+            except Exception:
+                logger.exception("Minute bar sync failed: %s", code)
+        return result
+
+    def _active(self, now: datetime) -> bool:
+        if not get_trading_calendar().is_open(now.date()):
+            return False
+        start, end = self.session
+        # 마지막 분봉이 확정되도록 장 마감 후 한 주기 더 기록
+        last = (datetime.strptime(end, "%H%M%S") + timedelta(seconds=self.interval)).strftime("%H%M%S")
+        return start <= now.strftime("%H%M%S") <= max(end, last)
+
+    def _run(self):
+        while not self._stop.is_set():
+            now = datetime.now()
+            if self._active(now):
+                self.sync_all(now)
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self):
+        """장중 interval 초마다 sync_all 하는 백그라운드 스레드를 시작합니다."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="kis-minute-recorder", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+
+_recorder: Optional[MinuteBarRecorder] = None
+
+
+def start_minute_recorder(codes: Iterable[str], interval: float = 60.0) -> MinuteBarRecorder:
+    """프로세스 전역 MinuteBarRecorder 를 만들어 장중 기록을 시작합니다."""
+    global _recorder
+    if _recorder is None:
+        _recorder = MinuteBarRecorder(codes, interval=interval).start()
+    return _recorder
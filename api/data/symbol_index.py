@@ -0,0 +1,209 @@
+# 종목 마스터(kospi_code.mst, kosdaq_code.mst)로 만든 종목명/종목코드 검색 인덱스
+# 마스터를 한 번만 읽어 해시맵과 bigram 색인을 만들어 두고, 주문마다 DataFrame 을 훑지 않고 바로 찾습니다.
+#
+# 사용 예:
+#     index = get_symbol_index()
+#     index.lookup("삼성전자")        # '005930'
+#     index.search("삼성", limit=5)   # 순위가 매겨진 SymbolMatch 목록
+#     index.name("005930")            # '삼성전자'
+
+import heapq
+import os
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+# 검색 순위 (같은 순위에서는 시가총액이 큰 종목 먼저)
+EXACT, CODE, NORMALIZED, PREFIX, SUBSTRING = 100, 95, 90, 70, 50
+
+_STRIP = re.compile(r"[\s\-_.,·&()\[\]]+")
+
+
+def normalize_name(name: str) -> str:
+    """비교용 종목명: 전각/반각 통일(NFKC), 대소문자 무시, 공백과 구분기호 제거"""
+    return _STRIP.sub("", unicodedata.normalize("NFKC", name or "")).casefold()
+
+
+def _bigrams(text: str) -> Set[str]:
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class Symbol(NamedTuple):
+    code: str  # 단축코드
+    name: str  # 한글 종목명
+    market: str  # KOSPI / KOSDAQ
+    std_code: str = ""  # 표준코드 (ISIN)
+    market_cap: float = 0.0  # 전일기준 시가총액 (억)
+
+
+class SymbolMatch(NamedTuple):
+    code: str
+    name: str
+    market: str
+    score: int
+
+
+class SymbolIndex:
+    """
+    종목명/종목코드 검색 인덱스.
+
+    - 종목명, 정규화된 종목명, 단축/표준코드: 해시맵으로 바로 찾음
+    - 부분 일치: 정규화된 종목명의 bigram(한 글자 검색은 글자) 색인의 교집합으로 후보를 좁힌 뒤 확인
+    """
+
+    def __init__(self, symbols: Iterable[Symbol]):
+        self.symbols: List[Symbol] = list(symbols)
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_norm: Dict[str, List[int]] = {}
+        self._by_code: Dict[str, int] = {}
+        self._grams: Optional[Dict[str, Set[int]]] = None
+        self._grams_lock = threading.Lock()
+        self._norms: List[str] = []
+
+        for i, symbol in enumerate(self.symbols):
+            norm = normalize_name(symbol.name)
+            self._norms.append(norm)
+            self._by_name.setdefault(symbol.name, []).append(i)
+            self._by_norm.setdefault(norm, []).append(i)
+            self._by_code.setdefault(symbol.code, i)
+            if symbol.std_code:
+                self._by_code.setdefault(symbol.std_code, i)
+
+    def _gramIndex(self) -> Dict[str, Set[int]]:
+        # 부분 일치 색인은 처음 필요할 때 만듦 (완전 일치/코드 조회만 하는 경우 생성 비용 없음)
+        if self._grams is None:
+            with self._grams_lock:
+                if self._grams is None:
+                    grams: Dict[str, Set[int]] = {}
+                    for i, norm in enumerate(self._norms):
+                        for gram in _bigrams(norm) | set(norm):
+                            grams.setdefault(gram, set()).add(i)
+                    self._grams = grams
+        return self._grams
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def get(self, code: str) -> Optional[Symbol]:
+        """단축코드(또는 표준코드)로 종목 정보 조회"""
+        i = self._by_code.get((code or "").strip().upper())
+        return None if i is None else self.symbols[i]
+
+    def name(self, code: str) -> Optional[str]:
+        """종목코드 → 종목명"""
+        symbol = self.get(code)
+        return None if symbol is None else symbol.name
+
+    def _candidates(self, norm: str) -> Set[int]:
+        grams = _bigrams(norm) if len(norm) >= 2 else {norm}
+        index = self._gramIndex()
+        postings = sorted((index.get(g, set()) for g in grams), key=len)
+        if not postings or not postings[0]:
+            return set()
+        return set(postings[0]).intersection(*postings[1:])
+
+    def search(self, query: str, limit: int = 10) -> List[SymbolMatch]:
+        """
+        종목명/종목코드로 후보 종목을 순위대로 반환합니다.
+
+        Args:
+            query (str): 종목명(일부), 단축코드 또는 표준코드
+            limit (int): 최대 후보 수
+
+        Returns:
+            List[SymbolMatch]: 완전 일치 > 코드 > 정규화 일치 > 앞부분 일치 > 부분 일치 순,
+            같은 순위에서는 시가총액이 큰 종목 먼저
+        """
+        query = (query or "").strip()
+        norm = normalize_name(query)
+        if not norm:
+            return []
+
+        scores: Dict[int, int] = {}
+        for i in self._by_name.get(query, ()):
+            scores[i] = EXACT
+        code = self._by_code.get(query.upper())
+        if code is not None:
+            scores.setdefault(code, CODE)
+        for i in self._by_norm.get(norm, ()):
+            scores.setdefault(i, NORMALIZED)
+        for i in self._candidates(norm):
+            if i in scores:
+                continue
+            target = self._norms[i]
+            if target.startswith(norm):
+                scores[i] = PREFIX
+            elif norm in target:
+                scores[i] = SUBSTRING
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda x: (
+            -x[1], -self.symbols[x[0]].market_cap, len(self._norms[x[0]])))
+        return [SymbolMatch(self.symbols[i].code, self.symbols[i].name, self.symbols[i].market, score)
+                for i, score in ranked]
+
+    def lookup(self, query: str) -> Optional[str]:
+        """가장 순위가 높은 종목의 단축코드 (없으면 None)"""
+        exact = self._by_name.get((query or "").strip())
+        if exact:
+            return self.symbols[max(exact, key=lambda i: self.symbols[i].market_cap)].code
+        matches = self.search(query, limit=1)
+        return matches[0].code if matches else None
+
+
+def symbols_from_masters(kospi_df=None, kosdaq_df=None) -> List[Symbol]:
+    """kis_code 의 마스터 DataFrame 에서 Symbol 목록을 만듭니다."""
+    symbols = []
+    for df, market, name_col, cap_col in (
+        (kospi_df, "KOSPI", "한글명", "시가총액"),
+        (kosdaq_df, "KOSDAQ", "한글종목명", "전일기준 시가총액 (억)"),
+    ):
+        if df is None or df.empty:
+            continue
+        caps = df[cap_col].tolist() if cap_col in df.columns else [0] * len(df)
+        std_codes = df["표준코드"].tolist() if "표준코드" in df.columns else [""] * len(df)
+        for code, std_code, name, cap in zip(df["단축코드"].tolist(), std_codes, df[name_col].tolist(), caps):
+            if not isinstance(name, str):
+                continue
+            try:
+                cap = float(cap)
+            except (TypeError, ValueError):
+                cap = 0.0
+            symbols.append(Symbol(str(code).strip(), name.strip(), market,
+                                  str(std_code).strip() if isinstance(std_code, str) else "",
+                                  0.0 if cap != cap else cap))
+    return symbols
+
+
+def load_symbol_index(base_dir: str = "api/data", cache_dir: Optional[str] = None) -> SymbolIndex:
+    """base_dir 의 마스터 파일로 인덱스를 만듭니다. (파싱 결과는 스냅샷 캐시 사용, 파일이 없으면 빈 인덱스)"""
+    from api.data.master_cache import load_master
+
+    kospi_df = kosdaq_df = None
+    if os.path.exists(os.path.join(base_dir, "kospi_code.mst")):
+        kospi_df = load_master(base_dir, "kospi", cache_dir)
+    if os.path.exists(os.path.join(base_dir, "kosdaq_code.mst")):
+        kosdaq_df = load_master(base_dir, "kosdaq", cache_dir)
+    return SymbolIndex(symbols_from_masters(kospi_df, kosdaq_df))
+
+
+_symbol_index: Optional[SymbolIndex] = None
+_symbol_index_lock = threading.Lock()
+
+
+def get_symbol_index() -> SymbolIndex:
+    """프로세스 전역 인덱스 (처음 호출할 때 한 번만 만듦)"""
+    global _symbol_index
+    if _symbol_index is None:
+        with _symbol_index_lock:
+            if _symbol_index is None:
+                _symbol_index = load_symbol_index()
+    return _symbol_index
+
+
+def set_symbol_index(index: SymbolIndex) -> None:
+    """전역 인덱스를 교체합니다. (참조 한 번의 교체이므로 검색 중인 스레드는 이전 인덱스를 계속 사용)"""
+    global _symbol_index
+    _symbol_index = index
@@ -0,0 +1,319 @@
+# 거래일 캘린더 (국내휴장일조회 chk_holiday 캐시)
+# chk_holiday 는 원장서비스와 연결되어 있어 1일 1회 호출을 권장하므로, 월 단위로 한 번 받은 영업일/거래일/개장일/결제일
+# 여부를 JSON 파일에 저장해 두고 is_open / next_trading_day / trading_days_between 을 메모리에서 바로 답합니다.
+#   - 일자별 여부는 dict (O(1)), 개장일은 정렬된 서수(ordinal) 목록으로 두고 bisect 로 다음 거래일/거래일 수를 계산 (O(log n))
+#   - 지난 달은 다시 받지 않고, 이번 달 이후는 받은 지 KIS_CALENDAR_MAX_AGE 일이 지나면 다시 받음 (임시 휴장일 반영)
+#   - 조회에 실패하면(모의투자 미지원 등) 잠시 동안 다시 시도하지 않고 평일=개장일로 간주
+#
+# 사용 예:
+#     cal = get_trading_calendar()
+#     cal.is_open("20251003")                         # False (개천절)
+#     cal.next_trading_day("20251002")                # date(2025, 10, 10)
+#     cal.trading_days_between("20250101", "20251231")
+
+import bisect
+import calendar as _calendar
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_PATH = os.getenv("KIS_CALENDAR_PATH", os.path.join("api", "data", ".calendar.json"))
+CALENDAR_MAX_AGE = int(os.getenv("KIS_CALENDAR_MAX_AGE", "7"))  # 이번 달 이후 데이터를 다시 받는 주기(일)
+RETRY_INTERVAL = 600.0  # 조회 실패 후 다시 시도하기까지(초)
+
+FLAG_COLUMNS = ["bzdy_yn", "tr_day_yn", "opnd_yn", "sttl_day_yn"]  # 저장 문자열 "YYYY" 의 자리 순서
+_OPEN = FLAG_COLUMNS.index("opnd_yn")
+
+
+def _toDate(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    value = str(value).replace("-", "")
+    if len(value) != 8 or not value.isdigit():
+        raise ValueError(f"Invalid date: {value!r} (expected YYYYMMDD)")
+    return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+
+
+def _fmt(d: date) -> str:
+    return d.strftime("%Y%m%d")
+
+
+def _month(d: date) -> int:
+    return d.year * 100 + d.month
+
+
+def _monthEnd(d: date) -> date:
+    return d.replace(day=_calendar.monthrange(d.year, d.month)[1])
+
+
+def _holiday_fetch(bass_dt: str) -> pd.DataFrame:
+    # 기본 조회 함수: bass_dt 부터 약 3~4주치 output (연속조회 없이 한 페이지)
+    from api.functions.domestic_stock_functions import chk_holiday
+
+    return chk_holiday(bass_dt, max_depth=1)
+
+
+class TradingCalendar:
+    """
+    월 단위로 캐시하는 거래일 캘린더.
+
+    Args:
+        path (str): 저장 파일 (기본 KIS_CALENDAR_PATH, None 이 아닌 빈 문자열이면 저장 안 함)
+        fetch (Callable): bass_dt(YYYYMMDD) → chk_holiday output DataFrame (테스트 시 가짜 함수로 대체)
+        max_age (int): 이번 달 이후 데이터를 다시 받는 주기(일)
+
+    Attributes:
+        api_calls (int): 지금까지 보낸 국내휴장일조회 요청 수
+    """
+
+    def __init__(self, path: str = None, fetch: Callable = None, max_age: int = CALENDAR_MAX_AGE):
+        self.path = CALENDAR_PATH if path is None else path
+        self.fetch = fetch or _holiday_fetch
+        self.max_age = max_age
+        self.api_calls = 0
+        self._lock = threading.Lock()
+        self._days: Dict[int, str] = {}  # 일자 서수 → 여부 문자열 (FLAG_COLUMNS 순서)
+        self._months: Dict[int, int] = {}  # 모두 받은 달 YYYYMM → 받은 날 서수
+        self._open: List[int] = []  # 개장일 서수, 오름차순
+        self._fresh = (0, set())  # (오늘 서수, 오늘 확인을 마친 달) - 질의마다 오래된 달인지 다시 계산하지 않도록
+        self._retry_at = 0.0
+        self._load()
+
+    # ----- 저장/불러오기 -----
+
+    def _load(self):
+        # 파일 형식: {"months": {"YYYYMM": "받은 날 YYYYMMDD"}, "days": {"YYYYMMDD": "YYNY"}}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            days = {_toDate(dt).toordinal(): flags for dt, flags in data["days"].items()}
+            months = {int(month): _toDate(fetched).toordinal() for month, fetched in data["months"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+        self._days, self._months = days, months
+        self._reindex()
+
+    def _save(self):
+        if not self.path:
+            return
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            "months": {str(month): _fmt(date.fromordinal(o)) for month, o in sorted(self._months.items())},
+            "days": {_fmt(date.fromordinal(o)): flags for o, flags in sorted(self._days.items())},
+        }
+        fd, tmp = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(self.path) or ".")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _reindex(self):
+        self._open = sorted(o for o, flags in self._days.items() if flags[_OPEN] == "Y")
+
+    # ----- 조회 (월 단위) -----
+
+    def _stale(self, month: int, today: date) -> bool:
+        fetched = self._months.get(month)
+        if fetched is None:
+            return True
+        return month >= _month(today) and today.toordinal() - fetched >= self.max_age
+
+    def _fetchMonth(self, first: date, today: date) -> bool:
+        """first 가 속한 달을 받아 저장합니다. (한 번에 3~4주치씩)"""
+        end = _monthEnd(first)
+        cursor = first
+        received = {}
+        while cursor <= end:
+            self.api_calls += 1
+            output = self.fetch(_fmt(cursor))
+            if output is None or output.empty or "bass_dt" not in output.columns:
+                break
+            last = None
+            for rec in output.to_dict("records"):
+                dt = str(rec.get("bass_dt") or "").strip()
+                if len(dt) == 8 and dt.isdigit():
+                    o = _toDate(dt).toordinal()
+                    received[o] = "".join("Y" if rec.get(c) == "Y" else "N" for c in FLAG_COLUMNS)
+                    last = max(last or o, o)
+            if last is None or last < cursor.toordinal():
+                break
+            cursor = date.fromordinal(last + 1)
+
+        self._days.update(received)
+        complete = all(o in received for o in range(first.toordinal(), end.toordinal() + 1))
+        if complete:
+            self._months[_month(first)] = today.toordinal()
+        return complete
+
+    def ensure(self, start, end=None) -> bool:
+        """
+        [start, end] 가 속한 달들을 (없거나 오래되었으면) 받아 둡니다.
+
+        Returns:
+            bool: 모든 달을 캘린더로 답할 수 있으면 True (실패한 달은 평일=개장일로 간주)
+        """
+        start = _toDate(start)
+        end = _toDate(end) if end else start
+        today = date.today()
+        day, fresh = self._fresh
+        if day != today.toordinal():
+            fresh = set()
+            self._fresh = (today.toordinal(), fresh)
+        months = []
+        year, month = start.year, start.month
+        while year * 100 + month <= _month(end):
+            months.append(year * 100 + month)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        todo = [m for m in months if m not in fresh and self._stale(m, today)]
+        if not todo:
+            fresh.update(months)
+            return True
+
+        with self._lock:
+            todo = [m for m in todo if self._stale(m, today)]
+            if todo and time.monotonic() >= self._retry_at:
+                try:
+                    for m in todo:
+                        if not self._fetchMonth(date(m // 100, m % 100, 1), today):
+                            logger.warning("Holiday calendar for %s is incomplete", m)
+                            self._retry_at = time.monotonic() + RETRY_INTERVAL
+                except Exception:
+                    logger.warning("Holiday calendar fetch failed, assuming weekdays are trading days",
+                                   exc_info=True)
+                    self._retry_at = time.monotonic() + RETRY_INTERVAL
+                self._reindex()
+                try:
+                    self._save()
+                except OSError:
+                    logger.warning("Could not save holiday calendar to %s", self.path, exc_info=True)
+        return all(m in self._months for m in months)
+
+    # ----- 질의 -----
+
+    def day_info(self, d) -> Optional[dict]:
+        """{bzdy_yn, tr_day_yn, opnd_yn, sttl_day_yn} (bool), 캘린더에 없으면 None"""
+        d = _toDate(d)
+        self.ensure(d)
+        flags = self._days.get(d.toordinal())
+        return None if flags is None else {c: v == "Y" for c, v in zip(FLAG_COLUMNS, flags)}
+
+    def is_open(self, d=None) -> bool:
+        """개장일(주문 가능일) 여부 (기본 오늘)"""
+        d = _toDate(d) if d else date.today()
+        self.ensure(d)
+        flags = self._days.get(d.toordinal())
+        return flags[_OPEN] == "Y" if flags is not None else d.weekday() < 5
+
+    def _countOpen(self, start: date, end: date) -> int:
+        # [start, end] 의 개장일 수: 받은 달은 bisect, 받지 못한 달은 평일 수
+        count = 0
+        cursor = start
+        while cursor <= end:
+            stop = min(_monthEnd(cursor), end)
+            if _month(cursor) in self._months:
+                count += (bisect.bisect_right(self._open, stop.toordinal())
+                          - bisect.bisect_left(self._open, cursor.toordinal()))
+            else:
+                count += int(np.busday_count(cursor, stop + timedelta(days=1)))
+            cursor = stop + timedelta(days=1)
+        return count
+
+    def trading_days_between(self, start, end) -> int:
+        """[start, end] (양 끝 포함) 의 개장일 수"""
+        start, end = _toDate(start), _toDate(end)
+        if start > end:
+            return 0
+        self.ensure(start, end)
+        return self._countOpen(start, end)
+
+    def trading_days(self, start, end) -> List[date]:
+        """[start, end] (양 끝 포함) 의 개장일 목록"""
+        start, end = _toDate(start), _toDate(end)
+        self.ensure(start, end)
+        days = []
+        for d in (start + timedelta(days=i) for i in range((end - start).days + 1)):
+            flags = self._days.get(d.toordinal())
+            if (flags[_OPEN] == "Y") if flags is not None else d.weekday() < 5:
+                days.append(d)
+        return days
+
+    def next_trading_day(self, d=None, include: bool = False) -> date:
+        """d 다음(include=True 면 d 포함) 개장일 (기본 오늘 기준)"""
+        d = _toDate(d) if d else date.today()
+        cursor = d if include else d + timedelta(days=1)
+        for _ in range(24):  # 최대 2년
+            self.ensure(cursor)
+            end = _monthEnd(cursor)
+            if _month(cursor) in self._months:
+                i = bisect.bisect_left(self._open, cursor.toordinal())
+                if i < len(self._open) and self._open[i] <= end.toordinal():
+                    return date.fromordinal(self._open[i])
+            else:
+                while cursor <= end:
+                    if cursor.weekday() < 5:
+                        return cursor
+                    cursor += timedelta(days=1)
+            cursor = end + timedelta(days=1)
+        raise ValueError(f"No trading day within two years after {d}")
+
+    def previous_trading_day(self, d=None, include: bool = False) -> date:
+        """d 이전(include=True 면 d 포함) 개장일 (기본 오늘 기준)"""
+        d = _toDate(d) if d else date.today()
+        cursor = d if include else d - timedelta(days=1)
+        for _ in range(24):
+            self.ensure(cursor)
+            first = cursor.replace(day=1)
+            if _month(cursor) in self._months:
+                i = bisect.bisect_right(self._open, cursor.toordinal()) - 1
+                if i >= 0 and self._open[i] >= first.toordinal():
+                    return date.fromordinal(self._open[i])
+            else:
+                while cursor >= first:
+                    if cursor.weekday() < 5:
+                        return cursor
+                    cursor -= timedelta(days=1)
+            cursor = first - timedelta(days=1)
+        raise ValueError(f"No trading day within two years before {d}")
+
+
+_calendar_instance: Optional[TradingCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """프로세스 전역 캘린더 (KIS_CALENDAR_PATH)"""
+    global _calendar_instance
+    if _calendar_instance is None:
+        with _calendar_lock:
+            if _calendar_instance is None:
+                _calendar_instance = TradingCalendar()
+    return _calendar_instance
+
+
+def set_trading_calendar(cal: TradingCalendar) -> None:
+    global _calendar_instance
+    _calendar_instance = cal
+
+
+def is_open(d=None) -> bool:
+    return get_trading_calendar().is_open(d)
+
+
+def next_trading_day(d=None, include: bool = False) -> date:
+    return get_trading_calendar().next_trading_day(d, include)
+
+
+def trading_days_between(start, end) -> int:
+    return get_trading_calendar().trading_days_between(start, end)
@@ -5,6 +5,7 @@ from typing import Optional, Tuple
 
 import pandas as pd
 import api.functions.kis_auth as ka
+import api.functions.kis_paging as kp
 
 sys.path.extend(['..', '.'])
 
@@ -92,12 +93,6 @@ def after_hour_balance(
         logger.error("fid_input_iscd is required. (e.g. '0000')")
         raise ValueError("fid_input_iscd is required. (e.g. '0000')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "FHPST01760000"
@@ -119,51 +114,9 @@ def after_hour_balance(
         "fid_input_price_2": fid_input_price_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 호출 성공 시 데이터 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        # 다음 페이지 호출
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return after_hour_balance(
-                fid_input_price_1,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_rank_sort_cls_code,
-                fid_div_cls_code,
-                fid_input_iscd,
-                fid_trgt_exls_cls_code,
-                fid_trgt_cls_code,
-                fid_vol_cnt,
-                fid_input_price_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그 출력
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -263,12 +216,6 @@ def bulk_trans_num(
         logger.error("fid_trgt_cls_code is required. (e.g. '0')")
         raise ValueError("fid_trgt_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST190900C0"
 
     api_url = "/uapi/domestic-stock/v1/ranking/bulk-trans-num"
@@ -288,52 +235,9 @@ def bulk_trans_num(
         "fid_vol_cnt": fid_vol_cnt,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 다음 페이지 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return bulk_trans_num(
-                fid_aply_rang_prc_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_aply_rang_prc_1,
-                fid_input_iscd_2,
-                fid_trgt_exls_cls_code,
-                fid_trgt_cls_code,
-                fid_vol_cnt,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -415,7 +319,7 @@ def capture_uplowprice(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return res.frame("output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -462,13 +366,6 @@ def chk_holiday(
     if bass_dt == "":
         raise ValueError("bass_dt is required (e.g. 'YYYYMMDD')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "CTCA0903R"  # 국내휴장일조회
 
     api_url = "/uapi/domestic-stock/v1/quotations/chk-holiday"
@@ -479,38 +376,10 @@ def chk_holiday(
         "CTX_AREA_NK": NK100
     }
 
-    res = ka._url_fetch(API_URL, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk
-        NK100 = res.getBody().ctx_area_nk
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return chk_holiday(
-                bass_dt, NK100, FK100, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
-    else:
-        res.printError(url=API_URL)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK": "ctx_area_fk", "CTX_AREA_NK": "ctx_area_nk"})
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -568,12 +437,6 @@ def comp_interest(
         logger.error("fid_div_cls_code is required. (e.g. '1')")
         raise ValueError("fid_div_cls_code is required. (e.g. '1')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST07020000"
 
     api_url = "/uapi/domestic-stock/v1/quotations/comp-interest"
@@ -585,52 +448,9 @@ def comp_interest(
         "FID_DIV_CLS_CODE1": fid_div_cls_code1,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return comp_interest(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_div_cls_code1,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -682,7 +502,7 @@ def comp_program_trade_daily(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return res.frame("output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -748,7 +568,7 @@ def comp_program_trade_today(
 
     if res.isOK():
         # array 타입이므로 DataFrame으로 반환
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -818,12 +638,6 @@ def credit_balance(
         logger.error("fid_rank_sort_cls_code is required. (e.g. '0')")
         raise ValueError("fid_rank_sort_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHKST17010000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/credit-balance"
@@ -836,74 +650,9 @@ def credit_balance(
         "FID_RANK_SORT_CLS_CODE": fid_rank_sort_cls_code,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat(
-                        [dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat(
-                        [dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return credit_balance(
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_option,
-                fid_cond_mrkt_div_code,
-                fid_rank_sort_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -974,12 +723,6 @@ def credit_by_company(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 ID 설정
 
     tr_id = "FHPST04770000"
@@ -996,49 +739,9 @@ def credit_by_company(
         "fid_cond_mrkt_div_code": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 호출 성공 시 데이터 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        # 다음 페이지 호출
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return credit_by_company(
-                fid_rank_sort_cls_code,
-                fid_slct_yn,
-                fid_input_iscd,
-                fid_cond_scr_div_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그 출력
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -1092,13 +795,6 @@ def daily_credit_balance(
     if fid_input_date_1 == "":
         raise ValueError("fid_input_date_1 is required (e.g. '20240313')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "FHPST04760000"  # 국내주식 신용잔고 일별추이
 
     api_url = "/uapi/domestic-stock/v1/quotations/daily-credit-balance"
@@ -1110,31 +806,9 @@ def daily_credit_balance(
         "FID_INPUT_DATE_1": fid_input_date_1  # 결제일자
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return daily_credit_balance(
-                fid_cond_mrkt_div_code, fid_cond_scr_div_code, fid_input_iscd, fid_input_date_1, "N", dataframe,
-                depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -1189,7 +863,7 @@ def daily_loan_trans(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        result_data = pd.DataFrame(res.getBody().output1)
+        result_data = res.frame("output1")
         return result_data
     else:
         res.printError(url=api_url)
@@ -1246,10 +920,10 @@ def daily_short_sale(
 
     if res.isOK():
         # output1 처리 (object 타입 -> DataFrame)
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
+        output1_data = res.frame("output1")
 
         # output2 처리 (array 타입 -> DataFrame)
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -1344,12 +1018,6 @@ def disparity(
         logger.error("fid_input_iscd is required. (e.g. '0000')")
         raise ValueError("fid_input_iscd is required. (e.g. '0000')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01780000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/disparity"
@@ -1368,46 +1036,9 @@ def disparity(
         "fid_vol_cnt": fid_vol_cnt,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return disparity(
-                fid_input_price_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_rank_sort_cls_code,
-                fid_hour_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_vol_cnt,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -1492,12 +1123,6 @@ def dividend_rate(
         logger.error("gb4 is required. (e.g. '0')")
         raise ValueError("gb4 is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB13470100"
 
     api_url = "/uapi/domestic-stock/v1/ranking/dividend-rate"
@@ -1513,43 +1138,9 @@ def dividend_rate(
         "GB4": gb4,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return dividend_rate(
-                cts_area,
-                gb1,
-                upjong,
-                gb2,
-                gb3,
-                f_dt,
-                t_dt,
-                gb4,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -1594,17 +1185,6 @@ def estimate_perform(
         logger.error("sht_cd is required. (e.g. '265520')")
         raise ValueError("sht_cd is required. (e.g. '265520')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return (
-            dataframe1 if dataframe1 is not None else pd.DataFrame(),
-            dataframe2 if dataframe2 is not None else pd.DataFrame(),
-            dataframe3 if dataframe3 is not None else pd.DataFrame(),
-            dataframe4 if dataframe4 is not None else pd.DataFrame()
-        )
-
     tr_id = "HHKST668300C0"
 
     api_url = "/uapi/domestic-stock/v1/quotations/estimate-perform"
@@ -1613,69 +1193,9 @@ def estimate_perform(
         "SHT_CD": sht_cd,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-
-        # output3 처리
-        if hasattr(res.getBody(), 'output3'):
-            output_data = res.getBody().output3
-            if output_data:
-                current_data3 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe3 = pd.concat([dataframe3, current_data3],
-                                       ignore_index=True) if dataframe3 is not None else current_data3
-            else:
-                dataframe3 = pd.DataFrame() if dataframe3 is None else dataframe3
-
-        # output4 처리
-        if hasattr(res.getBody(), 'output4'):
-            output_data = res.getBody().output4
-            if output_data:
-                current_data4 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe4 = pd.concat([dataframe4, current_data4],
-                                       ignore_index=True) if dataframe4 is not None else current_data4
-            else:
-                dataframe4 = pd.DataFrame() if dataframe4 is None else dataframe4
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return estimate_perform(
-                sht_cd, dataframe1, dataframe2, dataframe3, dataframe4, "N", depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2, dataframe3, dataframe4
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", "output3", "output4", frames=(dataframe1, dataframe2, dataframe3, dataframe4))
 
 
 ##############################################################################################
@@ -1743,7 +1263,7 @@ def exp_closing_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return res.frame("output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -1798,12 +1318,6 @@ def exp_index_trend(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'U')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'U')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01840000"
 
     api_url = "/uapi/domestic-stock/v1/quotations/exp-index-trend"
@@ -1815,43 +1329,9 @@ def exp_index_trend(
         "FID_COND_MRKT_DIV_CODE": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return exp_index_trend(
-                fid_mkop_cls_code,
-                fid_input_hour_1,
-                fid_input_iscd,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -1904,8 +1384,8 @@ def exp_price_trend(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        output1_data = pd.DataFrame([res.getBody().output1])
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output1_data = res.frame("output1")
+        output2_data = res.frame("output2")
 
         logging.info("Data fetch complete.")
         return output1_data, output2_data
@@ -1985,12 +1465,6 @@ def exp_total_index(
         logger.error("fid_mkop_cls_code is required. (e.g. '1')")
         raise ValueError("fid_mkop_cls_code is required. (e.g. '1')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHKUP11750000"
 
     api_url = "/uapi/domestic-stock/v1/quotations/exp-total-index"
@@ -2003,57 +1477,9 @@ def exp_total_index(
         "fid_mkop_cls_code": fid_mkop_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-        else:
-            dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-        else:
-            dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return exp_total_index(
-                fid_mrkt_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_mkop_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -2147,12 +1573,6 @@ def exp_trans_updown(
         logger.error("fid_mkop_cls_code is required. (e.g. '0')")
         raise ValueError("fid_mkop_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01820000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/exp-trans-updown"
@@ -2170,49 +1590,9 @@ def exp_trans_updown(
         "fid_mkop_cls_code": fid_mkop_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return exp_trans_updown(
-                fid_rank_sort_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_aply_rang_prc_1,
-                fid_vol_cnt,
-                fid_pbmn,
-                fid_blng_cls_code,
-                fid_mkop_cls_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -2265,12 +1645,6 @@ def finance_balance_sheet(
         logger.error("fid_input_iscd is required. (e.g. '000660')")
         raise ValueError("fid_input_iscd is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430100"
 
     api_url = "/uapi/domestic-stock/v1/finance/balance-sheet"
@@ -2281,43 +1655,9 @@ def finance_balance_sheet(
         "fid_input_iscd": fid_input_iscd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_balance_sheet(
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 에러 처리
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -2370,12 +1710,6 @@ def finance_financial_ratio(
         logger.error("fid_input_iscd is required. (e.g. '000660')")
         raise ValueError("fid_input_iscd is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430300"
 
     api_url = "/uapi/domestic-stock/v1/finance/financial-ratio"
@@ -2386,42 +1720,9 @@ def finance_financial_ratio(
         "fid_input_iscd": fid_input_iscd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_financial_ratio(
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -2474,12 +1775,6 @@ def finance_growth_ratio(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API URL 및 거래 ID 설정
     tr_id = "FHKST66430800"
 
@@ -2493,42 +1788,9 @@ def finance_growth_ratio(
         "fid_cond_mrkt_div_code": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 응답 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_growth_ratio(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -2576,12 +1838,6 @@ def finance_income_statement(
         logger.error("fid_input_iscd is required. (e.g. '000660')")
         raise ValueError("fid_input_iscd is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430200"
 
     api_url = "/uapi/domestic-stock/v1/finance/income-statement"
@@ -2592,44 +1848,9 @@ def finance_income_statement(
         "fid_input_iscd": fid_input_iscd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_income_statement(
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -2679,12 +1900,6 @@ def finance_other_major_ratios(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430500"
 
     api_url = "/uapi/domestic-stock/v1/finance/other-major-ratios"
@@ -2695,39 +1910,9 @@ def finance_other_major_ratios(
         "fid_cond_mrkt_div_code": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_other_major_ratios(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -2780,12 +1965,6 @@ def finance_profit_ratio(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430400"
 
     api_url = "/uapi/domestic-stock/v1/finance/profit-ratio"
@@ -2796,46 +1975,9 @@ def finance_profit_ratio(
         "fid_cond_mrkt_div_code": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_profit_ratio(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -2942,51 +2084,9 @@ def finance_ratio(
         "fid_trgt_exls_cls_code": fid_trgt_exls_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return finance_ratio(
-                fid_trgt_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_input_option_1,
-                fid_input_option_2,
-                fid_rank_sort_cls_code,
-                fid_blng_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        # 오류 처리
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -3036,12 +2136,6 @@ def finance_stability_ratio(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430600"
 
     api_url = "/uapi/domestic-stock/v1/finance/stability-ratio"
@@ -3052,42 +2146,9 @@ def finance_stability_ratio(
         "fid_cond_mrkt_div_code": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_stability_ratio(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -3169,37 +2230,9 @@ def fluctuation(
         "fid_rsfl_rate1": fid_rsfl_rate1
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":  # 다음 페이지 존재
-            print("Call Next")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return fluctuation(
-                fid_rsfl_rate2, fid_cond_mrkt_div_code, fid_cond_scr_div_code,
-                fid_input_iscd, fid_rank_sort_cls_code, fid_input_cnt_1,
-                fid_prc_cls_code, fid_input_price_1, fid_input_price_2,
-                fid_vol_cnt, fid_trgt_cls_code, fid_trgt_exls_cls_code,
-                fid_div_cls_code, fid_rsfl_rate1, "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        res.printError(api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -3277,7 +2310,7 @@ def foreign_institution_total(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
 
         logging.info("Data fetch complete.")
         return current_data
@@ -3334,7 +2367,7 @@ def frgnmem_pchs_trend(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        output_data = pd.DataFrame(res.getBody().output)
+        output_data = res.frame("output")
 
         logging.info("Data fetch complete.")
         return output_data
@@ -3403,7 +2436,7 @@ def frgnmem_trade_estimate(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -3477,12 +2510,6 @@ def frgnmem_trade_trend(
         logger.error("fid_mrkt_cls_code is required. (e.g. 'A')")
         raise ValueError("fid_mrkt_cls_code is required. (e.g. 'A')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST04320000"
 
     api_url = "/uapi/domestic-stock/v1/quotations/frgnmem-trade-trend"
@@ -3496,74 +2523,9 @@ def frgnmem_trade_trend(
         "FID_VOL_CNT": fid_vol_cnt,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat(
-                        [dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat(
-                        [dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return frgnmem_trade_trend(
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_input_iscd_2,
-                fid_mrkt_cls_code,
-                fid_vol_cnt,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -3597,12 +2559,6 @@ def hts_top_view(
     # 로깅 설정
     logger = logging.getLogger(__name__)
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHMCM000100C0"
 
     # Request Query Parameter가 없으므로 빈 딕셔너리로 유지
@@ -3611,39 +2567,9 @@ def hts_top_view(
 
     params = {}
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 다음 페이지 호출 여부 결정
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return hts_top_view(
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그 출력
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -3697,10 +2623,10 @@ def inquire_account_balance(
 
     if res.isOK():
         # output1 - array 타입
-        df1 = pd.DataFrame(res.getBody().output1)
+        df1 = res.frame("output1")
 
         # output2 - object 타입 (단일 객체를 DataFrame으로 변환)
-        df2 = pd.DataFrame([res.getBody().output2])
+        df2 = res.frame("output2")
 
         logging.info("Data fetch complete.")
         return df1, df2
@@ -3765,10 +2691,10 @@ def inquire_asking_price_exp_ccn(
 
     if res.isOK():
         # output1 (object) -> 호가정보
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = res.frame("output1")
 
         # output2 (array) -> 예상체결정보
-        output2_data = pd.DataFrame([res.getBody().output2])
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -3863,14 +2789,6 @@ def inquire_balance(
         raise ValueError(
             "prcs_dvsn is required (e.g. '00: 전일매매포함, 01:전일매매미포함')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     # tr_id 설정
     if env_dv == "real":
         tr_id = "TTTC8434R"
@@ -3895,43 +2813,10 @@ def inquire_balance(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat(
-                [dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리
-        current_data2 = pd.DataFrame(res.getBody().output2)
-        if dataframe2 is not None:
-            dataframe2 = pd.concat(
-                [dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_balance(
-                env_dv, cano, acnt_prdt_cd, afhr_flpr_yn, inqr_dvsn, unpr_dvsn,
-                fund_sttl_icld_yn, fncg_amt_auto_rdpt_yn, prcs_dvsn, FK100, NK100,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -4018,14 +2903,6 @@ def inquire_balance_rlz_pl(
         raise ValueError(
             "prcs_dvsn is required (e.g. '00:전일매매포함, 01:전일매매미포함')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC8494R"  # 주식잔고조회_실현손익
 
     api_url = "/uapi/domestic-stock/v1/trading/inquire-balance-rlz-pl"
@@ -4045,44 +2922,10 @@ def inquire_balance_rlz_pl(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat(
-                [dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리
-        current_data2 = pd.DataFrame(res.getBody().output2)
-        if dataframe2 is not None:
-            dataframe2 = pd.concat(
-                [dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_balance_rlz_pl(
-                cano, acnt_prdt_cd, afhr_flpr_yn, inqr_dvsn, unpr_dvsn,
-                fund_sttl_icld_yn, fncg_amt_auto_rdpt_yn, prcs_dvsn,
-                ofl_yn, cost_icld_yn, FK100, NK100, "N",
-                dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -4140,7 +2983,7 @@ def inquire_ccnl(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -4225,7 +3068,7 @@ def inquire_credit_psamount(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -4346,14 +3189,6 @@ def inquire_daily_ccld(
         raise ValueError(
             "inqr_dvsn_3 is required (e.g. '00 전체 / 01 현금 / 02 신용 / 03 담보 / 04 대주 / 05 대여 / 06 자기융자신규/상환 / 07 유통융자신규/상환')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     # tr_id 설정
     if env_dv == "real":
         if pd_dv == "before":
@@ -4394,44 +3229,10 @@ def inquire_daily_ccld(
     if excg_id_dvsn_cd is not None:
         params["EXCG_ID_DVSN_CD"] = excg_id_dvsn_cd
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 (array) 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat(
-                [dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 (object) 처리
-        current_data2 = pd.DataFrame([res.getBody().output2])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat(
-                [dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_daily_ccld(
-                env_dv, pd_dv, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt,
-                sll_buy_dvsn_cd, pdno, ccld_dvsn, inqr_dvsn, inqr_dvsn_3,
-                ord_gno_brno, odno, inqr_dvsn_1, FK100, NK100, "N",
-                excg_id_dvsn_cd, dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -4518,12 +3319,6 @@ def inquire_daily_indexchartprice(
         logger.error("env_dv must be 'real' or 'demo'")
         raise ValueError("env_dv must be 'real' or 'demo'")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     # API 호출 URL 설정
 
     # TR ID 설정 (모의투자 지원 로직)
@@ -4542,60 +3337,9 @@ def inquire_daily_indexchartprice(
         "FID_PERIOD_DIV_CODE": fid_period_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-        else:
-            dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-        else:
-            dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_daily_indexchartprice(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                fid_input_date_1,
-                fid_input_date_2,
-                fid_period_div_code,
-                env_dv,  # env_dv 파라미터 추가
-                dataframe1,
-                dataframe2,
-                "N", depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -4682,10 +3426,10 @@ def inquire_daily_itemchartprice(
 
     if res.isOK():
         # output1 처리 (object 타입이므로 DataFrame)
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = res.frame("output1")
 
         # output2 처리 (array 타입이므로 DataFrame)
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return (output1_data, output2_data)
     else:
@@ -4748,10 +3492,10 @@ def inquire_daily_overtimeprice(
 
     if res.isOK():
         # output1 (object) -> DataFrame
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
+        output1_data = res.frame("output1")
 
         # output2 (array) -> DataFrame
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -4835,7 +3579,7 @@ def inquire_daily_price(
 
     if res.isOK():
         # output은 array 자료형이므로 DataFrame으로 변환
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -4898,10 +3642,10 @@ def inquire_daily_trade_volume(
 
     if res.isOK():
         # output1 (object) - 단일 레코드
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = res.frame("output1")
 
         # output2 (array) - 배열 데이터
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -4961,12 +3705,6 @@ def inquire_elw_price(
         logger.error("env_dv must be 'real' or 'demo'")
         raise ValueError("env_dv must be 'real' or 'demo'")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 설정
 
     # TR ID 설정 (모의투자 지원 로직)
@@ -4985,45 +3723,9 @@ def inquire_elw_price(
         "FID_INPUT_ISCD": fid_input_iscd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 응답 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_elw_price(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                env_dv,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -5097,12 +3799,6 @@ def inquire_index_category_price(
         logger.error("fid_blng_cls_code is required. (e.g. '0')")
         raise ValueError("fid_blng_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPUP02140000"
 
     api_url = "/uapi/domestic-stock/v1/quotations/inquire-index-category-price"
@@ -5115,53 +3811,9 @@ def inquire_index_category_price(
         "FID_BLNG_CLS_CODE": fid_blng_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_category_price(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                fid_cond_scr_div_code,
-                fid_mrkt_cls_code,
-                fid_blng_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -5220,12 +3872,6 @@ def inquire_index_daily_price(
         logger.error("fid_input_date_1 is required. (e.g. '20240223')")
         raise ValueError("fid_input_date_1 is required. (e.g. '20240223')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPUP02120000"
 
     api_url = "/uapi/domestic-stock/v1/quotations/inquire-index-daily-price"
@@ -5237,51 +3883,9 @@ def inquire_index_daily_price(
         "FID_INPUT_DATE_1": fid_input_date_1,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_daily_price(
-                fid_period_div_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                fid_input_date_1,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -5328,12 +3932,6 @@ def inquire_index_price(
         logger.error("fid_input_iscd is required. (e.g. '0001')")
         raise ValueError("fid_input_iscd is required. (e.g. '0001')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
     tr_id = "FHPUP02100000"
 
@@ -5346,44 +3944,9 @@ def inquire_index_price(
         "FID_INPUT_ISCD": fid_input_iscd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 호출 성공 시 데이터 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_price(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그 출력
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -5427,12 +3990,6 @@ def inquire_index_tickprice(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'U')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'U')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPUP02110100"
 
     api_url = "/uapi/domestic-stock/v1/quotations/inquire-index-tickprice"
@@ -5442,45 +3999,9 @@ def inquire_index_tickprice(
         "FID_COND_MRKT_DIV_CODE": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_tickprice(
-                fid_input_iscd,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 에러 처리
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -5530,12 +4051,6 @@ def inquire_index_timeprice(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'U')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'U')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPUP02110200"
 
     api_url = "/uapi/domestic-stock/v1/quotations/inquire-index-timeprice"
@@ -5546,42 +4061,9 @@ def inquire_index_timeprice(
         "FID_COND_MRKT_DIV_CODE": fid_cond_mrkt_div_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_timeprice(
-                fid_input_hour_1,
-                fid_input_iscd,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -5641,7 +4123,7 @@ def inquire_investor(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return res.frame("output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -5715,7 +4197,7 @@ def inquire_investor_daily_by_market(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -5764,7 +4246,7 @@ def inquire_investor_time_by_market(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -5824,7 +4306,7 @@ def inquire_member(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -5901,7 +4383,7 @@ def inquire_member_daily(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -5951,7 +4433,7 @@ def inquire_overtime_asking_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -6001,7 +4483,7 @@ def inquire_overtime_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -6082,14 +4564,6 @@ def inquire_period_profit(
     if cblc_dvsn == "":
         raise ValueError("cblc_dvsn is required (e.g. '00')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC8708R"
 
     api_url = "/uapi/domestic-stock/v1/trading/inquire-period-profit"
@@ -6107,42 +4581,10 @@ def inquire_period_profit(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리 (array)
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat(
-                [dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리 (object)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat(
-                [dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_period_profit(
-                cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt, sort_dvsn, inqr_dvsn, cblc_dvsn,
-                pdno, NK100, FK100, "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -6212,14 +4654,6 @@ def inquire_period_trade_profit(
     if cblc_dvsn == "":
         raise ValueError("cblc_dvsn is required (e.g. '00')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC8715R"  # 기간별매매손익현황조회
 
     api_url = "/uapi/domestic-stock/v1/trading/inquire-period-trade-profit"
@@ -6236,41 +4670,10 @@ def inquire_period_trade_profit(
         "CTX_AREA_NK100": NK100  # 연속조회키100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
-
-        if dataframe1 is not None:
-            dataframe1 = pd.concat(
-                [dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        if dataframe2 is not None:
-            dataframe2 = pd.concat(
-                [dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_period_trade_profit(
-                cano, acnt_prdt_cd, sort_dvsn, inqr_strt_dt, inqr_end_dt, cblc_dvsn,
-                pdno, NK100, FK100, "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -6333,7 +4736,7 @@ def inquire_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -6382,7 +4785,7 @@ def inquire_price_2(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output, index=[0])
+        return res.frame("output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -6486,7 +4889,7 @@ def inquire_psbl_order(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output, index=[0])
+        return res.frame("output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -6547,13 +4950,6 @@ def inquire_psbl_rvsecncl(
         raise ValueError(
             "inqr_dvsn_2 is required (e.g. '0: 전체, 1: 매도, 2: 매수')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "TTTC0084R"  # 주식정정취소가능주문조회
 
     api_url = "/uapi/domestic-stock/v1/trading/inquire-psbl-rvsecncl"
@@ -6567,32 +4963,10 @@ def inquire_psbl_rvsecncl(
         "CTX_AREA_NK100": NK100  # 연속조회키100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_psbl_rvsecncl(
-                cano, acnt_prdt_cd, inqr_dvsn_1, inqr_dvsn_2, FK100, NK100, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -6663,10 +5037,10 @@ def inquire_time_dailychartprice(
 
     if res.isOK():
         # output1 (object) -> DataFrame
-        output1 = pd.DataFrame([res.getBody().output1])
+        output1 = res.frame("output1")
 
         # output2 (array) -> DataFrame
-        output2 = pd.DataFrame(res.getBody().output2)
+        output2 = res.frame("output2")
 
         return output1, output2
     else:
@@ -6745,12 +5119,6 @@ def inquire_time_indexchartprice(
         logger.error("fid_pw_data_incu_yn is required. (e.g. 'Y')")
         raise ValueError("fid_pw_data_incu_yn is required. (e.g. 'Y')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHKUP03500200"
 
     api_url = "/uapi/domestic-stock/v1/quotations/inquire-time-indexchartprice"
@@ -6763,74 +5131,9 @@ def inquire_time_indexchartprice(
         "FID_PW_DATA_INCU_YN": fid_pw_data_incu_yn,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # Output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat(
-                        [dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # Output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat(
-                        [dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_time_indexchartprice(
-                fid_cond_mrkt_div_code,
-                fid_etc_cls_code,
-                fid_input_iscd,
-                fid_input_hour_1,
-                fid_pw_data_incu_yn,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -6912,10 +5215,10 @@ def inquire_time_itemchartprice(
 
     if res.isOK():
         # output1 (object) -> DataFrame (1행)
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
+        output1_data = res.frame("output1")
 
         # output2 (array) -> DataFrame (여러행)
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -6986,10 +5289,10 @@ def inquire_time_itemconclusion(
 
     if res.isOK():
         # output1 처리 (object -> DataFrame)
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = res.frame("output1")
 
         # output2 처리 (object -> DataFrame)
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -7060,10 +5363,10 @@ def inquire_time_overtimeconclusion(
 
     if res.isOK():
         # output1 (object) -> DataFrame
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
+        output1_data = res.frame("output1")
 
         # output2 (array) -> DataFrame
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -7148,12 +5451,6 @@ def inquire_vi_status(
         logger.error("fid_div_cls_code is required. (e.g. '0')")
         raise ValueError("fid_div_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01390000"
 
     api_url = "/uapi/domestic-stock/v1/quotations/inquire-vi-status"
@@ -7169,47 +5466,9 @@ def inquire_vi_status(
         "FID_TRGT_EXLS_CLS_CODE": fid_trgt_exls_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_vi_status(
-                fid_div_cls_code,
-                fid_cond_scr_div_code,
-                fid_mrkt_cls_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_input_date_1,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -7277,7 +5536,7 @@ def intgr_margin(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -7337,7 +5596,7 @@ def intstock_grouplist(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = res.frame("output2")
         return current_data
     else:
         res.printError(url=api_url)
@@ -7629,7 +5888,7 @@ def intstock_multprice(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -7712,10 +5971,10 @@ def intstock_stocklist_by_group(
 
     if res.isOK():
         # output1 데이터프레임 생성
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = res.frame("output1")
 
         # output2 데이터프레임 생성
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         logging.info("Data fetch complete.")
         return output1_data, output2_data
@@ -7799,12 +6058,6 @@ def invest_opbysec(
         logger.error("fid_input_date_2 is required. (e.g. '20231231')")
         raise ValueError("fid_input_date_2 is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "FHKST663400C0"
@@ -7822,46 +6075,9 @@ def invest_opbysec(
         "FID_INPUT_DATE_2": fid_input_date_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 응답 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return invest_opbysec(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_date_1,
-                fid_input_date_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -7932,12 +6148,6 @@ def invest_opinion(
         logger.error("fid_input_date_2 is required. (e.g. '20240513')")
         raise ValueError("fid_input_date_2 is required. (e.g. '20240513')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "FHKST663300C0"
@@ -7954,46 +6164,9 @@ def invest_opinion(
         "FID_INPUT_DATE_2": fid_input_date_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 응답 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return invest_opinion(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_input_date_1,
-                fid_input_date_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8032,7 +6205,7 @@ def investor_program_trade_today(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output1)
+        current_data = res.frame("output1")
         return current_data
     else:
         res.printError(url=api_url)
@@ -8079,7 +6252,7 @@ def investor_trend_estimate(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = res.frame("output2")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -8135,12 +6308,6 @@ def ksdinfo_bonus_issue(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669101C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/bonus-issue"
@@ -8152,43 +6319,9 @@ def ksdinfo_bonus_issue(
         "SHT_CD": sht_cd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_bonus_issue(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8239,12 +6372,6 @@ def ksdinfo_cap_dcrs(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669106C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/cap-dcrs"
@@ -8256,43 +6383,9 @@ def ksdinfo_cap_dcrs(
         "SHT_CD": sht_cd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_cap_dcrs(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8351,12 +6444,6 @@ def ksdinfo_dividend(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669102C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/dividend"
@@ -8370,47 +6457,9 @@ def ksdinfo_dividend(
         "HIGH_GB": high_gb,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_dividend(
-                cts,
-                gb1,
-                f_dt,
-                t_dt,
-                sht_cd,
-                high_gb,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8461,12 +6510,6 @@ def ksdinfo_forfeit(
         logger.error("f_dt is required. (e.g. '20240314')")
         raise ValueError("f_dt is required. (e.g. '20240314')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669109C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/forfeit"
@@ -8478,43 +6521,9 @@ def ksdinfo_forfeit(
         "CTS": cts,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_forfeit(
-                sht_cd,
-                t_dt,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8564,12 +6573,6 @@ def ksdinfo_list_info(
         logger.error("f_dt is required. (e.g. '20231001')")
         raise ValueError("f_dt is required. (e.g. '20231001')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 ID 설정
 
     tr_id = "HHKDB669107C0"
@@ -8585,45 +6588,9 @@ def ksdinfo_list_info(
         "CTS": cts,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 응답 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_list_info(
-                sht_cd,
-                t_dt,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8674,12 +6641,6 @@ def ksdinfo_mand_deposit(
         logger.error("f_dt is required. (e.g. '20230101')")
         raise ValueError("f_dt is required. (e.g. '20230101')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "HHKDB669110C0"
@@ -8695,48 +6656,9 @@ def ksdinfo_mand_deposit(
         "CTS": cts,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 호출 성공 시 데이터 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        # 다음 페이지 호출
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_mand_deposit(
-                t_dt,
-                sht_cd,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그 출력
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8787,12 +6709,6 @@ def ksdinfo_merger_split(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669104C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/merger-split"
@@ -8804,44 +6720,9 @@ def ksdinfo_merger_split(
         "SHT_CD": sht_cd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_merger_split(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8898,12 +6779,6 @@ def ksdinfo_paidin_capin(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669100C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/paidin-capin"
@@ -8912,45 +6787,13 @@ def ksdinfo_paidin_capin(
         "CTS": cts,
         "GB1": gb1,
         "F_DT": f_dt,
-        "T_DT": t_dt,
-        "SHT_CD": sht_cd,
-    }
-
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_paidin_capin(
-                cts,
-                gb1,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+        "T_DT": t_dt,
+        "SHT_CD": sht_cd,
+    }
+
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -8998,12 +6841,6 @@ def ksdinfo_pub_offer(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669108C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/pub-offer"
@@ -9015,43 +6852,9 @@ def ksdinfo_pub_offer(
         "T_DT": t_dt,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_pub_offer(
-                sht_cd,
-                cts,
-                f_dt,
-                t_dt,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -9101,12 +6904,6 @@ def ksdinfo_purreq(
         logger.error("f_dt is required. (e.g. '20231001')")
         raise ValueError("f_dt is required. (e.g. '20231001')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669103C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/purreq"
@@ -9118,46 +6915,9 @@ def ksdinfo_purreq(
         "CTS": cts,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_purreq(
-                sht_cd,
-                t_dt,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 에러 처리
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -9214,12 +6974,6 @@ def ksdinfo_rev_split(
         logger.error("market_gb must be one of ['0', '1', '2'].")
         raise ValueError("market_gb must be one of ['0', '1', '2'].")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669105C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/rev-split"
@@ -9232,44 +6986,9 @@ def ksdinfo_rev_split(
         "MARKET_GB": market_gb,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_rev_split(
-                sht_cd,
-                cts,
-                f_dt,
-                t_dt,
-                market_gb,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -9320,12 +7039,6 @@ def ksdinfo_sharehld_meet(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669111C0"
 
     api_url = "/uapi/domestic-stock/v1/ksdinfo/sharehld-meet"
@@ -9337,40 +7050,9 @@ def ksdinfo_sharehld_meet(
         "SHT_CD": sht_cd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_sharehld_meet(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output1", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -9432,12 +7114,6 @@ def lendable_by_company(
         logger.error("inqr_dvsn_1 is required. (e.g. '0')")
         raise ValueError("inqr_dvsn_1 is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "CTSC2702R"
 
     api_url = "/uapi/domestic-stock/v1/quotations/lendable-by-company"
@@ -9451,75 +7127,9 @@ def lendable_by_company(
         "CTX_AREA_NK100": ctx_area_nk100,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat(
-                        [dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat(
-                        [dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return lendable_by_company(
-                excg_dvsn_cd,
-                pdno,
-                thco_stln_psbl_yn,
-                inqr_dvsn_1,
-                ctx_area_fk200,
-                ctx_area_nk100,
-                dataframe1, dataframe2, "N", depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -9604,42 +7214,9 @@ def market_cap(
         "fid_vol_cnt": fid_vol_cnt,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        current_data = pd.DataFrame(res.getBody().output) if hasattr(
-            res.getBody(), 'output') else pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        dataframe = pd.concat(
-            [dataframe, current_data], ignore_index=True) if dataframe is not None else current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return market_cap(
-                fid_input_price_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_vol_cnt,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        # 오류 출력
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -9668,7 +7245,7 @@ def market_time() -> pd.DataFrame:
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        result = pd.DataFrame([res.getBody().output1])
+        result = res.frame("output1")
         return result
     else:
         res.printError(url=api_url)
@@ -9779,51 +7356,9 @@ def market_value(
         "fid_trgt_exls_cls_code": fid_trgt_exls_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return market_value(
-                fid_trgt_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_input_option_1,
-                fid_input_option_2,
-                fid_rank_sort_cls_code,
-                fid_blng_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        # 오류 처리
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -9862,7 +7397,7 @@ def mktfunds(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -9968,50 +7503,9 @@ def near_new_highlow(
         "fid_aply_rang_prc_2": fid_aply_rang_prc_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return near_new_highlow(
-                fid_aply_rang_vol,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_input_cnt_1,
-                fid_input_cnt_2,
-                fid_prc_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_aply_rang_prc_1,
-                fid_aply_rang_prc_2,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        # 오류 발생 시 처리
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -10067,12 +7561,6 @@ def news_title(
         ... )
         >>> print(df)
     """
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API URL 및 거래 ID 설정
     tr_id = "FHKST01011800"
 
@@ -10091,49 +7579,9 @@ def news_title(
         "FID_INPUT_SRNO": fid_input_srno,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 응답 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return news_title(
-                fid_news_ofer_entp_code,
-                fid_cond_mrkt_cls_code,
-                fid_input_iscd,
-                fid_titl_cntt,
-                fid_input_date_1,
-                fid_input_hour_1,
-                fid_rank_sort_cls_code,
-                fid_input_srno,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -10254,7 +7702,7 @@ def order_cash(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -10423,7 +7871,7 @@ def order_credit(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -10558,7 +8006,7 @@ def order_resv(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -10646,13 +8094,6 @@ def order_resv_ccnl(
     if cncl_yn == "":
         raise ValueError("cncl_yn is required (e.g. 'Y')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "CTSC0004R"  # 주식예약주문조회
 
     api_url = "/uapi/domestic-stock/v1/trading/order-resv-ccnl"
@@ -10672,34 +8113,10 @@ def order_resv_ccnl(
         "CTX_AREA_NK200": NK200  # 연속조회키200
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK200 = res.getBody().ctx_area_fk200
-        NK200 = res.getBody().ctx_area_nk200
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return order_resv_ccnl(
-                rsvn_ord_ord_dt, rsvn_ord_end_dt, tmnl_mdia_kind_cd, cano, acnt_prdt_cd,
-                prcs_dvsn_cd, cncl_yn, rsvn_ord_seq, pdno, sll_buy_dvsn_cd,
-                FK200, NK200, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK200": "ctx_area_fk200", "CTX_AREA_NK200": "ctx_area_nk200"})
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -10818,7 +8235,7 @@ def order_resv_rvsecncl(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -10941,7 +8358,7 @@ def order_rvsecncl(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        return pd.DataFrame([res.getBody().output])
+        return res.frame("output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -11018,7 +8435,7 @@ def overtime_exp_trans_fluct(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -11102,12 +8519,6 @@ def overtime_fluctuation(
         logger.error("fid_div_cls_code is required. (e.g. '1')")
         raise ValueError("fid_div_cls_code is required. (e.g. '1')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST02340000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/overtime-fluctuation"
@@ -11125,61 +8536,9 @@ def overtime_fluctuation(
         "FID_TRGT_EXLS_CLS_CODE": fid_trgt_exls_cls_code,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-        else:
-            dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-        else:
-            dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return overtime_fluctuation(
-                fid_cond_mrkt_div_code,
-                fid_mrkt_cls_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -11258,12 +8617,6 @@ def overtime_volume(
         logger.error("fid_rank_sort_cls_code is required. (e.g. '2')")
         raise ValueError("fid_rank_sort_cls_code is required. (e.g. '2')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST02350000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/overtime-volume"
@@ -11280,60 +8633,9 @@ def overtime_volume(
         "FID_TRGT_EXLS_CLS_CODE": fid_trgt_exls_cls_code,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-        else:
-            dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(
-                    output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-        else:
-            dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return overtime_volume(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -11390,10 +8692,10 @@ def pbar_tratio(
 
     if res.isOK():
         # output1 (object) - 단일 객체를 DataFrame으로 변환
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = res.frame("output1")
 
         # output2 (array) - 배열을 DataFrame으로 변환
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -11458,14 +8760,6 @@ def pension_inquire_balance(
     if inqr_dvsn == "" or inqr_dvsn is None:
         raise ValueError("inqr_dvsn is required (e.g. '00')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC2208R"  # 퇴직연금 잔고조회
 
     api_url = "/uapi/domestic-stock/v1/trading/pension/inquire-balance"
@@ -11479,42 +8773,10 @@ def pension_inquire_balance(
         "CTX_AREA_NK100": NK100  # 연속조회키100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리 (array)
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat(
-                [dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리 (object)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat(
-                [dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return pension_inquire_balance(
-                cano, acnt_prdt_cd, acca_dvsn_cd, inqr_dvsn, FK100, NK100, "N", dataframe1, dataframe2, depth + 1,
-                max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output1", "output2", frames=(dataframe1, dataframe2))
 
 
 ##############################################################################################
@@ -11582,13 +8844,6 @@ def pension_inquire_daily_ccld(
     if inqr_dvsn_3 == "":
         raise ValueError("inqr_dvsn_3 is required (e.g. '00: 전체')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "TTTC2201R"  # 퇴직연금 미체결내역
 
     api_url = "/uapi/domestic-stock/v1/trading/pension/inquire-daily-ccld"
@@ -11604,33 +8859,10 @@ def pension_inquire_daily_ccld(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return pension_inquire_daily_ccld(
-                cano, acnt_prdt_cd, user_dvsn_cd, sll_buy_dvsn_cd, ccld_nccs_dvsn, inqr_dvsn_3, FK100, NK100, "N",
-                dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -11681,7 +8913,7 @@ def pension_inquire_deposit(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -11747,10 +8979,10 @@ def pension_inquire_present_balance(
 
     if res.isOK():
         # output1 (array) - 보유종목 정보
-        output1_data = pd.DataFrame(res.getBody().output1)
+        output1_data = res.frame("output1")
 
         # output2 (array) - 계좌 요약 정보
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = res.frame("output2")
 
         return output1_data, output2_data
     else:
@@ -11841,7 +9073,7 @@ def pension_inquire_psbl_order(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -11915,13 +9147,6 @@ def period_rights(
     if inqr_end_dt == "":
         raise ValueError("inqr_end_dt is required (e.g. '20250103')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "CTRGA011R"  # 기간별계좌권리현황조회
 
     api_url = "/uapi/domestic-stock/v1/trading/period-rights"
@@ -11941,34 +9166,10 @@ def period_rights(
         "CTX_AREA_FK100": FK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return period_rights(
-                inqr_dvsn, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt,
-                cust_rncno25, hmid, rght_type_cd, pdno, prdt_type_cd,
-                NK100, FK100, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth,
+                         cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"})
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -12047,12 +9248,6 @@ def prefer_disparate_ratio(
         logger.error("fid_trgt_exls_cls_code is required. (e.g. '0')")
         raise ValueError("fid_trgt_exls_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01770000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/prefer-disparate-ratio"
@@ -12069,47 +9264,9 @@ def prefer_disparate_ratio(
         "fid_input_price_2": fid_input_price_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return prefer_disparate_ratio(
-                fid_vol_cnt,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 에러 처리
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -12218,51 +9375,9 @@ def profit_asset_index(
         "fid_trgt_exls_cls_code": fid_trgt_exls_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return profit_asset_index(
-                fid_cond_mrkt_div_code,
-                fid_trgt_cls_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_input_option_1,
-                fid_input_option_2,
-                fid_rank_sort_cls_code,
-                fid_blng_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        # 오류 처리
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -12310,7 +9425,7 @@ def program_trade_by_stock(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -12365,7 +9480,7 @@ def program_trade_by_stock_daily(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -12426,7 +9541,7 @@ def psearch_result(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = res.frame("output2")
         return current_data
     else:
         res.printError(url=api_url)
@@ -12477,7 +9592,7 @@ def psearch_title(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = res.frame("output2")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -12573,48 +9688,9 @@ def quote_balance(
         "fid_input_price_2": fid_input_price_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return quote_balance(
-                fid_vol_cnt,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_div_cls_code,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        # 오류 출력
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -12661,12 +9737,6 @@ def search_info(
         logger.error("prdt_type_cd is required. (e.g. '300')")
         raise ValueError("prdt_type_cd is required. (e.g. '300')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "CTPF1604R"
@@ -12680,44 +9750,9 @@ def search_info(
         "PRDT_TYPE_CD": prdt_type_cd,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 응답 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return search_info(
-                pdno,
-                prdt_type_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -12764,12 +9799,6 @@ def search_stock_info(
         logger.error("pdno is required. (e.g. '000660')")
         raise ValueError("pdno is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "CTPF1002R"
 
     api_url = "/uapi/domestic-stock/v1/quotations/search-stock-info"
@@ -12779,43 +9808,9 @@ def search_stock_info(
         "PDNO": pdno,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return search_stock_info(
-                prdt_type_cd,
-                pdno,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -12894,12 +9889,6 @@ def short_sale(
         logger.error("fid_input_cnt_1 is required. (e.g. '0')")
         return None
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST04820000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/short-sale"
@@ -12917,46 +9906,9 @@ def short_sale(
         "FID_APLY_RANG_PRC_2": fid_aply_rang_prc_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return short_sale(
-                fid_aply_rang_vol,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_period_div_code,
-                fid_input_cnt_1,
-                fid_trgt_exls_cls_code,
-                fid_trgt_cls_code,
-                fid_aply_rang_prc_1,
-                fid_aply_rang_prc_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -13042,12 +9994,6 @@ def top_interest_stock(
         raise ValueError(
             "fid_div_cls_code is required. (e.g. '0', '1', '2', '3', '4', '5', '6', '7')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01800000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/top-interest-stock"
@@ -13066,47 +10012,9 @@ def top_interest_stock(
         "fid_input_cnt_1": fid_input_cnt_1,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return top_interest_stock(
-                fid_input_iscd_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_div_cls_code,
-                fid_input_cnt_1,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -13208,12 +10116,6 @@ def traded_by_company(
         logger.error("fid_aply_rang_vol is required. (e.g. '0', '100')")
         return None
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01860000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/traded-by-company"
@@ -13233,50 +10135,9 @@ def traded_by_company(
         "fid_aply_rang_prc_1": fid_aply_rang_prc_1,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return traded_by_company(
-                fid_trgt_exls_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_rank_sort_cls_code,
-                fid_input_date_1,
-                fid_input_date_2,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_aply_rang_vol,
-                fid_aply_rang_prc_2,
-                fid_aply_rang_prc_1,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 에러 처리
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -13327,7 +10188,7 @@ def tradprt_byamt(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = res.frame("output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -13412,12 +10273,6 @@ def volume_power(
         logger.error("fid_trgt_cls_code is required. (e.g. '0')")
         raise ValueError("fid_trgt_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01680000"
 
     api_url = "/uapi/domestic-stock/v1/ranking/volume-power"
@@ -13434,47 +10289,9 @@ def volume_power(
         "fid_trgt_cls_code": fid_trgt_cls_code,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return volume_power(
-                fid_trgt_exls_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_trgt_cls_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 에러 처리
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -13563,36 +10380,9 @@ def volume_rank(
         "FID_INPUT_DATE_1": fid_input_date_1
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":  # 다음 페이지 존재
-            print("Call Next")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return volume_rank(
-                fid_cond_mrkt_div_code, fid_cond_scr_div_code, fid_input_iscd,
-                fid_div_cls_code, fid_blng_cls_code, fid_trgt_cls_code,
-                fid_trgt_exls_cls_code, fid_input_price_1, fid_input_price_2,
-                fid_vol_cnt, fid_input_date_1, "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
-    else:
-        res.printError(api_url)
-        return pd.DataFrame()
+    # 연속조회(tr_cont)는 공용 페이지네이터가 반복 호출하며 처리
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
 
 
 ##############################################################################################
@@ -13642,12 +10432,6 @@ def inquire_psbl_sell(
         logger.error("pdno is required. (e.g. '000660')")
         raise ValueError("pdno is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning(
-            "Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "TTTC8408R"
 
     api_url = "/uapi/domestic-stock/v1/trading/inquire-psbl-sell"
@@ -13658,39 +10442,6 @@ def inquire_psbl_sell(
         "PDNO": pdno,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_psbl_sell(
-                cano,
-                acnt_prdt_cd,
-                pdno,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        logger.error("API call failed: %s - %s",
-                     res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    # API 호출 (연속조회는 공용 페이지네이터가 반복 호출하며 처리)
+    pages = kp.Paginator(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth, more=("M",))
+    return pages.collect("output", frames=(dataframe,))
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS REST API 비동기(asyncio) 클라이언트  |=====================
+# 동기 함수(kis_auth._url_fetch, domestic_stock_functions.*)와 같은 연결 풀 / rate limiter 를 공유합니다.
+#
+# 사용 예:
+#     import asyncio
+#     from api.functions import kis_async as kaa
+#
+#     async def main(codes):
+#         return await asyncio.gather(*[
+#             kaa.inquire_price(env_dv="real", fid_cond_mrkt_div_code="J", fid_input_iscd=code)
+#             for code in codes
+#         ])
+#
+# rate limiter 대기는 이벤트 루프에서 asyncio.sleep 으로 처리하고, 실제 HTTP 호출만
+# 연결 풀 크기만큼의 전용 스레드에서 실행하므로 수백 개의 코루틴이 동시에 대기해도 스레드를 점유하지 않습니다.
+# domestic_stock_functions 래퍼(kis_async.inquire_price 등)는 첫 요청의 서버 한도를 루프에서 미리 받고,
+# 연속조회 다음 페이지나 TR 별 한도(set_tr_rate)처럼 래퍼 안에서 더 필요한 대기만 스레드에서 기다립니다.
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import api.functions.kis_auth as ka
+
+_executor = None
+_executor_lock = threading.Lock()
+_async_funcs = {}
+
+
+def _getExecutor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # 연결 풀 크기보다 많은 스레드는 연결을 기다리기만 하므로 같은 크기로 맞춤
+                workers = int(os.getenv("KIS_ASYNC_WORKERS", str(ka._pool_size)))
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kis-async")
+    return _executor
+
+
+async def _run(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_getExecutor(), functools.partial(func, *args, **kwargs))
+
+
+async def acquire(ptr_id=None):
+    """rate limiter 토큰을 이벤트 루프를 막지 않고 기다립니다."""
+    if ka._rate_limiter is None:
+        return 0.0
+    tr_id = ka._getTrId(ptr_id) if ptr_id else None
+    wait = ka._rate_limiter.reserve(ka._getServer(), tr_id)
+    if wait > 0:
+        await asyncio.sleep(wait)
+    return wait
+
+
+def _cachedQuote(api_url, ptr_id, params, postFlag):
+    # 시세 캐시에 보관 중인 응답 (캐시 적중에는 rate limiter 한도를 쓰지 않음)
+    cache = ka._quote_cache
+    if cache is None or postFlag:
+        return None
+    key = cache.key(ka._getServer(), ka._getTrId(ptr_id), api_url, params)
+    return cache.get(key) if key is not None else None
+
+
+def _callPrepaid(func, *args, **kwargs):
+    # 이벤트 루프에서 받은 허가 하나를 이 스레드의 첫 요청에 사용 (쓰지 않은 허가는 버림)
+    ka._prepaid.permits = 1
+    try:
+        return func(*args, **kwargs)
+    finally:
+        ka._prepaid.permits = 0
+
+
+async def url_fetch(api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True,
+                    timeout=None):
+    """
+    kis_auth._url_fetch 의 비동기 버전.
+    시세 캐시에 있으면 한도를 쓰지 않고 바로 돌려주고, 아니면 첫 요청의 서버 한도를 코루틴에서 기다린 뒤
+    공유 연결 풀을 사용하는 스레드에서 보냅니다. (재시도는 동기 호출처럼 다시 rate limiter 를 거침)
+
+    Returns:
+        APIResp | APIRespError: _url_fetch 와 동일
+    """
+    cached = _cachedQuote(api_url, ptr_id, params, postFlag)
+    if cached is not None:
+        return cached
+    await acquire()
+    return await _run(_callPrepaid, ka._url_fetch, api_url, ptr_id, tr_cont, params, appendHeaders, postFlag,
+                      hashFlag, timeout)
+
+
+def make_async(func):
+    """
+    domestic_stock_functions 의 동기 래퍼를 코루틴 함수로 감쌉니다.
+    첫 요청의 서버 한도는 이벤트 루프에서 기다린 뒤 스레드에서 실행하므로, 한도를 기다리는 동안 스레드를 점유하지 않습니다.
+    한도는 동기 호출과 같은 rate limiter 에 합산되며, 연속조회 다음 페이지는 스레드에서 기다립니다.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        await acquire()
+        return await _run(_callPrepaid, func, *args, **kwargs)
+
+    return wrapper
+
+
+def __getattr__(name):
+    # kis_async.inquire_price 처럼 domestic_stock_functions 의 함수 이름으로 비동기 버전을 바로 사용
+    if name.startswith("_"):
+        raise AttributeError(name)
+    func = _async_funcs.get(name)
+    if func is None:
+        from api.functions import domestic_stock_functions as dsf
+        target = getattr(dsf, name, None)
+        if not inspect.isfunction(target) or target.__module__ != dsf.__name__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        func = _async_funcs.setdefault(name, make_async(target))
+    return func
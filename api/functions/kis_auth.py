@@ -3,21 +3,50 @@
 # ====|  API 호출 공통 함수 포함                                  |=====================
 
 import asyncio
-import copy
 import json
 import logging
 import os
+import threading
 import time
 from base64 import b64decode
 from collections import namedtuple
 from collections.abc import Callable
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime
 from io import StringIO
+from urllib.parse import urlsplit
 
 import pandas as pd
 
 # pip install requests (패키지설치)
 import requests
+from requests.adapters import HTTPAdapter
+
+# 웹소켓 암호화 데이터(체결통보) 복호화: pip install pycryptodome (없으면 cryptography 패키지 사용)
+try:
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import unpad
+except ImportError:
+    AES = unpad = None
+try:
+    from cryptography.hazmat.primitives import padding as _padding
+    from cryptography.hazmat.primitives.ciphers import Cipher as _Cipher, algorithms as _algorithms, modes as _modes
+except ImportError:
+    _Cipher = None
+# 응답 JSON 파싱: pip install orjson (없으면 표준 json 모듈 사용)
+try:
+    from orjson import loads as _jsonLoads
+except ImportError:
+    _jsonLoads = json.loads
+
+from api.functions.kis_metrics import RATE_LIMIT_CODE, get_metrics
+from api.functions.kis_quote_cache import quote_cache_from_env
+from api.functions.kis_ratelimit import limiter_from_env
+from api.functions.kis_retry import breaker_from_env, call_with_retry, retry_policy_from_env
+from api.functions.kis_schema import to_frame
+from api.functions.kis_token import TokenCache, cache_from_env
+from api.functions.kis_transport import replay_from_env, transport_from_env
 
 
 def clearConsole(): return os.system(
@@ -28,15 +57,13 @@ key_bytes = 32
 config_root = 'api/data'
 # config_root = os.path.join(os.path.expanduser("~"), "KIS", "config")
 # config_root = "$HOME/KIS/config/"  # 토큰 파일이 저장될 폴더, 제3자가 찾기 어렵도록 경로 설정하시기 바랍니다.
-# token_tmp = config_root + 'KIS000000'  # 토큰 로컬저장시 파일 이름 지정, 파일이름을 토큰값이 유추가능한 파일명은 삼가바랍니다.
-# token_tmp = config_root + 'KIS' + datetime.today().strftime("%Y%m%d%H%M%S")  # 토큰 로컬저장시 파일명 년월일시분초
-token_tmp = os.path.join(
-    config_root, f".KIS{datetime.today().strftime("%Y%m%d")}"
-)  # 토큰 로컬저장시 파일명 년월일
-
-# 접근토큰 관리하는 파일 존재여부 체크, 없으면 생성
-if os.path.exists(token_tmp) == False:
-    f = open(token_tmp, "w+")
+# 접근토큰은 (서버, 앱키) 별로 메모리와 파일(KIS_TOKEN_PATH, 기본 api/data/.kis_token.json)에 캐시합니다.
+# 파일이름으로 토큰값이 유추되지 않도록 하고, 제3자가 읽을 수 없는 위치로 지정하시기 바랍니다.
+_token_cache = cache_from_env(config_root)
+# 재생 transport 를 쓰는 동안 치워 둔 토큰 캐시 (재생 토큰이 토큰 파일에 저장되지 않도록 메모리 전용 캐시를 사용)
+_live_token_cache = None
+if replay_from_env():
+    _live_token_cache, _token_cache = _token_cache, TokenCache(refresh_margin=_token_cache.refresh_margin)
 
 
 _TRENV = tuple()
@@ -46,6 +73,25 @@ _DEBUG = False
 _isPaper = False
 _smartSleep = 0.1
 
+# HTTP 연결 풀 설정 : KIS 서버와의 TCP/TLS 연결을 keep-alive 로 재사용
+_pool_size = int(os.getenv("KIS_POOL_SIZE", "10"))  # 호스트당 유지할 연결 수
+_connect_timeout = float(os.getenv("KIS_CONNECT_TIMEOUT", "3.05"))  # 연결 타임아웃(초)
+_read_timeout = float(os.getenv("KIS_READ_TIMEOUT", "10"))  # 응답 타임아웃(초)
+_session = None
+_session_lock = threading.Lock()
+
+# 서버(prod/vps)별 초당 호출 한도, _url_fetch 가 호출 전에 필요한 만큼만 대기
+_rate_limiter = limiter_from_env()
+# 비동기 클라이언트(kis_async)가 이벤트 루프에서 미리 받아 둔 서버 한도 허가 수 (스레드별, permits)
+_prepaid = threading.local()
+
+# 시세 TR 단기 캐시 (같은 종목 현재가를 짧은 시간 안에 여러 번 조회하면 한 번만 요청)
+_quote_cache = quote_cache_from_env()
+
+# 일시적인 실패 재시도 정책, KIS 장애 시 바로 실패시키는 호스트별 서킷 브레이커 (주문은 처리되지 않은 경우에만 재시도)
+_retry_policy = retry_policy_from_env()
+_circuit_breaker = breaker_from_env()
+
 # 기본 헤더값 정의
 _base_headers = {
     "Content-Type": "application/json",
@@ -54,46 +100,133 @@ _base_headers = {
     "User-Agent": os.getenv("my_agent"),
 }
 
+# (서버, TR id) 별 요청 헤더 템플릿 (읽기 전용), 인증으로 _base_headers 가 바뀔 때만 다시 만듦
+_header_templates = {}
+# 접근토큰을 미리 재발급해야 하는 시각(epoch 초), 인증할 때 한 번 계산해 두고 요청마다 비교만 함
+_reauth_at = 0.0
+# 마지막 auth() 의 (svr, product), 자동 재발급 때 같은 서버(실전/모의)로 다시 인증
+_auth_args = ("prod", os.getenv("my_prod"))
+
+
+def _newSession(pool_size):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=False)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 모든 REST 호출이 공유하는 연결 풀 세션 (최초 사용 시 생성, KIS_CASSETTE 가 있으면 기록/재생 transport 로 감쌈)
+def _getSession():
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = transport_from_env(_newSession(_pool_size))
+                _useTokenCache(_session)
+    return _session
+
+
+# 재생 transport(offline)면 메모리 전용 토큰 캐시로, 실제 세션으로 돌아오면 원래 토큰 캐시로 바꿈
+def _useTokenCache(session):
+    global _token_cache, _live_token_cache
+    if getattr(session, "offline", False):
+        if _live_token_cache is None:
+            _live_token_cache, _token_cache = _token_cache, TokenCache(refresh_margin=_token_cache.refresh_margin)
+    elif _live_token_cache is not None:
+        _token_cache, _live_token_cache = _live_token_cache, None
+
+
+def _getTimeout(timeout=None):
+    if timeout is not None:
+        return timeout
+    return (_connect_timeout, _read_timeout)
+
+
+# 연결 풀 크기 / 타임아웃 변경, session 을 넘기면 해당 세션(또는 kis_transport 같은 get/post/close 호환 객체)을 그대로 사용
+def configure_session(pool_size=None, connect_timeout=None, read_timeout=None, session=None):
+    global _session, _pool_size, _connect_timeout, _read_timeout
+    if connect_timeout is not None:
+        _connect_timeout = connect_timeout
+    if read_timeout is not None:
+        _read_timeout = read_timeout
+    with _session_lock:
+        if pool_size is not None:
+            _pool_size = pool_size
+        old = _session
+        _session = session if session is not None else _newSession(_pool_size)
+        _useTokenCache(_session)
+    if old is not None and old is not _session:
+        old.close()
+
+
+# 앱키 환경변수 이름 (앱키, 앱시크리트)
+def _getAppKeyNames(svr="prod"):
+    if svr == "vps":  # 모의투자
+        return "paper_app", "paper_sec"
+    return "my_app", "my_sec"  # 실전투자
+
 
 # 토큰 발급 받아 저장 (토큰값, 토큰 유효시간,1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
-def save_token(my_token, my_expired):
-    # print(type(my_expired), my_expired)
+def save_token(my_token, my_expired, svr="prod"):
     valid_date = datetime.strptime(my_expired, "%Y-%m-%d %H:%M:%S")
-    # print('Save token date: ', valid_date)
-    with open(token_tmp, "w", encoding="utf-8") as f:
-        f.write(f"token: {my_token}\n")
-        f.write(f"valid-date: {valid_date}\n")
+    store = _token_cache.store
+    if store is not None:
+        with store.lock():
+            store.save(svr, os.getenv(_getAppKeyNames(svr)[0]), my_token, valid_date.timestamp())
+    _token_cache.invalidate(svr, os.getenv(_getAppKeyNames(svr)[0]))
+
+
+# 토큰 확인 (만료되지 않은 저장 토큰, 없으면 None)
+def read_token(svr="prod"):
+    return _token_cache.peek(svr, os.getenv(_getAppKeyNames(svr)[0]))
 
 
-# 토큰 확인 (토큰값, 토큰 유효시간_1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
-def read_token():
+# 토큰 발급 요청 (/oauth2/tokenP), 1분당 1회로 제한되므로 _token_cache 를 통해서만 호출
+def _issueToken(svr, p):
+    url = f"{os.getenv(svr)}/oauth2/tokenP"
     try:
-        # 토큰이 저장된 파일 읽기
-        with open(token_tmp, encoding="UTF-8") as f:
-            tkg_tmp = yaml.load(f, Loader=yaml.FullLoader)
-
-        # 토큰 만료 일,시간
-        exp_dt = datetime.strftime(tkg_tmp["valid-date"], "%Y-%m-%d %H:%M:%S")
-        # 현재일자,시간
-        now_dt = datetime.today().strftime("%Y-%m-%d %H:%M:%S")
-
-        # print('expire dt: ', exp_dt, ' vs now dt:', now_dt)
-        # 저장된 토큰 만료일자 체크 (만료일시 > 현재일시 인경우 보관 토큰 리턴)
-        if exp_dt > now_dt:
-            return tkg_tmp["token"]
-        else:
-            # print('Need new token: ', tkg_tmp['valid-date'])
-            return None
-    except Exception:
-        # print('read token error: ', e)
+        res = _getSession().post(
+            url, data=json.dumps(p), headers=dict(_base_headers), timeout=_getTimeout()
+        )  # 토큰 발급
+    except requests.RequestException as e:
+        logging.error(f"Token request failed : {e}")
         return None
 
+    if res.status_code != 200:
+        logging.error(f"Token request failed : {res.status_code} {res.text}")
+        return None
+
+    result = _getResultObject(res.json())
+    return result.access_token, result.access_token_token_expired  # 토큰값, 만료일시
+
 
 # 토큰 유효시간 체크해서 만료된 토큰이면 재발급처리
+def _checkReAuth():
+    if _autoReAuth and time.time() >= _reauth_at:
+        reAuth(*_auth_args)
+
+
 def _getBaseHeader():
-    if _autoReAuth:
-        reAuth()
-    return copy.deepcopy(_base_headers)
+    _checkReAuth()
+    return dict(_base_headers)  # 값이 모두 문자열이므로 얕은 복사로 충분
+
+
+# 요청 헤더: (서버, TR id) 템플릿에 호출마다 달라지는 tr_cont / 추가 헤더만 얹은 새 dict
+def _requestHeaders(tr_id, tr_cont, appendHeaders=None):
+    _checkReAuth()
+    key = (_isPaper, tr_id)
+    template = _header_templates.get(key)
+    if template is None:
+        template = _header_templates[key] = MappingProxyType({
+            **_base_headers,
+            "tr_id": tr_id,  # 트랜젝션 TR id
+            "custtype": "P",  # 일반(개인고객,법인고객) "P", 제휴사 "B"
+        })
+    headers = {**template, "tr_cont": tr_cont}  # 연속 거래 여부
+    if appendHeaders:
+        headers.update(appendHeaders)
+    return headers
 
 
 # 가져오기 : 앱키, 앱시크리트, 종합계좌번호(계좌번호 중 숫자8자리), 계좌상품코드(계좌번호 중 숫자2자리), 토큰, 도메인
@@ -129,7 +262,7 @@ def isPaperTrading():  # 모의투자 매매
 def changeTREnv(token_key, svr="prod", product=os.getenv("my_prod")):
     cfg = dict()
 
-    global _isPaper
+    global _isPaper, _smartSleep
     if svr == "prod":  # 실전투자
         ak1 = "my_app"  # 실전투자용 앱키
         ak2 = "my_sec"  # 실전투자용 앱시크리트
@@ -167,17 +300,16 @@ def changeTREnv(token_key, svr="prod", product=os.getenv("my_prod")):
         my_token = _TRENV.my_token
     except AttributeError:
         my_token = ""
-    cfg["my_token"] = my_token if token_key else token_key
+    cfg["my_token"] = token_key if token_key else my_token  # None 이면 기존 토큰 유지
     cfg["my_url_ws"] = os.getenv("ops" if svr == "prod" else "vops")
 
     # print(cfg)
     _setTRENV(cfg)
+    _header_templates.clear()  # 실전/모의 전환 후 이전 환경의 헤더 템플릿을 쓰지 않도록
 
 
 def _getResultObject(json_data):
-    _tc_ = namedtuple("res", json_data.keys())
-
-    return _tc_(**json_data)
+    return _recordType("res", tuple(json_data))(**json_data)
 
 
 # Token 발급, 유효기간 1일, 6시간 이내 발급시 기존 token값 유지, 발급시 알림톡 무조건 발송
@@ -188,37 +320,17 @@ def auth(svr="prod", product=os.getenv("my_prod"), url=None):
     }
     # 개인 환경파일 "kis_devlp.yaml" 파일을 참조하여 앱키, 앱시크리트 정보 가져오기
     # 개인 환경파일명과 위치는 고객님만 아는 위치로 설정 바랍니다.
-    if svr == "prod":  # 실전투자
-        ak1 = "my_app"  # 앱키 (실전투자용)
-        ak2 = "my_sec"  # 앱시크리트 (실전투자용)
-    elif svr == "vps":  # 모의투자
-        ak1 = "paper_app"  # 앱키 (모의투자용)
-        ak2 = "paper_sec"  # 앱시크리트 (모의투자용)
+    ak1, ak2 = _getAppKeyNames(svr)
 
     # 앱키, 앱시크리트 가져오기
     p["appkey"] = os.getenv(ak1)
     p["appsecret"] = os.getenv(ak2)
 
-    # 기존 발급된 토큰이 있는지 확인
-    saved_token = read_token()  # 기존 발급 토큰 확인
-    # print("saved_token: ", saved_token)
-    if saved_token is None:  # 기존 발급 토큰 확인이 안되면 발급처리
-        url = f"{os.getenv(svr)}/oauth2/tokenP"
-        res = requests.post(
-            url, data=json.dumps(p), headers=_getBaseHeader()
-        )  # 토큰 발급
-        rescode = res.status_code
-        if rescode == 200:  # 토큰 정상 발급
-            my_token = _getResultObject(res.json()).access_token  # 토큰값 가져오기
-            my_expired = _getResultObject(
-                res.json()
-            ).access_token_token_expired  # 토큰값 만료일시 가져오기
-            save_token(my_token, my_expired)  # 새로 발급 받은 토큰 저장
-        else:
-            print("Get Authentification token fail!\nYou have to restart your app!!!")
-            return
-    else:
-        my_token = saved_token  # 기존 발급 토큰 확인되어 기존 토큰 사용
+    # 메모리/파일에 캐시된 토큰을 사용하고, 없거나 곧 만료되면 한 번만 발급
+    my_token = _token_cache.get(svr, p["appkey"], lambda: _issueToken(svr, p))
+    if my_token is None:
+        print("Get Authentification token fail!\nYou have to restart your app!!!")
+        return
 
     # 발급토큰 정보 포함해서 헤더값 저장 관리, API 호출시 필요
     changeTREnv(my_token, svr, product)
@@ -226,9 +338,12 @@ def auth(svr="prod", product=os.getenv("my_prod"), url=None):
     _base_headers["authorization"] = f"Bearer {my_token}"
     _base_headers["appkey"] = _TRENV.my_app
     _base_headers["appsecret"] = _TRENV.my_sec
+    _header_templates.clear()
 
-    global _last_auth_time
+    global _last_auth_time, _reauth_at, _auth_args
     _last_auth_time = datetime.now()
+    _reauth_at = _token_cache.refresh_at(svr, p["appkey"])
+    _auth_args = (svr, product)
 
     if _DEBUG:
         print(f"[{_last_auth_time}] => get AUTH Key completed!")
@@ -237,12 +352,45 @@ def auth(svr="prod", product=os.getenv("my_prod"), url=None):
 # end of initialize, 토큰 재발급, 토큰 발급시 유효시간 1일
 # 프로그램 실행시 _last_auth_time에 저장하여 유효시간 체크, 유효시간 만료시 토큰 발급 처리
 def reAuth(svr="prod", product=os.getenv("my_prod")):
-    n2 = datetime.now()
-    if (n2 - _last_auth_time).seconds >= 86400:  # 유효시간 1일
+    # 토큰이 만료 임박(KIS_TOKEN_REFRESH_MARGIN 이내)이면 만료 전에 미리 재발급
+    if _token_cache.needs_refresh(svr, os.getenv(_getAppKeyNames(svr)[0])):
         auth(svr, product)
 
 
+# 현재 접속 서버 구분 (rate limiter 키)
+def _getServer():
+    return "vps" if _isPaper else "prod"
+
+
+# rate limiter 교체 (None 이면 속도 제한 없이 smart_sleep 의 고정 지연만 사용)
+def set_rate_limiter(limiter):
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+# 시세 캐시 교체 (None 이면 캐시 사용 안 함)
+def set_quote_cache(cache):
+    global _quote_cache
+    _quote_cache = cache
+
+
+# 재시도 정책 교체 (None 이면 재시도 안 함)
+def set_retry_policy(policy):
+    global _retry_policy
+    _retry_policy = policy
+
+
+# 서킷 브레이커 교체 (None 이면 사용 안 함)
+def set_circuit_breaker(breaker):
+    global _circuit_breaker
+    _circuit_breaker = breaker
+
+
+# 연속조회 페이지 사이 지연, rate limiter 가 있으면 _url_fetch 가 필요한 만큼 대기하므로 고정 지연 없음
 def smart_sleep():
+    if _rate_limiter is not None:
+        return
+
     if _DEBUG:
         print(f"[RateLimit] Sleeping {_smartSleep}s ")
 
@@ -260,7 +408,7 @@ def getTREnv():
 def set_order_hash_key(h, p):
     url = f"{getTREnv().my_url}/uapi/hashkey"  # hashkey 발급 API URL
 
-    res = requests.post(url, data=json.dumps(p), headers=h)
+    res = _getSession().post(url, data=json.dumps(p), headers=h, timeout=_getTimeout())
     rescode = res.status_code
     if rescode == 200:
         h["hashkey"] = _getResultObject(res.json()).HASH
@@ -268,13 +416,21 @@ def set_order_hash_key(h, p):
         print("Error:", rescode)
 
 
+# 응답 header/body 레코드 타입 (같은 필드 구성이면 namedtuple 클래스를 다시 만들지 않고 재사용)
+@lru_cache(maxsize=1024)
+def _recordType(name, fields):
+    return namedtuple(name, fields)
+
+
 # API 호출 응답에 필요한 처리 공통 함수
 class APIResp:
-    def __init__(self, resp):
+    def __init__(self, resp, tr_id=None):
         self._rescode = resp.status_code
         self._resp = resp
+        self._data = _jsonLoads(resp.content)  # 응답 JSON 은 한 번만 파싱
         self._header = self._setHeader()
         self._body = self._setBody()
+        self._tr_id = tr_id or getattr(self._header, "tr_id", None)
         self._err_code = self._body.msg_cd
         self._err_message = self._body.msg1
 
@@ -286,14 +442,11 @@ class APIResp:
         for x in self._resp.headers.keys():
             if x.islower():
                 fld[x] = self._resp.headers.get(x)
-        _th_ = namedtuple("header", fld.keys())
 
-        return _th_(**fld)
+        return _recordType("header", tuple(fld))(**fld)
 
     def _setBody(self):
-        _tb_ = namedtuple("body", self._resp.json().keys())
-
-        return _tb_(**self._resp.json())
+        return _recordType("body", tuple(self._data))(**self._data)
 
     def getHeader(self):
         return self._header
@@ -304,6 +457,13 @@ class APIResp:
     def getResponse(self):
         return self._resp
 
+    def getTrId(self):
+        return self._tr_id
+
+    def frame(self, output="output"):
+        """body 의 output 을 TR 스키마(kis_schema)대로 숫자 컬럼을 변환한 DataFrame 으로 반환"""
+        return to_frame(getattr(self._body, output, None), self._tr_id)
+
     def isOK(self):
         try:
             if self.getBody().rt_cd == "0":
@@ -348,10 +508,13 @@ class APIResp:
 
 
 class APIRespError(APIResp):
-    def __init__(self, status_code, error_text):
+    # exception : 요청 실패 원인 예외 (응답을 받지 못한 경우), circuit_open : 서킷 브레이커 때문에 보내지 않은 경우
+    def __init__(self, status_code, error_text, exception=None, circuit_open=False):
         # 부모 생성자 호출하지 않고 직접 초기화
         self.status_code = status_code
         self.error_text = error_text
+        self.exception = exception
+        self.circuit_open = circuit_open
         self._error_code = str(status_code)
         self._error_message = error_text
 
@@ -364,6 +527,12 @@ class APIRespError(APIResp):
     def getErrorMessage(self):
         return self._error_message
 
+    def getTrId(self):
+        return None
+
+    def frame(self, output="output"):
+        return pd.DataFrame()
+
     def getBody(self):
         # 빈 객체 리턴 (속성 접근 시 AttributeError 방지)
         class EmptyBody:
@@ -397,27 +566,23 @@ class APIRespError(APIResp):
 # API call wrapping : API 호출 공통
 
 
-def _url_fetch(
-        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True
-):
-    url = f"{getTREnv().my_url}{api_url}"
-
-    headers = _getBaseHeader()  # 기본 header 값 정리
-
-    # 추가 Header 설정
-    tr_id = ptr_id
+# 실전투자용 TR id 를 현재 환경(모의투자 여부)에 맞게 변환
+def _getTrId(ptr_id):
     if ptr_id[0] in ("T", "J", "C"):  # 실전투자용 TR id 체크
         if isPaperTrading():  # 모의투자용 TR id 식별
-            tr_id = "V" + ptr_id[1:]
+            return "V" + ptr_id[1:]
+    return ptr_id
 
-    headers["tr_id"] = tr_id  # 트랜젝션 TR id
-    headers["custtype"] = "P"  # 일반(개인고객,법인고객) "P", 제휴사 "B"
-    headers["tr_cont"] = tr_cont  # 트랜젝션 TR id
 
-    if appendHeaders is not None:
-        if len(appendHeaders) > 0:
-            for x in appendHeaders.keys():
-                headers[x] = appendHeaders.get(x)
+# rateLimit=False : 호출자가 이미 rate limiter 를 통과한 경우 (kis_async 는 재시도도 한도를 거치도록 _prepaid 허가를 사용)
+def _url_fetch(
+        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True, timeout=None,
+        rateLimit=True
+):
+    url = f"{getTREnv().my_url}{api_url}"
+
+    tr_id = _getTrId(ptr_id)
+    headers = _requestHeaders(tr_id, tr_cont, appendHeaders)  # 기본 header + TR id + 추가 Header
 
     if _DEBUG:
         print("< Sending Info >")
@@ -425,18 +590,85 @@ def _url_fetch(
         print(f"<header>\n{headers}")
         print(f"<body>\n{params}")
 
-    if postFlag:
-        # if (hashFlag): set_order_hash_key(headers, params)
-        res = requests.post(url, headers=headers, data=json.dumps(params))
-    else:
-        res = requests.get(url, headers=headers, params=params)
+    # 시세 TR 은 짧은 시간 캐시하고, 같은 요청이 동시에 들어오면 하나만 보냄 (성공 응답만 보관)
+    if _quote_cache is not None and not postFlag:
+        key = _quote_cache.key(_getServer(), tr_id, api_url, params)
+        if key is not None:
+            return _quote_cache.get_or_fetch(
+                key, lambda: _sendWithRetry(url, tr_id, headers, params, postFlag, timeout, rateLimit),
+                store=lambda r: r.isOK())
+
+    return _sendWithRetry(url, tr_id, headers, params, postFlag, timeout, rateLimit)
+
+
+# 조회(GET)는 일시적인 실패를 백오프 후 다시 보내고, 주문(POST)은 서버가 처리하지 않은 경우에만 다시 보냄
+def _sendWithRetry(url, tr_id, headers, params, postFlag, timeout, rateLimit):
+    if _retry_policy is None and _circuit_breaker is None:
+        return _sendRequest(url, tr_id, headers, params, postFlag, timeout, rateLimit)
+
+    host = urlsplit(url).netloc
+
+    def onRetry(attempt, res):
+        metrics = get_metrics()
+        if metrics is not None:
+            metrics.retry(tr_id)
+        logging.warning("Retrying %s (%d) after %s %s", tr_id, attempt + 1, res.getErrorCode(),
+                       res.getErrorMessage())
+
+    def onReject():
+        return APIRespError(0, f"circuit open for {host}: KIS requests are failing, not sent", circuit_open=True)
+
+    return call_with_retry(
+        lambda: _sendRequest(url, tr_id, headers, params, postFlag, timeout, rateLimit),
+        _retry_policy, _circuit_breaker, host, idempotent=not postFlag, on_retry=onRetry, on_reject=onReject)
+
+
+def _sendRequest(url, tr_id, headers, params, postFlag, timeout, rateLimit):
+    metrics = get_metrics()
+
+    # 서버/TR 별 초당 호출 한도에 맞춰 필요한 만큼만 대기
+    if rateLimit and _rate_limiter is not None:
+        prepaid = getattr(_prepaid, "permits", 0) > 0
+        if prepaid:
+            _prepaid.permits -= 1
+        waited = _rate_limiter.acquire(_getServer(), tr_id, server=not prepaid)
+        if metrics is not None:
+            metrics.wait(tr_id, waited)
+        if _DEBUG and waited > 0:
+            print(f"[RateLimit] Waited {waited:.3f}s ")
+
+    # timeout : (연결, 응답) 초 단위 튜플 또는 숫자, 생략시 KIS_CONNECT_TIMEOUT / KIS_READ_TIMEOUT
+    start = time.perf_counter()
+    try:
+        if postFlag:
+            # if (hashFlag): set_order_hash_key(headers, params)
+            data = json.dumps(params)
+            sent = len(data)
+            res = _getSession().post(url, headers=headers, data=data,
+                                     timeout=_getTimeout(timeout))
+        else:
+            sent = sum(len(k) + len(str(v)) + 2 for k, v in params.items()) if params else 0
+            res = _getSession().get(url, headers=headers, params=params,
+                                    timeout=_getTimeout(timeout))
+    except requests.RequestException as e:
+        if metrics is not None:
+            metrics.observe(tr_id, time.perf_counter() - start, "network")
+        print("Request failed : " + str(e))
+        return APIRespError(0, str(e), e)
+    elapsed = time.perf_counter() - start
 
     if res.status_code == 200:
-        ar = APIResp(res)
+        ar = APIResp(res, tr_id)
+        if metrics is not None:
+            ok = ar.isOK()
+            metrics.observe(tr_id, elapsed, "ok" if ok else "error", sent, len(res.content),
+                            not ok and ar.getErrorCode() == RATE_LIMIT_CODE)
         if _DEBUG:
             ar.printAll()
         return ar
     else:
+        if metrics is not None:
+            metrics.observe(tr_id, elapsed, "http_error", sent, len(res.content), RATE_LIMIT_CODE in res.text)
         print("Error Code : " + str(res.status_code) + " | " + res.text)
         return APIRespError(res.status_code, res.text)
 
@@ -450,13 +682,16 @@ def _url_fetch(
 _base_headers_ws = {
     "content-type": "utf-8",
 }
+# 웹소켓 접속키를 다시 받아야 하는 시각(epoch 초, 발급 후 1일)
+_reauth_ws_at = time.time() + 86400
+_auth_ws_args = ("prod", os.getenv("my_prod"))  # 마지막 auth_ws() 의 (svr, product), 재발급에 그대로 사용
 
 
 def _getBaseHeader_ws():
-    if _autoReAuth:
-        reAuth_ws()
+    if _autoReAuth and time.time() >= _reauth_ws_at:
+        reAuth_ws(*_auth_ws_args)
 
-    return copy.deepcopy(_base_headers_ws)
+    return dict(_base_headers_ws)
 
 
 def auth_ws(svr="prod", product=os.getenv("my_prod")):
@@ -472,8 +707,8 @@ def auth_ws(svr="prod", product=os.getenv("my_prod")):
     p["secretkey"] = os.getenv(ak2)
 
     url = f"{os.getenv(svr)}/oauth2/Approval"
-    res = requests.post(url, data=json.dumps(
-        p), headers=_getBaseHeader())  # 토큰 발급
+    res = _getSession().post(url, data=json.dumps(
+        p), headers=_getBaseHeader(), timeout=_getTimeout())  # 토큰 발급
     rescode = res.status_code
     if rescode == 200:  # 토큰 정상 발급
         approval_key = _getResultObject(res.json()).approval_key
@@ -485,16 +720,17 @@ def auth_ws(svr="prod", product=os.getenv("my_prod")):
 
     _base_headers_ws["approval_key"] = approval_key
 
-    global _last_auth_time
+    global _last_auth_time, _reauth_ws_at, _auth_ws_args
     _last_auth_time = datetime.now()
+    _reauth_ws_at = time.time() + 86400
+    _auth_ws_args = (svr, product)
 
     if _DEBUG:
         print(f"[{_last_auth_time}] => get AUTH Key completed!")
 
 
 def reAuth_ws(svr="prod", product=os.getenv("my_prod")):
-    n2 = datetime.now()
-    if (n2 - _last_auth_time).seconds >= 86400:
+    if time.time() >= _reauth_ws_at:
         auth_ws(svr, product)
 
 
@@ -581,8 +817,15 @@ def aes_cbc_base64_dec(key, iv, cipher_text):
     if key is None or iv is None:
         raise AttributeError("key and iv cannot be None")
 
-    cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
-    return bytes.decode(unpad(cipher.decrypt(b64decode(cipher_text)), AES.block_size))
+    if AES is not None:
+        cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+        return bytes.decode(unpad(cipher.decrypt(b64decode(cipher_text)), AES.block_size))
+    if _Cipher is not None:
+        decryptor = _Cipher(_algorithms.AES(key.encode("utf-8")), _modes.CBC(iv.encode("utf-8"))).decryptor()
+        unpadder = _padding.PKCS7(128).unpadder()
+        data = decryptor.update(b64decode(cipher_text)) + decryptor.finalize()
+        return bytes.decode(unpadder.update(data) + unpadder.finalize())
+    raise ImportError("pycryptodome (또는 cryptography) 패키지가 필요합니다: pip install pycryptodome")
 
 
 #####
@@ -633,3 +876,44 @@ def add_data_map(
 
     if iv is not None:
         data_map[tr_id]["iv"] = iv
+
+
+def benchmark(n: int = 100000):
+    """요청 헤더 구성 비용: 호출마다 deepcopy + reAuth 검사 vs (서버, TR id) 템플릿 병합"""
+    import copy
+
+    global _autoReAuth, _reauth_at, _token_cache
+    saved = dict(_base_headers), _autoReAuth, _reauth_at, _token_cache
+    _base_headers.update({"authorization": "Bearer " + "x" * 350, "appkey": "a" * 36, "appsecret": "s" * 180})
+    _token_cache = TokenCache()  # 파일 저장소 없이 메모리에만 둔 유효한 토큰
+    _token_cache.get("prod", os.getenv(_getAppKeyNames("prod")[0]), lambda: ("token", time.time() + 86400))
+    _autoReAuth, _reauth_at = True, time.time() + 86400
+    _header_templates.clear()
+    tr_ids = [f"FHKST0101{i:04d}" for i in range(600)]
+
+    def deepcopyHeaders(tr_id):
+        # 이전 방식: _getBaseHeader() (reAuth 검사 + deepcopy) 후 TR id / 연속조회 헤더 설정
+        _token_cache.needs_refresh("prod", os.getenv(_getAppKeyNames("prod")[0]))
+        headers = copy.deepcopy(_base_headers)
+        headers["tr_id"] = tr_id
+        headers["custtype"] = "P"
+        headers["tr_cont"] = ""
+        return headers
+
+    try:
+        for name, build in (("deepcopy", deepcopyHeaders), ("template", lambda t: _requestHeaders(t, ""))):
+            start = time.perf_counter()
+            for i in range(n):
+                build(tr_ids[i % 600])
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed / n * 1e6:.2f}µs/call ({n} calls, 600 TR ids)")
+        assert deepcopyHeaders("FHKST01010100") == _requestHeaders("FHKST01010100", "")
+    finally:
+        _base_headers.clear()
+        _base_headers.update(saved[0])
+        _autoReAuth, _reauth_at, _token_cache = saved[1:]
+        _header_templates.clear()
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS REST 호출 지표 (TR 별 횟수 / 지연 분포 / 전송량)  |=====================
+# _sendRequest 가 요청마다 한 번 observe() 를 호출해 TR ID 별로 다음을 모읍니다.
+#   - 결과별 요청 수 (ok: rt_cd 0, error: rt_cd 실패, http_error: HTTP 200 이외, network: 연결/타임아웃 실패)
+#   - 응답 지연 분포 (HDR 방식 로그-선형 버킷, 상대 오차 약 6% 이내, p50/p95/p99)
+#   - 요청/응답 바이트 수, 초당 거래건수 초과(EGW00201) 거절 수, rate limiter 대기 시간, 재시도 수
+# Paginator 는 조회 한 번에 넘긴 페이지 수를 pages() 로 남깁니다.
+# /api/metrics/ 가 render_prometheus() 결과(Prometheus text format)를 그대로 내보냅니다.
+#
+# 요청 한 건당 잠금 한 번과 dict 연산 몇 번만 하므로 수십 ms 걸리는 HTTP 요청에 비해 무시할 만합니다. (benchmark() 참고)
+
+import os
+import threading
+import time
+
+# 초당 거래건수를 초과하였습니다.
+RATE_LIMIT_CODE = "EGW00201"
+# 지연 분포에서 내보낼 분위수
+QUANTILES = (0.5, 0.95, 0.99)
+# Prometheus text format Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 2 의 거듭제곱 구간마다 나누는 버킷 수 (2**4 = 16 개, 버킷 폭은 구간 시작값의 1/16 이하)
+_SUB_BITS = 4
+_SUB = 1 << _SUB_BITS
+_LINEAR = _SUB << 1  # 이 값(µs) 미만은 1µs 단위 버킷
+
+
+def _bucket(us: int) -> int:
+    if us < _LINEAR:
+        return us
+    shift = us.bit_length() - _SUB_BITS - 1
+    return shift * _SUB + (us >> shift)
+
+
+def _bucketValue(index: int) -> float:
+    # 버킷의 대표값(µs): 구간 가운데
+    if index < _LINEAR:
+        return float(index)
+    shift = index // _SUB - 1
+    low = (index - shift * _SUB) << shift
+    return low + (1 << shift) / 2
+
+
+class Histogram:
+    """
+    HDR 방식 로그-선형 지연 분포 (µs 단위 정수 버킷, 관측값 수와 상관없이 크기가 일정).
+
+    Attributes:
+        count (int): 관측 수
+        total (float): 관측값 합 (초)
+        max (float): 최댓값 (초)
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        index = _bucket(int(seconds * 1e6))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """q 분위수 (초), 관측이 없으면 0"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucketValue(index) / 1e6, self.max)
+        return self.max
+
+
+class _TrStats:
+    __slots__ = ("outcomes", "latency", "sent", "received", "rate_limited", "retries", "wait")
+
+    def __init__(self):
+        self.outcomes = {}
+        self.latency = Histogram()
+        self.sent = 0
+        self.received = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.wait = 0.0
+
+
+class _PageStats:
+    __slots__ = ("calls", "pages", "truncated")
+
+    def __init__(self):
+        self.calls = 0
+        self.pages = 0
+        self.truncated = 0
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """
+    TR ID 별 KIS REST 호출 지표 (스레드 안전).
+
+    사용 예:
+        metrics = Metrics()
+        metrics.observe("FHKST01010100", 0.042, "ok", sent=120, received=2048)
+        metrics.snapshot()["FHKST01010100"]["p95"]
+        print(metrics.render())
+    """
+
+    def __init__(self):
+        self._trs = {}
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def _tr(self, tr_id) -> _TrStats:
+        stats = self._trs.get(tr_id)
+        if stats is None:
+            stats = self._trs[tr_id] = _TrStats()
+        return stats
+
+    def observe(self, tr_id, seconds: float, outcome: str = "ok", sent: int = 0, received: int = 0,
+                rate_limited: bool = False):
+        """
+        요청 한 건을 기록합니다.
+
+        Args:
+            tr_id (str): 거래 ID
+            seconds (float): 요청을 보내고 응답을 받기까지 걸린 시간 (rate limiter 대기 제외)
+            outcome (str): ok / error / http_error / network
+            sent (int): 요청 바이트 수 (GET 쿼리 또는 POST 본문)
+            received (int): 응답 본문 바이트 수
+            rate_limited (bool): 초당 거래건수 초과(EGW00201)로 거절되었는지 여부
+        """
+        with self._lock:
+            stats = self._tr(tr_id)
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+            stats.latency.record(seconds)
+            stats.sent += sent
+            stats.received += received
+            if rate_limited:
+                stats.rate_limited += 1
+
+    def wait(self, tr_id, seconds: float):
+        """rate limiter 에서 기다린 시간을 더합니다."""
+        if seconds > 0:
+            with self._lock:
+                self._tr(tr_id).wait += seconds
+
+    def retry(self, tr_id):
+        """같은 요청을 다시 보낸 횟수를 하나 늘립니다."""
+        with self._lock:
+            self._tr(tr_id).retries += 1
+
+    def pages(self, tr_id, pages: int, truncated: bool = False):
+        """연속조회 한 번에 가져온 페이지 수를 기록합니다."""
+        with self._lock:
+            stats = self._pages.get(tr_id)
+            if stats is None:
+                stats = self._pages[tr_id] = _PageStats()
+            stats.calls += 1
+            stats.pages += pages
+            if truncated:
+                stats.truncated += 1
+
+    def reset(self):
+        with self._lock:
+            self._trs.clear()
+            self._pages.clear()
+
+    def snapshot(self) -> dict:
+        """
+        TR ID 별 지표 dict
+
+        Returns:
+            dict: {tr_id: {requests, outcomes, p50, p95, p99, max, mean, sent, received, rate_limited,
+                           retries, wait, pagination_calls, pages, truncated}}
+        """
+        with self._lock:
+            result = {}
+            for tr_id, stats in self._trs.items():
+                latency = stats.latency
+                item = result[tr_id] = {
+                    "requests": latency.count, "outcomes": dict(stats.outcomes),
+                    "max": latency.max, "mean": latency.total / latency.count if latency.count else 0.0,
+                    "sent": stats.sent, "received": stats.received, "rate_limited": stats.rate_limited,
+                    "retries": stats.retries, "wait": stats.wait,
+                }
+                for q in QUANTILES:
+                    item[f"p{int(q * 100)}"] = latency.quantile(q)
+            for tr_id, stats in self._pages.items():
+                item = result.setdefault(tr_id, {})
+                item.update(pagination_calls=stats.calls, pages=stats.pages, truncated=stats.truncated)
+            return result
+
+    def render(self, quote_cache: dict = None) -> str:
+        """
+        Prometheus text format 으로 내보냅니다.
+
+        Args:
+            quote_cache (dict): QuoteCache.stats() 결과 (함께 내보낼 시세 캐시 지표)
+        """
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                label = ",".join(f'{k}="{_label(v)}"' for k, v in labels)
+                lines.append(f"{name}{suffix}{{{label}}} {_number(value)}" if label
+                             else f"{name}{suffix} {_number(value)}")
+
+        with self._lock:
+            trs = sorted(self._trs.items())
+            pages = sorted(self._pages.items())
+            family("kis_requests_total", "counter", "KIS REST requests by TR ID and outcome.",
+                   [("", (("tr_id", tr_id), ("outcome", outcome)), n)
+                    for tr_id, stats in trs for outcome, n in sorted(stats.outcomes.items())])
+            latency = []
+            for tr_id, stats in trs:
+                for q in QUANTILES:
+                    latency.append(("", (("tr_id", tr_id), ("quantile", str(q))), stats.latency.quantile(q)))
+                latency.append(("_sum", (("tr_id", tr_id),), stats.latency.total))
+                latency.append(("_count", (("tr_id", tr_id),), stats.latency.count))
+            family("kis_request_duration_seconds", "summary", "KIS REST request latency by TR ID.", latency)
+            family("kis_request_bytes_total", "counter", "Request bytes sent (query string or body).",
+                   [("", (("tr_id", tr_id),), stats.sent) for tr_id, stats in trs])
+            family("kis_response_bytes_total", "counter", "Response body bytes received.",
+                   [("", (("tr_id", tr_id),), stats.received) for tr_id, stats in trs])
+            family("kis_rate_limited_total", "counter", f"Requests rejected with {RATE_LIMIT_CODE}.",
+                   [("", (("tr_id", tr_id),), stats.rate_limited) for tr_id, stats in trs])
+            family("kis_retries_total", "counter", "Requests sent again after a failure.",
+                   [("", (("tr_id", tr_id),), stats.retries) for tr_id, stats in trs])
+            family("kis_ratelimit_wait_seconds_total", "counter", "Time spent waiting for the local rate limiter.",
+                   [("", (("tr_id", tr_id),), stats.wait) for tr_id, stats in trs])
+            family("kis_pagination_pages", "summary", "Pages fetched per paginated call.",
+                   [sample for tr_id, stats in pages for sample in (
+                       ("_sum", (("tr_id", tr_id),), stats.pages), ("_count", (("tr_id", tr_id),), stats.calls))])
+            family("kis_pagination_truncated_total", "counter", "Paginated calls stopped by max_pages.",
+                   [("", (("tr_id", tr_id),), stats.truncated) for tr_id, stats in pages])
+
+        if quote_cache is not None:
+            for key in ("hits", "misses", "coalesced"):
+                family(f"kis_quote_cache_{key}_total", "counter", f"Quote cache {key}.",
+                       [("", (), quote_cache.get(key, 0))])
+            family("kis_quote_cache_entries", "gauge", "Quote cache entries.", [("", (), quote_cache.get("size", 0))])
+        return "\n".join(lines) + "\n"
+
+
+def metrics_from_env():
+    """
+    환경변수로 기본 Metrics 를 만듭니다.
+        KIS_METRICS : 0 이면 지표를 모으지 않음 (기본 1)
+    """
+    return Metrics() if os.getenv("KIS_METRICS", "1") != "0" else None
+
+
+_metrics = metrics_from_env()
+
+
+def get_metrics():
+    return _metrics
+
+
+# 지표 저장소 교체 (None 이면 수집 안 함)
+def set_metrics(metrics):
+    global _metrics
+    _metrics = metrics
+
+
+def render_prometheus() -> str:
+    """프로세스 전역 지표와 시세 캐시 통계를 Prometheus text format 으로 반환"""
+    import api.functions.kis_auth as ka
+
+    cache = ka._quote_cache.stats() if ka._quote_cache is not None else None
+    if _metrics is None:
+        return Metrics().render(cache)
+    return _metrics.render(cache)
+
+
+def benchmark(n: int = 200000):
+    """observe() 한 건당 비용과 분위수 정확도를 출력합니다."""
+    import random
+
+    metrics = Metrics()
+    tr_ids = [f"FHKST0101{i:04d}" for i in range(40)]
+    samples = [(random.choice(tr_ids), random.lognormvariate(-3.2, 0.6)) for _ in range(n)]
+
+    start = time.perf_counter()
+    for tr_id, seconds in samples:
+        pass
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tr_id, seconds in samples:
+        metrics.observe(tr_id, seconds, "ok", 120, 2048)
+    elapsed = time.perf_counter() - start - loop
+    per_call = elapsed / n
+    print(f"observe: {per_call * 1e6:.2f}µs/call ({n} calls)")
+
+    values = sorted(s for _, s in samples)
+    mean = sum(values) / n
+    print(f"overhead vs {mean * 1e3:.1f}ms mean request: {per_call / mean:.4%}")
+    hist = Histogram()
+    for v in values:
+        hist.record(v)
+    for q in QUANTILES:
+        exact = values[min(int(q * n), n - 1)]
+        print(f"p{int(q * 100)}: {hist.quantile(q) * 1e3:.3f}ms (exact {exact * 1e3:.3f}ms, "
+              f"error {abs(hist.quantile(q) - exact) / exact:.2%})")
+
+    start = time.perf_counter()
+    text = metrics.render()
+    print(f"render: {(time.perf_counter() - start) * 1e3:.2f}ms, {len(text)} bytes, {len(tr_ids)} TRs")
+
+
+if __name__ == "__main__":
+    benchmark()
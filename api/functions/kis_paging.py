@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# ====|  연속조회(tr_cont) API 공용 페이지네이터  |=====================
+# KIS 는 다음 페이지가 있으면 응답 헤더 tr_cont 에 "M"(또는 "F") 를 내려주고,
+# 계좌/내역 조회 API 는 body 의 ctx_area_fk/nk 값을 다음 요청 파라미터로 다시 보내야 합니다.
+# 재귀 호출과 페이지마다 pd.concat 하던 방식 대신 반복문으로 페이지를 넘기며,
+# 행(dict)만 모아 두었다가 마지막에 한 번만 DataFrame 을 만듭니다. (숫자 컬럼은 kis_schema 의 TR 스키마대로 변환)
+#
+# 사용 예:
+#     pages = Paginator(api_url, tr_id, params, cursor={"CTX_AREA_FK100": "ctx_area_fk100",
+#                                                       "CTX_AREA_NK100": "ctx_area_nk100"})
+#     for row in pages.rows("output1"):   # 스트리밍
+#         ...
+#     df1, df2 = Paginator(...).collect("output1", "output2")   # 한 번에 DataFrame 생성
+#     if pages.truncated: ...   # max_pages 에 걸려 중간에 멈췄는지 여부
+
+import logging
+import os
+
+import pandas as pd
+
+import api.functions.kis_auth as ka
+from api.functions.kis_metrics import get_metrics
+from api.functions.kis_schema import as_records, to_frame
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 조회에서 가져올 최대 페이지 수 기본값
+DEFAULT_MAX_PAGES = int(os.getenv("KIS_MAX_PAGES", "10"))
+
+
+class Paginator:
+    """
+    연속조회 API 를 반복 호출하며 페이지 단위로 응답을 내주는 이터레이터.
+
+    Args:
+        api_url (str): API URL (도메인 제외)
+        tr_id (str): 거래 ID
+        params (dict): 요청 파라미터 (cursor 에 해당하는 키는 페이지마다 갱신됨)
+        cursor (dict): {요청 파라미터 이름: 응답 body 속성 이름} 연속조회 키 매핑
+        tr_cont (str): 첫 요청의 연속 거래 여부
+        max_pages (int): 최대 페이지 수 (초과하면 멈추고 truncated=True)
+        more (tuple): 다음 페이지가 있음을 뜻하는 tr_cont 값
+        appendHeaders (dict): 추가 헤더
+        postFlag (bool): POST 요청 여부
+
+    Attributes:
+        pages (int): 가져온 페이지 수
+        truncated (bool): max_pages 때문에 남은 페이지를 가져오지 못했는지 여부
+        error (APIResp): 실패한 응답 (성공이면 None)
+    """
+
+    def __init__(self, api_url, tr_id, params, cursor=None, tr_cont="", max_pages=None,
+                 more=("M", "F"), appendHeaders=None, postFlag=False):
+        self.api_url = api_url
+        self.tr_id = tr_id
+        self.params = dict(params)
+        self.cursor = cursor or {}
+        self.tr_cont = tr_cont
+        self.max_pages = DEFAULT_MAX_PAGES if max_pages is None else max_pages
+        self.more = more
+        self.appendHeaders = appendHeaders
+        self.postFlag = postFlag
+        self.pages = 0
+        self.truncated = False
+        self.error = None
+
+    def __iter__(self):
+        try:
+            yield from self._pages()
+        finally:
+            metrics = get_metrics()
+            if metrics is not None and self.pages:
+                metrics.pages(ka._getTrId(self.tr_id), self.pages, self.truncated)
+
+    def _pages(self):
+        tr_cont = self.tr_cont
+        while True:
+            if self.pages >= self.max_pages:
+                logger.warning("Maximum page count (%d) reached. Stopping further requests.", self.max_pages)
+                self.truncated = True
+                return
+
+            if self.pages > 0:
+                logger.info("Calling next page...")
+                ka.smart_sleep()
+
+            res = ka._url_fetch(self.api_url, self.tr_id, tr_cont, self.params,
+                                appendHeaders=self.appendHeaders, postFlag=self.postFlag)
+            if not res.isOK():
+                self.error = res
+                return
+
+            self.pages += 1
+            yield res
+
+            if res.getHeader().tr_cont not in self.more:
+                logger.info("Data fetch complete.")
+                return
+
+            body = res.getBody()
+            for param, attr in self.cursor.items():
+                self.params[param] = getattr(body, attr, "")
+            tr_cont = "N"
+
+    def rows(self, output="output"):
+        """모든 페이지의 output 행(dict)을 순서대로 내줍니다."""
+        for res in self:
+            yield from as_records(getattr(res.getBody(), output, None))
+
+    def collect(self, *outputs, frames=None):
+        """
+        모든 페이지를 가져와 output 별 DataFrame 을 만듭니다.
+
+        Args:
+            *outputs (str): 모을 body 속성 이름 (기본 "output")
+            frames (tuple): 앞에 이어 붙일 기존 DataFrame (output 순서, None 허용)
+
+        Returns:
+            pd.DataFrame | Tuple[pd.DataFrame, ...]: output 이 하나면 DataFrame, 여러 개면 튜플
+            실패 시 기존 동작과 같이 빈 DataFrame 을 반환합니다.
+        """
+        outputs = outputs or ("output",)
+        rows = [[] for _ in outputs]
+        tr_id = None
+        for res in self:
+            tr_id = res.getTrId()
+            body = res.getBody()
+            for i, output in enumerate(outputs):
+                rows[i].extend(as_records(getattr(body, output, None)))
+
+        if self.error is not None:
+            logger.error("API call failed: %s - %s", self.error.getErrorCode(), self.error.getErrorMessage())
+            self.error.printError(url=self.api_url)
+            result = [pd.DataFrame() for _ in outputs]
+        else:
+            frames = frames or (None,) * len(outputs)
+            result = []
+            for prev, current in zip(frames, rows):
+                df = to_frame(current, tr_id)
+                if prev is not None:
+                    df = pd.concat([prev, df], ignore_index=True)
+                df.attrs["pages"] = self.pages
+                df.attrs["truncated"] = self.truncated
+                result.append(df)
+
+        return result[0] if len(result) == 1 else tuple(result)
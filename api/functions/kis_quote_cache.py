@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# ====|  시세 조회 단기 캐시 (single-flight)  |=====================
+# 한 워크플로우 안에서 여러 노드가 같은 종목의 현재가를 거의 동시에 조회하는 경우가 많으므로,
+# 시세 TR 응답을 짧은 시간(기본 1초) 재사용하고, 같은 요청이 동시에 들어오면 먼저 보낸 요청 하나의
+# 응답을 함께 받도록(single-flight) 합니다. 캐시 적중 시에는 rate limiter 토큰도 쓰지 않습니다.
+
+import os
+import threading
+import time
+
+# 캐시 대상 TR (주식현재가 시세, 주식현재가 시세2)
+DEFAULT_TR_IDS = ("FHKST01010100", "FHPST01010000")
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class QuoteCache:
+    """
+    (서버, TR ID, URL, 파라미터) 를 키로 응답을 ttl 초 동안 보관하는 캐시.
+
+    Args:
+        ttl (float): 응답을 재사용할 시간(초)
+        tr_ids (Iterable[str]): 캐시할 TR ID 목록
+        max_entries (int): 최대 보관 개수 (초과하면 만료된 것, 그래도 많으면 오래된 것부터 제거)
+
+    Attributes:
+        hits (int): 캐시된 응답을 돌려준 횟수
+        misses (int): 실제로 요청을 보낸 횟수
+        coalesced (int): 진행 중인 같은 요청의 응답을 기다려 받은 횟수
+    """
+
+    def __init__(self, ttl: float = 1.0, tr_ids=DEFAULT_TR_IDS, max_entries: int = 10000):
+        self.ttl = ttl
+        self.tr_ids = set(tr_ids)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def key(self, svr, tr_id, api_url, params):
+        """캐시 키 (캐시 대상 TR 이 아니면 None)"""
+        if tr_id not in self.tr_ids:
+            return None
+        return svr, tr_id, api_url, tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def get(self, key):
+        """보관 중인 응답 (없거나 만료되었으면 None, 요청을 보내지 않음)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+        return None
+
+    def get_or_fetch(self, key, fetch, store=None):
+        """
+        캐시된 응답을 반환하거나, fetch() 를 한 번만 호출해 그 결과를 기다리는 모두에게 돌려줍니다.
+
+        Args:
+            fetch (Callable): 실제 요청 함수
+            store (Callable): 결과를 캐시에 보관할지 판단하는 함수 (예: 성공 응답만 보관)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fetch()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if call.error is None and (store is None or store(call.result)):
+                    self._entries[key] = (time.monotonic() + self.ttl, call.result)
+                    if len(self._entries) > self.max_entries:
+                        self._prune()
+            call.event.set()
+        return call.result
+
+    def _prune(self):
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """적중/미적중 횟수와 현재 보관 개수"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced,
+                    "size": len(self._entries)}
+
+
+def quote_cache_from_env():
+    """
+    환경변수로 기본 QuoteCache 를 만듭니다.
+        KIS_QUOTE_CACHE_TTL : 시세 응답 재사용 시간(초, 기본 1, 0 이면 캐시 사용 안 함)
+    """
+    ttl = float(os.getenv("KIS_QUOTE_CACHE_TTL", "1"))
+    return QuoteCache(ttl) if ttl > 0 else None
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# ====|  복수 종목 현재가 일괄 조회  |=====================
+# 관심종목(멀티종목) 시세조회(intstock_multprice)는 한 번에 30종목까지 조회할 수 있으므로,
+# 종목 수만큼 inquire_price 를 부르는 대신 30개씩 묶어 동시에 호출합니다. (600종목 → 20회)
+# 호출마다 kis_auth._url_fetch 의 rate limiter 를 거치므로 초당 한도는 그대로 지켜집니다.
+#
+# 사용 예:
+#     from api.functions.kis_quotes import get_quotes
+#     df = get_quotes(["005930", "000660", ...])   # index: 종목코드, 숫자 컬럼은 kis_schema 타입
+#     df.loc["005930", "inter2_prpr"]
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+
+import pandas as pd
+
+import api.functions.kis_auth as ka
+from api.functions.domestic_stock_functions import intstock_multprice
+
+logger = logging.getLogger(__name__)
+
+MULTPRICE_MAX_CODES = 30  # intstock_multprice 한 번에 조회 가능한 종목 수
+
+
+def _chunks(codes: List[str], size: int):
+    for i in range(0, len(codes), size):
+        yield codes[i:i + size]
+
+
+def _fetchChunk(codes: List[str], market: str) -> pd.DataFrame:
+    kwargs = {}
+    for i, code in enumerate(codes, start=1):
+        kwargs[f"fid_cond_mrkt_div_code_{i}"] = market
+        kwargs[f"fid_input_iscd_{i}"] = code
+    return intstock_multprice(**kwargs)
+
+
+def get_quotes(codes: Iterable[str], market: str = "J", max_workers: int = None) -> pd.DataFrame:
+    """
+    여러 종목의 현재가를 intstock_multprice 30종목 단위 호출로 한 번에 조회합니다.
+
+    Args:
+        codes (Iterable[str]): 종목코드 목록 (중복은 한 번만 조회)
+        market (str): 조건 시장 분류 코드 (J: KRX, NX: NXT, UN: 통합)
+        max_workers (int): 동시에 보낼 요청 수 (기본: 연결 풀 크기, 실제 속도는 rate limiter 가 제한)
+
+    Returns:
+        pd.DataFrame: 종목코드(요청 순서) index, 숫자 컬럼은 응답 스키마(kis_schema) 타입.
+            조회되지 않은 종목은 결측 행으로 채우고(정수 컬럼은 Int64) attrs["missing"] 에 코드를 담습니다.
+    """
+    codes = list(dict.fromkeys(str(c).strip() for c in codes if c))
+    if not codes:
+        return pd.DataFrame()
+
+    chunks = list(_chunks(codes, MULTPRICE_MAX_CODES))
+    workers = max(1, min(len(chunks), max_workers or ka._pool_size))
+    if workers == 1:
+        frames = [_fetchChunk(chunk, market) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kis-quotes") as executor:
+            frames = list(executor.map(lambda chunk: _fetchChunk(chunk, market), chunks))
+
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        result = pd.DataFrame(index=pd.Index(codes, name="code"))
+        result.attrs["missing"] = codes
+        return result
+
+    df = pd.concat(frames, ignore_index=True)
+    df = df.drop_duplicates("inter_shrn_iscd").set_index("inter_shrn_iscd", drop=False)
+    missing = [code for code in codes if code not in df.index]
+    if missing:
+        logger.warning("No quote returned for %d codes: %s", len(missing), missing[:10])
+        # 결측 행을 채워도 정수 컬럼이 float64 로 바뀌지 않도록
+        df = df.astype({c: "Int64" for c in df.columns if df[c].dtype == "int64"})
+    result = df.reindex(codes)
+    result.index.name = "code"
+    result.attrs["missing"] = missing
+    return result
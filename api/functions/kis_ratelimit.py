@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS API 호출 속도 제한 (토큰 버킷)  |=====================
+# KIS 는 앱키별로 초당 호출 건수를 제한하며, 초과 시 EGW00201 (초당 거래건수 초과) 에러를 반환합니다.
+# 고정 sleep 대신 토큰 버킷으로 필요한 만큼만 대기하여 허용량에 최대한 가깝게 호출합니다.
+
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows 에서는 프로세스 간 공유 없이 프로세스 내 버킷만 사용
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    프로세스 내 스레드들이 공유하는 토큰 버킷.
+
+    reserve() 는 토큰을 미리 예약(음수 잔량 허용)하고 대기해야 할 시간을 돌려주므로,
+    락을 잡은 채로 sleep 하지 않고도 호출 순서대로 공평하게 간격이 벌어집니다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate  # 초당 보충되는 토큰 수
+        self.capacity = max(1.0, capacity)  # 한 번에 몰아서 보낼 수 있는 최대 호출 수
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float, updated: float, now: float):
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate) - 1.0
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, wait
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 할 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._reserve(self._tokens, self._updated, now)
+            self._updated = now
+        return wait
+
+    def acquire(self) -> float:
+        """토큰을 얻을 때까지 대기하고, 실제로 대기한 시간(초)을 반환합니다."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    파일 잠금(fcntl.flock)으로 상태를 공유하는 토큰 버킷.
+    같은 호스트의 여러 워커 프로세스(gunicorn 등)가 하나의 앱키 허용량을 나눠 쓸 때 사용합니다.
+    """
+
+    _STATE = struct.Struct("dd")  # (남은 토큰, 마지막 갱신 시각)
+
+    def __init__(self, path: str, rate: float, capacity: float = 1.0):
+        super().__init__(rate, capacity)
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 프로세스 간에는 monotonic 시계를 공유할 수 없으므로 벽시계를 사용
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        os.close(fd)
+
+    def reserve(self) -> float:
+        with self._lock, open(self.path, "r+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                raw = f.read(self._STATE.size)
+                if len(raw) == self._STATE.size:
+                    tokens, updated = self._STATE.unpack(raw)
+                    updated = min(updated, now)
+                else:
+                    tokens, updated = self.capacity, now
+                tokens, wait = self._reserve(tokens, updated, now)
+                f.seek(0)
+                f.write(self._STATE.pack(tokens, now))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return wait
+
+
+class RateLimiter:
+    """
+    서버(prod/vps)별, 그리고 필요하면 TR ID 별로 토큰 버킷을 관리합니다.
+
+    Args:
+        rates (dict): 서버별 초당 허용 호출 수 (예: {"prod": 18, "vps": 2})
+        burst (float): 버킷 용량 (1 이면 호출 간격을 1/rate 초로 균등하게 유지)
+        shared_dir (str): 지정하면 이 디렉토리의 파일로 프로세스 간 버킷 상태를 공유
+    """
+
+    def __init__(self, rates: dict, burst: float = 1.0, shared_dir: str = None):
+        self.rates = dict(rates)
+        self.tr_rates = {}
+        self.burst = burst
+        self.shared_dir = shared_dir if fcntl is not None else None
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def set_tr_rate(self, tr_id: str, rate: float):
+        """특정 TR 에 서버 한도와 별도로 적용할 초당 호출 수를 지정합니다."""
+        with self._lock:
+            self.tr_rates[tr_id] = rate
+            for key in [k for k in self._buckets if k[1] == tr_id]:
+                del self._buckets[key]
+
+    def _newBucket(self, name: str, rate: float):
+        if self.shared_dir:
+            return FileTokenBucket(os.path.join(self.shared_dir, f"{name}.bucket"), rate, self.burst)
+        return TokenBucket(rate, self.burst)
+
+    def _bucket(self, svr: str, tr_id: str = None):
+        key = (svr, tr_id)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    if tr_id is None:
+                        rate = self.rates.get(svr)
+                        name = svr
+                    else:
+                        rate = self.tr_rates.get(tr_id)
+                        name = f"{svr}.{tr_id}"
+                    bucket = self._newBucket(name, rate) if rate else False
+                    self._buckets[key] = bucket
+        return bucket
+
+    def reserve(self, svr: str, tr_id: str = None, server: bool = True) -> float:
+        """
+        서버 한도와 TR 한도를 모두 예약하고 필요한 대기 시간(초)을 반환합니다.
+        server=False 면 서버 한도는 이미 받은 것으로 보고 TR 한도만 예약합니다.
+        """
+        wait = 0.0
+        for bucket in (self._bucket(svr) if server else None, self._bucket(svr, tr_id) if tr_id else None):
+            if bucket:
+                wait = max(wait, bucket.reserve())
+        return wait
+
+    def acquire(self, svr: str, tr_id: str = None, server: bool = True) -> float:
+        """호출이 허용될 때까지 대기하고, 실제로 대기한 시간(초)을 반환합니다."""
+        wait = self.reserve(svr, tr_id, server)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def limiter_from_env() -> RateLimiter:
+    """
+    환경변수로 기본 RateLimiter 를 만듭니다.
+        KIS_RATE_PROD : 실전투자 초당 호출 수 (기본 18, 공식 한도 20 에서 여유를 둠)
+        KIS_RATE_VPS : 모의투자 초당 호출 수 (기본 2)
+        KIS_RATE_BURST : 버킷 용량 (기본 1)
+        KIS_RATE_SHARED_DIR : 워커 프로세스 간 한도를 공유할 디렉토리 (비우면 프로세스별 한도)
+    """
+    return RateLimiter(
+        rates={
+            "prod": float(os.getenv("KIS_RATE_PROD", "18")),
+            "vps": float(os.getenv("KIS_RATE_VPS", "2")),
+        },
+        burst=float(os.getenv("KIS_RATE_BURST", "1")),
+        shared_dir=os.getenv("KIS_RATE_SHARED_DIR") or None,
+    )
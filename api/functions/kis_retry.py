@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS REST 재시도 / 백오프 / 서킷 브레이커  |=====================
+# 일시적인 실패(연결 실패, 게이트웨이 HTTP 5xx, 초당 거래건수 초과 EGW00201)는 지터를 섞은 지수 백오프로 다시 보내고,
+# KIS 가 장애 상태일 때는 호스트별 서킷 브레이커가 요청을 보내지 않고 바로 실패시켜 워커 스레드가 쌓이지 않게 합니다.
+#
+# 주문(POST: order_cash, order_rvsecncl 등)은 서버가 받았는지 알 수 없는 실패에 다시 보내면 중복 주문이 될 수 있으므로,
+# 서버가 처리하지 않았음이 확실한 경우(연결 타임아웃, EGW00201 거절)에만 재시도합니다.
+#
+# 브레이커 상태:
+#   closed    : 정상, 연속 실패가 threshold 에 이르면 open
+#   open      : reset_timeout 초 동안 요청을 보내지 않고 바로 실패 (APIRespError(0, "circuit open ..."))
+#   half_open : reset_timeout 이 지나면 시험 요청 하나만 보내 성공하면 closed, 실패하면 다시 open
+
+import os
+import random
+import threading
+import time
+
+import requests
+
+from api.functions.kis_metrics import RATE_LIMIT_CODE  # 초당 거래건수를 초과하였습니다. (서버가 처리하지 않고 거절)
+
+# 다시 보내도 되는 HTTP 상태 코드 (0 은 응답을 받지 못한 경우)
+RETRY_STATUSES = (0, 500, 502, 503, 504)
+
+
+def _isRateLimited(res) -> bool:
+    if res.isOK():
+        return False
+    code = res.getErrorCode()
+    if code == RATE_LIMIT_CODE:
+        return True
+    return RATE_LIMIT_CODE in str(getattr(res, "error_text", "") or "")
+
+
+def _isTransient(res) -> bool:
+    # 연결 실패 / 게이트웨이 5xx (브레이커 실패로 셈)
+    # 5xx 라도 본문이 KIS 오류 응답(msg_cd)이면 서버가 요청을 처리해 거절한 것이므로 제외
+    status = getattr(res, "status_code", 200)
+    if status not in RETRY_STATUSES or getattr(res, "circuit_open", False):
+        return False
+    return status == 0 or "msg_cd" not in str(getattr(res, "error_text", "") or "")
+
+
+def _notSent(res) -> bool:
+    # 요청이 서버에 닿지 않았거나 처리되지 않았음이 확실한 실패
+    return isinstance(getattr(res, "exception", None), requests.ConnectTimeout) or _isRateLimited(res)
+
+
+class RetryPolicy:
+    """
+    일시적인 실패를 지수 백오프(full jitter)로 다시 보내는 정책.
+
+    Args:
+        retries (int): 첫 요청 이후 최대 재시도 횟수
+        backoff (float): 첫 재시도 전 대기 상한(초), 재시도마다 두 배
+        max_backoff (float): 한 번의 대기 상한(초)
+        deadline (float): 첫 요청부터 재시도를 멈출 때까지의 시간(초), 0 이면 제한 없음
+
+    대기 시간은 0 ~ min(max_backoff, backoff * 2**attempt) 사이에서 고르게 뽑아 여러 워커가 동시에 다시 몰리지 않게 합니다.
+    """
+
+    def __init__(self, retries: int = 2, backoff: float = 0.2, max_backoff: float = 2.0, deadline: float = 10.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+
+    def delay(self, attempt: int) -> float:
+        """attempt 번째(0 부터) 재시도 전 대기 시간(초)"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    def should_retry(self, res, attempt: int, idempotent: bool = True) -> bool:
+        """
+        응답 res 를 받은 뒤 다시 보낼지 여부
+
+        Args:
+            res (APIResp | APIRespError): 방금 받은 응답
+            attempt (int): 지금까지 한 재시도 횟수
+            idempotent (bool): 다시 보내도 결과가 같은 요청인지 (조회 GET: True, 주문 POST: False)
+        """
+        if attempt >= self.retries or res.isOK() or getattr(res, "circuit_open", False):
+            return False
+        if not idempotent:
+            return _notSent(res)
+        return _isRateLimited(res) or _isTransient(res)
+
+
+class CircuitBreaker:
+    """
+    호스트별 서킷 브레이커 (스레드 안전).
+
+    Args:
+        threshold (int): open 으로 바꿀 연속 실패 수
+        reset_timeout (float): open 상태를 유지할 시간(초), 이후 시험 요청 하나를 허용
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._hosts = {}  # host → [연속 실패 수, open 된 시각(monotonic, closed 면 None), 시험 요청 진행 중]
+        self._lock = threading.Lock()
+
+    def allow(self, host) -> bool:
+        """요청을 보내도 되는지 (open 이면 False, half_open 이면 시험 요청 하나만 True)"""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state[1] is None:
+                return True
+            if state[2] or time.monotonic() - state[1] < self.reset_timeout:
+                return False
+            state[2] = True
+            return True
+
+    def record(self, host, ok: bool):
+        """요청 결과 기록 (ok=False 는 연결 실패 / 5xx 처럼 KIS 장애로 볼 수 있는 실패)"""
+        with self._lock:
+            state = self._hosts.get(host)
+            if ok:
+                if state is not None:
+                    del self._hosts[host]
+                return
+            if state is None:
+                state = self._hosts[host] = [0, None, False]
+            state[0] += 1
+            if state[2] or state[0] >= self.threshold:
+                state[1] = time.monotonic()
+            state[2] = False
+
+    def state(self, host) -> str:
+        """closed / open / half_open"""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state[1] is None:
+                return "closed"
+            if state[2] or time.monotonic() - state[1] >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+
+def call_with_retry(send, policy: RetryPolicy = None, breaker: CircuitBreaker = None, host=None,
+                    idempotent: bool = True, on_retry=None, on_reject=None, sleep=time.sleep):
+    """
+    send() 를 정책에 따라 다시 보내며 마지막 응답을 반환합니다.
+
+    Args:
+        send (Callable): 요청 한 번을 보내고 APIResp / APIRespError 를 반환하는 함수
+        policy (RetryPolicy): 재시도 정책 (None 이면 재시도 안 함)
+        breaker (CircuitBreaker): 서킷 브레이커 (None 이면 사용 안 함)
+        host (str): 브레이커 키
+        idempotent (bool): 다시 보내도 되는 요청인지 (주문은 False)
+        on_retry (Callable): 재시도 직전에 (attempt, res) 로 호출
+        on_reject (Callable): 브레이커가 열려 있을 때 보낼 응답을 만드는 함수
+    """
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        if breaker is not None and not breaker.allow(host):
+            return on_reject()
+        try:
+            res = send()
+        except Exception:
+            if breaker is not None:
+                breaker.record(host, False)
+            raise
+        if breaker is not None:
+            # 초당 거래건수 초과는 KIS 장애가 아니라 우리 호출량 문제이므로 실패로 세지 않음
+            breaker.record(host, not _isTransient(res) or _isRateLimited(res))
+        if policy is None or not policy.should_retry(res, attempt, idempotent):
+            return res
+        wait = policy.delay(attempt)
+        if policy.deadline and time.monotonic() - start + wait > policy.deadline:
+            return res
+        if on_retry is not None:
+            on_retry(attempt, res)
+        sleep(wait)
+        attempt += 1
+
+
+def retry_policy_from_env():
+    """
+    환경변수로 기본 RetryPolicy 를 만듭니다.
+        KIS_RETRY_MAX : 최대 재시도 횟수 (기본 2, 0 이면 재시도 안 함)
+        KIS_RETRY_BACKOFF : 첫 재시도 대기 상한(초, 기본 0.2)
+        KIS_RETRY_BACKOFF_MAX : 한 번의 대기 상한(초, 기본 2)
+        KIS_RETRY_DEADLINE : 재시도를 멈출 총 경과 시간(초, 기본 10)
+    """
+    retries = int(os.getenv("KIS_RETRY_MAX", "2"))
+    if retries <= 0:
+        return None
+    return RetryPolicy(
+        retries=retries,
+        backoff=float(os.getenv("KIS_RETRY_BACKOFF", "0.2")),
+        max_backoff=float(os.getenv("KIS_RETRY_BACKOFF_MAX", "2")),
+        deadline=float(os.getenv("KIS_RETRY_DEADLINE", "10")),
+    )
+
+
+def breaker_from_env():
+    """
+    환경변수로 기본 CircuitBreaker 를 만듭니다.
+        KIS_CIRCUIT_THRESHOLD : open 으로 바꿀 연속 실패 수 (기본 5, 0 이면 사용 안 함)
+        KIS_CIRCUIT_RESET : open 상태 유지 시간(초, 기본 30)
+    """
+    threshold = int(os.getenv("KIS_CIRCUIT_THRESHOLD", "5"))
+    if threshold <= 0:
+        return None
+    return CircuitBreaker(threshold, float(os.getenv("KIS_CIRCUIT_RESET", "30")))
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# ====|  TR 별 응답 숫자 컬럼 스키마  |=====================
+# KIS REST 응답은 가격/수량/금액도 모두 문자열이라, DataFrame 을 만들면 object 컬럼이 되어 쓰는 쪽마다 astype 이 필요했습니다.
+# API 문서 xlsx(저장소에 포함된 한국투자증권_오픈API_전체문서_*.xlsx)의 Response Body 항목과 Response Example 값으로
+# TR 별 정수/실수 컬럼을 정해 api/data/kis_schema.json 에 저장해 두고, 응답을 DataFrame 으로 만들 때 그 컬럼만
+# 숫자로 변환합니다. (코드/일자/시간/번호/부호 등은 앞자리 0 유지를 위해 문자열 그대로)
+#
+# 스키마 다시 만들기 (API 문서가 갱신된 경우), 인자 없이 실행하면 응답 처리 벤치마크:
+#     python -m api.functions.kis_schema 한국투자증권_오픈API_전체문서_YYYYMMDD_HHMMSS.xlsx
+#
+# 사용 예:
+#     df = to_frame(res.getBody().output, "FHKST01010100")   # res.frame("output") 과 같음
+#     df["stck_prpr"].dtype                                   # int64
+
+import html
+import json
+import os
+import re
+import threading
+import zipfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "kis_schema.json")
+
+# 문자열로 두는 항목: 한글명에 아래 단어가 있거나 영문명이 아래 접미사로 끝나는 경우
+# (부호는 "sign", "..._vrsssign" 처럼 밑줄 없이 붙는 경우도 있으므로 "sign" 으로 끝나면 모두 문자열)
+_STR_WORDS = ("코드", "여부", "일자", "일시", "시간", "시각", "번호", "명", "구분", "부호", "사유", "내용", "주소", "유형",
+              "종류", "년월", "상태", "기준일", "만기일", "계좌", "ID", "키", "URL", "메세지", "메시지", "표시", "방법")
+_STR_SUFFIXES = ("_cd", "_code", "_yn", "_dt", "_date", "_hour", "_tmd", "_time", "_no", "_id", "_name", "_nm",
+                 "_isnm", "_iscd", "sign", "_dvsn", "_cls", "_text", "_url", "_ymd", "_ym", "_tp", "_stat")
+# 숫자로 두는 항목: 한글명에 아래 단어가 있는 경우
+_NUM_WORDS = ("가", "량", "액", "금", "수", "율", "률", "비", "배", "지수", "손익", "잔고", "평가", "이자", "수익", "환산",
+              "합계", "누적", "대금", "잔량", "건수", "주수", "단가", "값", "점", "이익", "자산", "부채", "자본", "매출",
+              "약정", "헤지", "투기", "누락", "크기", "괴리", "베이시스", "기어링", "감마", "델타", "베가", "세타", "변동성",
+              "이격도", "강도", "PER", "PBR", "EPS", "BPS", "NAV", "EBITDA", "EVA", "ROE")
+# 실수로 두는 항목
+_FLOAT_WORDS = ("율", "률", "비율", "배", "퍼센트", "%", "괴리", "베이시스", "기어링", "감마", "델타", "베가", "세타",
+                "변동성", "이격도", "강도", "PER", "PBR", "EPS", "BPS", "NAV")
+_FLOAT_SUFFIXES = ("_rate", "_ctrt", "_rt", "_prpr_rate", "_tnrt", "_pct")
+
+_NUMBER = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+_TR_ID = re.compile(r"\b[A-Z][A-Z0-9]{6,}\b")
+
+
+# ----- xlsx 읽기 (openpyxl 없이 zip/xml 로) -----
+
+def _sheets(path: str):
+    """(시트 이름, 행 목록) 을 차례로 내줍니다. 행은 셀 문자열 목록."""
+    with zipfile.ZipFile(path) as z:
+        shared = [html.unescape(re.sub(r"<[^>]+>", "", s))
+                  for s in re.findall(r"<si>(.*?)</si>", z.read("xl/sharedStrings.xml").decode("utf-8"), re.S)]
+        workbook = z.read("xl/workbook.xml").decode("utf-8")
+        rels = dict(re.findall(r'Id="([^"]+)" Target="([^"]+)"', z.read("xl/_rels/workbook.xml.rels").decode("utf-8")))
+        for name, rid in re.findall(r'<sheet [^>]*name="([^"]+)"[^>]*r:id="([^"]+)"', workbook):
+            xml = z.read("xl/" + rels[rid].lstrip("/").replace("xl/", "", 1)).decode("utf-8")
+            rows = []
+            for row in re.findall(r"<row[^>]*>(.*?)</row>", xml, re.S):
+                cells = []
+                for attrs, body in re.findall(r"<c ([^>]*?)(?:/>|>(.*?)</c>)", row, re.S):
+                    value = re.search(r"<v>(.*?)</v>", body or "")
+                    text = value.group(1) if value else re.sub(r"<[^>]+>", "", body or "")
+                    if 't="s"' in attrs and value:
+                        text = shared[int(text)]
+                    cells.append(html.unescape(text))
+                rows.append(cells)
+            yield html.unescape(name), rows
+
+
+def _exampleValues(text: str) -> Dict[str, List[str]]:
+    """Response Example JSON 의 필드별 값 목록 (output 안쪽까지)"""
+    values: Dict[str, List[str]] = {}
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    walk(value)
+                else:
+                    values.setdefault(key.lower(), []).append("" if value is None else str(value))
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    try:
+        walk(json.loads(text))
+    except ValueError:
+        # 예시가 JSON 이 아니면 "key": "value" 쌍만 모음
+        for key, value in re.findall(r'"(\w+)"\s*:\s*"([^"]*)"', text):
+            values.setdefault(key.lower(), []).append(value)
+    return values
+
+
+def classify(element: str, name: str, examples: Iterable[str] = ()) -> Optional[str]:
+    """
+    응답 항목 하나의 타입을 정합니다.
+
+    Returns:
+        str: "int", "float" 또는 None(문자열)
+    """
+    element = element.lower()
+    name = re.sub(r"\s+", "", name)
+    examples = [v.strip() for v in examples if v and v.strip()]
+    if any(word in name.replace("시간외", "") for word in _STR_WORDS) or element.endswith(_STR_SUFFIXES):
+        return None
+    if not any(word in name for word in _NUM_WORDS):
+        return None
+    if any(not _NUMBER.match(v) for v in examples):
+        return None
+    if (any(word in name for word in _FLOAT_WORDS) or element.endswith(_FLOAT_SUFFIXES)
+            or any("." in v for v in examples)):
+        return "float"
+    return "int"
+
+
+def build_schema(xlsx_path: str) -> Dict[str, Dict[str, List[str]]]:
+    """API 문서 xlsx → {TR ID: {"int": [...], "float": [...]}} (숫자 항목이 있는 TR 만)"""
+    schema = {}
+    for _, rows in _sheets(xlsx_path):
+        meta = {row[0]: row[1] for row in rows if len(row) > 1}
+        tr_ids = _TR_ID.findall(meta.get("실전 TR_ID", "")) + _TR_ID.findall(meta.get("모의 TR_ID", ""))
+        if not tr_ids:
+            continue
+        examples = _exampleValues(meta.get("Response Example", ""))
+
+        section, types = None, {"int": [], "float": []}
+        for row in rows:
+            cells = row
+            if row and row[0] in ("Request Header", "Request Query Parameter", "Request Body", "Response Header",
+                                  "Response Body", "Example", "Layout"):
+                section, cells = row[0], row[1:]
+            if section != "Response Body" or len(cells) < 3 or cells[2] != "string":
+                continue
+            element = cells[0].strip().lower()
+            kind = classify(element, cells[1], examples.get(element, ()))
+            if kind and element not in types[kind]:
+                types[kind].append(element)
+
+        if types["int"] or types["float"]:
+            for tr_id in dict.fromkeys(tr_ids):
+                schema[tr_id] = {kind: sorted(columns) for kind, columns in types.items() if columns}
+    return dict(sorted(schema.items()))
+
+
+# ----- 스키마 조회 / 변환 -----
+
+_schema: Optional[Dict[str, Tuple[frozenset, frozenset]]] = None
+_schema_lock = threading.Lock()
+
+
+def load_schema(path: str = None) -> Dict[str, Tuple[frozenset, frozenset]]:
+    """{TR ID: (정수 컬럼, 실수 컬럼)} (스키마 파일이 없으면 빈 dict)"""
+    try:
+        with open(path or SCHEMA_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {tr_id: (frozenset(types.get("int", ())), frozenset(types.get("float", ())))
+            for tr_id, types in data.items()}
+
+
+def column_types(tr_id: str) -> Tuple[frozenset, frozenset]:
+    """TR 의 (정수 컬럼, 실수 컬럼). 모의투자 TR(V...)은 실전 TR 스키마를 사용합니다."""
+    global _schema
+    if _schema is None:
+        with _schema_lock:
+            if _schema is None:
+                _schema = load_schema()
+    types = _schema.get(tr_id)
+    if types is None and tr_id and tr_id[0] == "V":
+        for prefix in ("T", "J", "C"):
+            types = _schema.get(prefix + tr_id[1:])
+            if types is not None:
+                break
+    return types or (frozenset(), frozenset())
+
+
+def set_schema(schema: Optional[Dict[str, Tuple[frozenset, frozenset]]]) -> None:
+    """스키마 교체 (None 이면 다음 조회 때 파일에서 다시 읽음)"""
+    global _schema
+    _schema = schema
+
+
+def as_records(value):
+    """body 의 output 값을 행(dict) 목록으로 정규화 (object 형 응답은 한 행)"""
+    if value is None or value == "":
+        return []
+    if isinstance(value, dict):
+        return [value]
+    return list(value)
+
+
+def _numeric(values: list, integer: bool):
+    """
+    문자열 값 목록 → int64/float64 배열, 빈 값이 있으면 Int64/float64 (숫자가 아닌 값이 있으면 None)
+    int64 범위를 넘는 정수(큰 원화 금액/누적 거래량 등)가 있으면 float64
+    """
+    try:
+        return np.array(values, dtype=np.int64 if integer else np.float64)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    numbers = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+    if (numbers.isna() & pd.Series([v is not None and str(v).strip() != "" for v in values])).any():
+        return None  # 숫자가 아닌 값이 있으면 스키마가 틀린 것이므로 원래 문자열 유지
+    numbers = numbers.astype("float64")
+    if integer and not (numbers.dropna() % 1 != 0).any() and not (numbers.abs() >= 2 ** 63).any():
+        return numbers.astype("Int64") if numbers.hasnans else numbers.astype("int64")
+    return numbers  # 소수가 있는 정수 컬럼/실수 컬럼
+
+
+def to_frame(records, tr_id: str = None) -> pd.DataFrame:
+    """
+    output 행들을 DataFrame 으로 만들고 tr_id 스키마의 숫자 컬럼을 변환합니다.
+
+    Args:
+        records: output 값 (행 dict 목록 또는 dict 하나)
+        tr_id (str): 응답의 TR ID (없거나 스키마에 없으면 변환하지 않음)
+
+    Returns:
+        pd.DataFrame: 정수 컬럼 int64 (빈 값이 있으면 Int64), 실수 컬럼 float64, 나머지 문자열
+    """
+    records = as_records(records)
+    ints, floats = column_types(tr_id) if tr_id else (frozenset(), frozenset())
+    if not records or not (ints or floats):
+        return pd.DataFrame(records)
+
+    # 행마다 dict 를 해석하는 대신 컬럼별 목록으로 모아 숫자 컬럼은 바로 numpy 배열로 변환
+    columns = list(records[0])
+    if any(len(rec) != len(columns) for rec in records):
+        columns = list(dict.fromkeys(c for rec in records for c in rec))
+    data = {}
+    for column in columns:
+        values = [rec.get(column) for rec in records]
+        key = column.lower() if isinstance(column, str) else column  # 일부 TR 은 응답 필드가 대문자
+        if key in ints or key in floats:
+            converted = _numeric(values, key in ints)
+            if converted is not None:
+                values = converted
+        data[column] = values
+    return pd.DataFrame(data)
+
+
+def _sampleResponse(rows: int = 100):
+    # 국내주식기간별시세(FHKST03010100) 형식의 가짜 응답
+    import random
+
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    rnd = random.Random(0)
+    output2 = [{
+        "stck_bsop_date": f"2024{1 + i // 28:02d}{1 + i % 28:02d}", "stck_clpr": str(rnd.randint(50000, 90000)),
+        "stck_oprc": str(rnd.randint(50000, 90000)), "stck_hgpr": str(rnd.randint(50000, 90000)),
+        "stck_lwpr": str(rnd.randint(50000, 90000)), "acml_vol": str(rnd.randint(10 ** 6, 10 ** 8)),
+        "acml_tr_pbmn": str(rnd.randint(10 ** 10, 10 ** 13)), "flng_cls_code": "00", "prtt_rate": "0.00",
+        "mod_yn": "N", "prdy_vrss_sign": "2", "prdy_vrss": str(rnd.randint(-3000, 3000)), "revl_issu_reas": "",
+    } for i in range(rows)]
+    body = {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.",
+            "output1": {"stck_prpr": "71000", "prdy_ctrt": "1.23", "hts_kor_isnm": "삼성전자"}, "output2": output2}
+    res = requests.Response()
+    res.status_code = 200
+    res._content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    res.encoding = "utf-8"
+    res.headers = CaseInsensitiveDict({"Content-Type": "application/json; charset=utf-8", "tr_id": "FHKST03010100",
+                                       "tr_cont": "", "gt_uid": "0000"})
+    return res
+
+
+def benchmark(rows: int = 100, number: int = 2000):
+    """응답 처리(APIResp 생성 + output2 DataFrame) 비교: 예전 방식(json 두 번 파싱, 응답마다 namedtuple 클래스 생성, 문자열 컬럼) 대 현재"""
+    import timeit
+    from collections import namedtuple
+
+    from api.functions.kis_auth import APIResp
+
+    res = _sampleResponse(rows)
+
+    def before():
+        fld = {x: res.headers.get(x) for x in res.headers.keys() if x.islower()}
+        namedtuple("header", fld.keys())(**fld)
+        body = namedtuple("body", res.json().keys())(**res.json())
+        df = pd.DataFrame(body.output2)
+        return df["stck_clpr"].astype("int64").mean()  # 쓰는 쪽에서 매번 변환
+
+    def after():
+        df = APIResp(res, "FHKST03010100").frame("output2")
+        return df["stck_clpr"].mean()
+
+    assert before() == after()
+    for label, fn in (("before", before), ("after", after)):
+        elapsed = min(timeit.repeat(fn, number=number, repeat=3)) / number
+        print(f"{label:7s} {elapsed * 1e6:8.1f}us/response")
+    print("dtypes:", dict(APIResp(res, "FHKST03010100").frame("output2").dtypes.astype(str)))
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        benchmark()
+        sys.exit()
+    result = build_schema(sys.argv[1])
+    out = sys.argv[2] if len(sys.argv) > 2 else SCHEMA_PATH
+    with open(out, "w", encoding="utf-8") as f:
+        # TR 하나에 한 줄 (문서 갱신 시 diff 를 보기 쉽도록)
+        f.write("{\n" + ",\n".join(f"{json.dumps(tr_id)}: {json.dumps(types)}" for tr_id, types in result.items())
+                + "\n}\n")
+    print(f"{len(result)} TRs -> {out}")
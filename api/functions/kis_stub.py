@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS REST 로컬 스텁 서버  |=====================
+# 실제 서버와 호출 한도를 쓰지 않고 kis_auth / domestic_stock_functions 전체 경로를 부하 테스트할 수 있도록
+# KIS REST 서버의 동작을 흉내 냅니다. (kis_ws_stub 의 REST 판)
+#   - POST /oauth2/tokenP, /oauth2/Approval, /uapi/hashkey : 토큰 / 웹소켓 접속키 / hashkey 발급
+#   - GET  quotations/inquire-price(-2)                    : 종목코드별로 고정된 시작가에서 움직이는 현재가
+#   - GET  trading/inquire-balance                         : 보유 종목을 page_size 개씩 연속조회(tr_cont M/D, ctx_area_nk100)
+#   - POST trading/order-cash                              : 현재가로 바로 체결되어 예수금 / 보유 종목에 반영
+#   - latency 로 응답 지연, rate 로 초당 호출 한도(초과 시 HTTP 500 EGW00201)를 흉내 냄
+#
+# 사용 예:
+#     with StubKisServer(latency=0.02, rate=20) as server:
+#         server.install()          # 환경변수(prod/vps 도메인, 앱키, 계좌)를 스텁 서버로 설정
+#         ka.auth("prod", STUB_PRODUCT)
+#         dsf.inquire_price("real", "J", "005930")
+#
+#     python -m api.functions.kis_stub              # 스텁 서버에 inquire_price 부하를 걸어 처리량 출력
+#     python -m api.functions.kis_stub serve 8800   # 다른 프로세스에서 쓸 수 있게 서버만 실행
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qsl, urlsplit
+
+STUB_ACCOUNT = "50000000"
+STUB_PRODUCT = "01"
+BUY_TR_IDS = ("TTTC0012U", "VTTC0012U", "TTTC0802U", "VTTC0802U")
+SELL_TR_IDS = ("TTTC0011U", "VTTC0011U", "TTTC0801U", "VTTC0801U")
+
+
+def _ok(msg1="정상처리 되었습니다.", **outputs):
+    return {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": msg1, **outputs}
+
+
+def _fail(msg_cd, msg1):
+    return {"rt_cd": "1", "msg_cd": msg_cd, "msg1": msg1}
+
+
+class StubKisServer:
+    """
+    KIS REST 서버 스텁 (백그라운드 스레드에서 실행).
+
+    Args:
+        host (str): 바인드 주소
+        port (int): 포트 (0 이면 빈 포트)
+        latency (float): 응답마다 기다릴 시간(초)
+        rate (float): 초당 호출 한도 (0 이면 제한 없음, 토큰 발급 제외)
+        cash (int): 시작 예수금
+        holdings (dict): 시작 보유 종목 {종목코드: (수량, 평균단가)}
+        page_size (int): 잔고조회 한 페이지의 종목 수
+        seed (int): 현재가 난수 seed
+
+    Attributes:
+        url (str): start() 후 접속 주소 (http://127.0.0.1:<port>)
+        requests (dict): 경로별 받은 요청 수 (현재가 조회는 "quote")
+        tokens (set): 발급한 접근토큰
+        orders (list): 체결된 주문 목록
+        rejected (int): 호출 한도 초과로 거절한 요청 수
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, rate: float = 0.0,
+                 cash: int = 10_000_000, holdings: Dict[str, tuple] = None, page_size: int = 20, seed: int = 0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.rate = rate
+        self.cash = cash
+        self.holdings = {code: [int(qty), float(avg)] for code, (qty, avg) in (holdings or {}).items()}
+        self.page_size = page_size
+        self.url = None
+        self.requests: Dict[str, int] = {}
+        self.orders: List[dict] = []
+        self.rejected = 0
+        self.tokens = set()
+        self._random = random.Random(seed)
+        self._prices: Dict[str, int] = {}
+        self._calls = deque()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive (kis_auth 연결 풀 재사용)
+
+            def do_GET(self):
+                stub._handle(self, "GET")
+
+            def do_POST(self):
+                stub._handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://{self.host}:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, name="kis-stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def install(self):
+        """kis_auth 가 읽는 환경변수(실전/모의 도메인, 앱키, 계좌)를 이 서버로 설정합니다."""
+        os.environ.update({
+            "prod": self.url, "vps": self.url, "ops": "", "vops": "",
+            "my_app": "stub-app", "my_sec": "stub-secret", "paper_app": "stub-app", "paper_sec": "stub-secret",
+            "my_acct_stock": STUB_ACCOUNT, "my_paper_stock": STUB_ACCOUNT, "my_prod": STUB_PRODUCT,
+            "my_htsid": "stub",
+        })
+        return self
+
+    # ----- 시세 -----
+
+    def price(self, code: str) -> int:
+        """현재가 (호출마다 ±0.5% 안에서 움직임, 종목코드별 시작가는 고정)"""
+        with self._lock:
+            price = self._prices.get(code)
+            if price is None:
+                price = 5000 + zlib.crc32(code.encode()) % 95000
+            else:
+                price = max(100, price + int(price * self._random.uniform(-0.005, 0.005)))
+            price = price // 10 * 10
+            self._prices[code] = price
+            return price
+
+    def _quote(self, params):
+        code = params.get("FID_INPUT_ISCD", "")
+        if not code:
+            return _fail("OPSQ2001", "FID_INPUT_ISCD 를 입력하세요.")
+        prpr = self.price(code)
+        base = 5000 + zlib.crc32(code.encode()) % 95000 // 10 * 10
+        diff = prpr - base
+        output = {
+            "stck_prpr": str(prpr), "prdy_vrss": str(diff), "prdy_vrss_sign": "2" if diff > 0 else "5" if diff < 0 else "3",
+            "prdy_ctrt": f"{diff / base * 100:.2f}", "stck_oprc": str(base), "stck_hgpr": str(max(base, prpr)),
+            "stck_lwpr": str(min(base, prpr)), "stck_sdpr": str(base), "stck_mxpr": str(base * 13 // 10),
+            "stck_llam": str(base * 7 // 10), "acml_vol": str(self.requests.get("quote", 0) * 10),
+            "acml_tr_pbmn": str(self.requests.get("quote", 0) * 10 * prpr), "per": "10.00", "pbr": "1.00",
+            "eps": str(prpr // 10), "bps": str(prpr), "hts_kor_isnm": f"STUB{code}",
+        }
+        return _ok(output=output)
+
+    # ----- 계좌 -----
+
+    def _balance(self, params):
+        if params.get("CANO") != STUB_ACCOUNT:
+            return _fail("OPSQ2000", "ERROR : INPUT INVALID_CHECK_ACNO"), ""
+        try:
+            offset = int(params.get("CTX_AREA_NK100") or 0)
+        except ValueError:
+            offset = 0
+        with self._lock:
+            items = sorted(self.holdings.items())
+            cash = self.cash
+        rows, evlu_total, pchs_total = [], 0, 0
+        for code, (qty, avg) in items:
+            prpr = self._prices.get(code) or self.price(code)
+            evlu, pchs = qty * prpr, int(qty * avg)
+            evlu_total += evlu
+            pchs_total += pchs
+            rows.append({
+                "pdno": code, "prdt_name": f"STUB{code}", "trad_dvsn_name": "현금", "hldg_qty": str(qty),
+                "ord_psbl_qty": str(qty), "pchs_avg_pric": f"{avg:.4f}", "pchs_amt": str(pchs), "prpr": str(prpr),
+                "evlu_amt": str(evlu), "evlu_pfls_amt": str(evlu - pchs),
+                "evlu_pfls_rt": f"{(evlu - pchs) / pchs * 100 if pchs else 0:.2f}", "fltt_rt": "0.00",
+            })
+        page = rows[offset:offset + self.page_size]
+        more = offset + self.page_size < len(rows)
+        summary = {
+            "dnca_tot_amt": str(cash), "nxdy_excc_amt": str(cash), "prvs_rcdl_excc_amt": str(cash),
+            "scts_evlu_amt": str(evlu_total), "tot_evlu_amt": str(cash + evlu_total), "nass_amt": str(cash + evlu_total),
+            "pchs_amt_smtl_amt": str(pchs_total), "evlu_amt_smtl_amt": str(evlu_total),
+            "evlu_pfls_smtl_amt": str(evlu_total - pchs_total),
+        }
+        body = _ok("조회가 완료되었습니다.", ctx_area_fk100=params.get("CTX_AREA_FK100", ""),
+                   ctx_area_nk100=str(offset + self.page_size) if more else "", output1=page, output2=[summary])
+        return body, "M" if more else "D"
+
+    def _order(self, tr_id, params):
+        if params.get("CANO") != STUB_ACCOUNT:
+            return _fail("OPSQ2000", "ERROR : INPUT INVALID_CHECK_ACNO")
+        code = params.get("PDNO", "")
+        try:
+            qty = int(params.get("ORD_QTY") or 0)
+            unpr = int(params.get("ORD_UNPR") or 0)
+        except ValueError:
+            return _fail("APBK0918", "주문수량/단가를 확인하세요.")
+        if not code or qty <= 0:
+            return _fail("APBK0918", "주문수량/단가를 확인하세요.")
+        price = self.price(code)
+        buy = tr_id in BUY_TR_IDS
+        if params.get("ORD_DVSN", "00") == "00" and unpr and (price > unpr if buy else price < unpr):
+            price = unpr  # 지정가는 주문단가에 체결된 것으로 봄
+        with self._lock:
+            holding = self.holdings.get(code, [0, 0.0])
+            if buy:
+                if price * qty > self.cash:
+                    return _fail("APBK0952", "주문가능금액을 초과 했습니다")
+                self.cash -= price * qty
+                holding = [holding[0] + qty, (holding[0] * holding[1] + qty * price) / (holding[0] + qty)]
+            else:
+                if holding[0] < qty:
+                    return _fail("APBK0400", "주문 가능한 수량을 초과하였습니다.")
+                self.cash += price * qty
+                holding = [holding[0] - qty, holding[1]]
+            if holding[0]:
+                self.holdings[code] = holding
+            else:
+                self.holdings.pop(code, None)
+            odno = f"{len(self.orders) + 1:010d}"
+            now = datetime.now().strftime("%H%M%S")
+            self.orders.append({"odno": odno, "tr_id": tr_id, "pdno": code, "qty": qty, "price": price, "time": now})
+        return _ok("주문 전송 완료 되었습니다.", output={"KRX_FWDG_ORD_ORGNO": "06010", "ODNO": odno, "ORD_TMD": now})
+
+    # ----- HTTP -----
+
+    def _limited(self) -> bool:
+        if not self.rate:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._calls and self._calls[0] <= now - 1.0:
+                self._calls.popleft()
+            if len(self._calls) >= self.rate:
+                self.rejected += 1
+                return True
+            self._calls.append(now)
+            return False
+
+    def _route(self, method, path, headers, params, body):
+        # (HTTP 상태, 본문 dict, tr_cont)
+        if path == "/oauth2/tokenP":
+            token = f"stub-{os.urandom(8).hex()}"
+            with self._lock:
+                self.tokens.add(token)
+            expired = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+            return 200, {"access_token": token, "token_type": "Bearer", "expires_in": 86400,
+                         "access_token_token_expired": expired}, ""
+        if path == "/oauth2/Approval":
+            return 200, {"approval_key": f"stub-{os.urandom(8).hex()}"}, ""
+        if path == "/uapi/hashkey":
+            return 200, {"BODY": body, "HASH": os.urandom(16).hex()}, ""
+
+        # 재시작 전에 발급해 토큰 저장소에 남아 있는 스텁 토큰도 허용
+        if not headers.get("authorization", "").startswith("Bearer stub-"):
+            return 500, _fail("EGW00121", "유효하지 않은 token 입니다."), ""
+        if self._limited():
+            return 500, _fail("EGW00201", "초당 거래건수를 초과하였습니다."), ""
+
+        tr_id = headers.get("tr_id", "")
+        if method == "GET" and path.endswith(("/quotations/inquire-price", "/quotations/inquire-price-2")):
+            return 200, self._quote(params), ""
+        if method == "GET" and path.endswith("/trading/inquire-balance"):
+            result, tr_cont = self._balance(params)
+            return 200, result, tr_cont
+        if method == "POST" and path.endswith("/trading/order-cash"):
+            if tr_id not in BUY_TR_IDS + SELL_TR_IDS:
+                return 500, _fail("EGW00203", f"tr_id 를 확인하세요: {tr_id}"), ""
+            return 200, self._order(tr_id, body), ""
+        return 404, _fail("EGW00202", f"스텁 서버가 지원하지 않는 API 입니다: {method} {path}"), ""
+
+    def _handle(self, handler, method):
+        split = urlsplit(handler.path)
+        headers = {k.lower(): v for k, v in handler.headers.items()}
+        params = dict(parse_qsl(split.query, keep_blank_values=True))
+        body = {}
+        length = int(headers.get("content-length") or 0)
+        if length:
+            try:
+                body = json.loads(handler.rfile.read(length))
+            except ValueError:
+                body = {}
+
+        key = "quote" if "/quotations/inquire-price" in split.path else split.path
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        status, result, tr_cont = self._route(method, split.path, headers, params, body)
+        data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.send_header("tr_id", headers.get("tr_id", ""))
+        handler.send_header("tr_cont", tr_cont)
+        handler.send_header("gt_uid", os.urandom(16).hex())
+        handler.end_headers()
+        handler.wfile.write(data)
+
+
+def load_test(codes: int = 200, calls: int = 2000, workers: int = 16, latency: float = 0.02, rate: float = 0.0):
+    """스텁 서버에 inquire_price 를 workers 개 스레드로 calls 번 호출하고 처리량과 지연 분포를 출력합니다."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import api.functions.kis_auth as ka
+    from api.functions import domestic_stock_functions as dsf
+    from api.functions.kis_metrics import Metrics, set_metrics
+
+    with StubKisServer(latency=latency, rate=rate) as server:
+        server.install()
+        metrics = Metrics()
+        set_metrics(metrics)
+        ka.set_quote_cache(None)
+        if not rate:
+            ka.set_rate_limiter(None)
+        ka.configure_session(pool_size=workers)
+        ka.auth("prod", STUB_PRODUCT)
+
+        symbols = [f"{i:06d}" for i in range(codes)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            frames = list(pool.map(lambda i: dsf.inquire_price("real", "J", symbols[i % codes]), range(calls)))
+        elapsed = time.perf_counter() - start
+
+        ok = sum(1 for df in frames if not df.empty)
+        stats = metrics.snapshot().get("FHKST01010100", {})
+        print(f"{calls} calls / {workers} workers: {elapsed:.2f}s, {calls / elapsed:.0f} calls/s, ok={ok}, "
+              f"rejected={server.rejected}, retries={stats.get('retries', 0)}")
+        print(f"latency p50={stats.get('p50', 0) * 1e3:.1f}ms p95={stats.get('p95', 0) * 1e3:.1f}ms "
+              f"p99={stats.get('p99', 0) * 1e3:.1f}ms (server latency {latency * 1e3:.0f}ms)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        server = StubKisServer(port=int(sys.argv[2]) if len(sys.argv) > 2 else 8800).start()
+        print(f"KIS stub server: {server.url} (prod/vps 환경변수를 이 주소로 지정)")
+        server._thread.join()
+    else:
+        load_test()
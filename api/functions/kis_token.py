@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS 접근토큰 저장소  |=====================
+# 접근토큰은 유효기간 1일이며 발급 요청은 1분당 1회로 제한되고, 발급 시마다 알림톡이 발송됩니다.
+# 메모리 캐시 → 파일 저장소 순서로 찾고, 둘 다 없거나 곧 만료될 때만 새로 발급합니다.
+# 발급은 (서버, 앱키) 별로 스레드 락과 파일 잠금을 함께 잡아, 여러 스레드/워커 프로세스가
+# 동시에 만료를 발견해도 실제 발급 요청은 한 번만 나가도록 합니다(single-flight).
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows 에서는 프로세스 간 잠금 없이 프로세스 내 락만 사용
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+EXPIRED_FORMAT = "%Y-%m-%d %H:%M:%S"  # access_token_token_expired 형식
+
+
+def _tokenKey(svr, appkey):
+    # 파일에 앱키가 그대로 남지 않도록 해시값으로 키를 만듦
+    digest = hashlib.sha256((appkey or "").encode("utf-8")).hexdigest()[:16]
+    return f"{svr}:{digest}"
+
+
+class TokenStore:
+    """
+    (서버, 앱키) 별 접근토큰을 JSON 파일 하나에 보관하는 저장소.
+    쓰기는 임시 파일에 쓴 뒤 os.replace 로 교체하므로 읽는 쪽이 반쯤 쓰인 파일을 보지 않습니다.
+
+    파일 형식: {"prod:<앱키 해시>": {"token": "...", "expires": 1760000000.0}, ...}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = path + ".lock"
+
+    def _readAll(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def load(self, svr, appkey):
+        """저장된 (token, 만료 epoch 초) 또는 None"""
+        entry = self._readAll().get(_tokenKey(svr, appkey))
+        if not entry:
+            return None
+        return entry.get("token"), float(entry.get("expires", 0))
+
+    def save(self, svr, appkey, token, expires):
+        """토큰을 원자적으로 저장합니다. (다른 키의 토큰은 유지)"""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        data = self._readAll()
+        data[_tokenKey(svr, appkey)] = {"token": token, "expires": expires}
+
+        fd, tmp = tempfile.mkstemp(prefix=".kis_token.", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @contextmanager
+    def lock(self):
+        """같은 저장소를 쓰는 프로세스 사이의 배타 잠금"""
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        with open(self.lock_path, "a+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class TokenCache:
+    """
+    메모리 캐시 + TokenStore 로 접근토큰을 관리합니다.
+
+    Args:
+        store (TokenStore): 영구 저장소 (None 이면 메모리에만 보관)
+        refresh_margin (float): 만료까지 이 시간(초)보다 적게 남으면 미리 재발급
+    """
+
+    def __init__(self, store: TokenStore = None, refresh_margin: float = 3600.0):
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self._tokens = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _keyLock(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _fresh(self, entry, now):
+        return entry is not None and entry[0] and entry[1] - self.refresh_margin > now
+
+    def needs_refresh(self, svr, appkey):
+        """메모리의 토큰이 없거나 만료 임박인지 여부"""
+        return not self._fresh(self._tokens.get(_tokenKey(svr, appkey)), time.time())
+
+    def refresh_at(self, svr, appkey) -> float:
+        """메모리의 토큰을 미리 재발급해야 하는 시각(epoch 초), 토큰이 없으면 0"""
+        entry = self._tokens.get(_tokenKey(svr, appkey))
+        return entry[1] - self.refresh_margin if entry is not None and entry[0] else 0.0
+
+    def peek(self, svr, appkey):
+        """만료되지 않은 토큰 (재발급 없이, 없으면 None)"""
+        key = _tokenKey(svr, appkey)
+        entry = self._tokens.get(key)
+        if entry is None and self.store is not None:
+            entry = self.store.load(svr, appkey)
+        if entry is not None and entry[0] and entry[1] > time.time():
+            return entry[0]
+        return None
+
+    def get(self, svr, appkey, issue):
+        """
+        유효한 토큰을 반환하고, 없거나 곧 만료되면 issue() 로 한 번만 발급합니다.
+
+        Args:
+            issue (Callable): () -> (token, 만료 datetime | epoch 초) 발급 함수, 실패 시 None
+
+        Returns:
+            str: 접근토큰 (발급 실패하고 쓸 수 있는 기존 토큰도 없으면 None)
+        """
+        key = _tokenKey(svr, appkey)
+        entry = self._tokens.get(key)
+        if self._fresh(entry, time.time()):
+            return entry[0]
+
+        with self._keyLock(key):
+            # 락을 기다리는 동안 다른 스레드가 발급했을 수 있음
+            entry = self._tokens.get(key)
+            if self._fresh(entry, time.time()):
+                return entry[0]
+
+            if self.store is None:
+                entry, _ = self._issue(entry, issue)
+            else:
+                with self.store.lock():
+                    # 다른 프로세스가 발급해 저장했을 수 있음
+                    stored = self.store.load(svr, appkey)
+                    if self._fresh(stored, time.time()):
+                        entry = stored
+                    else:
+                        entry, issued = self._issue(entry or stored, issue)
+                        if issued:
+                            self.store.save(svr, appkey, *entry)
+
+            if entry is None:
+                return None
+            self._tokens[key] = entry
+            return entry[0]
+
+    def _issue(self, current, issue):
+        """issue() 로 발급한 (token, expires), 새로 발급했는지 여부"""
+        result = issue()
+        if result is None:
+            # 발급 실패 (1분당 1회 제한 등): 아직 만료되지 않은 기존 토큰이 있으면 계속 사용
+            if current is not None and current[0] and current[1] > time.time():
+                logger.warning("Token refresh failed, using current token until it expires.")
+                return current, False
+            return None, False
+
+        token, expires = result
+        if isinstance(expires, str):
+            expires = datetime.strptime(expires, EXPIRED_FORMAT)
+        if isinstance(expires, datetime):
+            expires = expires.timestamp()
+        return (token, float(expires)), True
+
+    def invalidate(self, svr=None, appkey=None):
+        """메모리 캐시를 비웁니다. (서버/앱키를 지정하면 해당 토큰만)"""
+        with self._lock:
+            if svr is None:
+                self._tokens.clear()
+            else:
+                self._tokens.pop(_tokenKey(svr, appkey), None)
+
+
+def cache_from_env(config_root="api/data") -> TokenCache:
+    """
+    환경변수로 기본 TokenCache 를 만듭니다.
+        KIS_TOKEN_PATH : 토큰 저장 파일 (기본 api/data/.kis_token.json, 비우면 메모리에만 보관)
+        KIS_TOKEN_REFRESH_MARGIN : 만료 몇 초 전에 미리 재발급할지 (기본 3600)
+    """
+    path = os.getenv("KIS_TOKEN_PATH", os.path.join(config_root, ".kis_token.json"))
+    return TokenCache(
+        store=TokenStore(path) if path else None,
+        refresh_margin=float(os.getenv("KIS_TOKEN_REFRESH_MARGIN", "3600")),
+    )
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS REST 요청 기록 / 재생 transport  |=====================
+# _url_fetch 와 토큰 발급은 모두 kis_auth._getSession() 의 get/post 로 요청하므로,
+# 같은 모양의 객체를 configure_session(session=...) 으로 끼워 넣어 실제 요청/응답을 기록하거나 재생합니다.
+#   - RecordingTransport : 실제 세션으로 보내고 (method, path, tr_id, tr_cont, 파라미터) 와 응답(상태, tr_cont 등 헤더, 본문)을
+#                          카세트 파일에 한 줄씩 추가 (.gz 로 끝나면 gzip, 앱키/토큰 값은 가림)
+#   - ReplayTransport    : 카세트에서 같은 요청의 응답을 기록된 순서대로 돌려줌 (연속조회 tr_cont 포함),
+#                          latency/jitter 로 인위적 지연을 주며 jitter 는 seed 로 고정되어 항상 같은 순서로 재현
+#
+# 사용 예:
+#     ka.configure_session(session=RecordingTransport("api/data/cassettes/balance.jsonl.gz"))
+#     ka.auth(); dsf.inquire_balance(...)            # 실제 서버 호출을 기록
+#     ka.configure_session(session=ReplayTransport("api/data/cassettes/balance.jsonl.gz", latency=0.03))
+#     ka.auth(); dsf.inquire_balance(...)            # 서버 없이 같은 응답 재생
+#
+# 환경변수 KIS_CASSETTE / KIS_CASSETTE_MODE 를 지정하면 kis_auth 가 만드는 기본 세션이 자동으로 감싸집니다.
+# 재생 중 발급되는 토큰은 카세트에 가려 둔 값("***")이므로, kis_auth 는 재생 transport(offline=True)를 쓰는 동안
+# 파일 저장소 없는 메모리 전용 토큰 캐시로 바꿔 실제 토큰 파일(KIS_TOKEN_PATH)을 덮어쓰지 않게 합니다.
+
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List
+from urllib.parse import urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+# 카세트에 값을 남기지 않을 키 (요청/응답 본문)
+SECRET_KEYS = ("appkey", "appsecret", "secretkey", "access_token", "approval_key", "authorization")
+# 기록할 응답 헤더 (APIResp 는 소문자 헤더만 header 로 쓰므로 서버가 보낸 대소문자 그대로 기록)
+RESPONSE_HEADERS = ("content-type", "tr_id", "tr_cont", "gt_uid")
+REDACTED = "***"
+
+
+def _open(path, mode):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _redact(value):
+    if isinstance(value, dict):
+        return {k: REDACTED if k.lower() in SECRET_KEYS else _redact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact(v) for v in value]
+    return value
+
+
+def _requestKey(method, url, headers, params=None, data=None):
+    # 같은 요청을 가리키는 키 (헤더는 tr_id, tr_cont 만 사용, 파라미터 순서 무시)
+    if data is not None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            payload = data
+    else:
+        payload = {k: str(v) for k, v in (params or {}).items()}
+    payload = json.dumps(_redact(payload), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    headers = headers or {}
+    return method, urlsplit(url).path, headers.get("tr_id", ""), headers.get("tr_cont", ""), payload
+
+
+class CassetteResponse:
+    """카세트에서 만든 응답 (kis_auth 가 쓰는 requests.Response 속성만 제공)"""
+
+    def __init__(self, status_code: int, headers: dict, text: str, url: str = ""):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.url = url
+        self.ok = status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def load_cassette(path) -> List[dict]:
+    """카세트 파일의 기록(dict) 목록"""
+    with _open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class RecordingTransport:
+    """
+    실제 세션으로 요청을 보내고 요청/응답 쌍을 카세트 파일에 추가하는 transport.
+
+    Args:
+        path (str): 카세트 파일 (.jsonl, .gz 로 끝나면 gzip)
+        session: 실제 요청을 보낼 세션 (기본 requests.Session)
+
+    Attributes:
+        recorded (int): 이번에 기록한 요청 수
+    """
+
+    def __init__(self, path, session=None):
+        if session is None:
+            import requests
+
+            session = requests.Session()
+        self.path = path
+        self.session = session
+        self.recorded = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def _record(self, method, url, headers, params, data, res):
+        key = _requestKey(method, url, headers, params, data)
+        try:
+            body = json.dumps(_redact(json.loads(res.text)), ensure_ascii=False, separators=(",", ":"))
+        except ValueError:
+            body = res.text
+        entry = {
+            "method": key[0], "path": key[1], "tr_id": key[2], "tr_cont": key[3], "request": key[4],
+            "status": res.status_code,
+            "headers": {k: v for k, v in res.headers.items() if k.lower() in RESPONSE_HEADERS},
+            "body": body,
+        }
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            with _open(self.path, "a") as f:
+                f.write(line)
+            self.recorded += 1
+
+    def get(self, url, headers=None, params=None, **kwargs):
+        res = self.session.get(url, headers=headers, params=params, **kwargs)
+        self._record("GET", url, headers, params, None, res)
+        return res
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        res = self.session.post(url, data=data, headers=headers, **kwargs)
+        self._record("POST", url, headers, None, data, res)
+        return res
+
+    def close(self):
+        self.session.close()
+
+
+class ReplayTransport:
+    """
+    카세트의 응답을 재생하는 transport (네트워크 요청 없음).
+
+    같은 요청이 여러 번 기록되어 있으면 기록된 순서대로 돌려주고, 다 쓰면 repeat=True 일 때 마지막 응답을 계속 돌려줍니다.
+    토큰 발급(/oauth2/tokenP)처럼 요청 본문의 앱키가 가려진 요청도 같은 키로 찾습니다.
+
+    Args:
+        cassette (str | Iterable[dict]): 카세트 파일 또는 load_cassette() 결과
+        latency (float): 응답마다 기다릴 시간(초)
+        jitter (float): latency 에 더할 0 ~ jitter 초의 무작위 지연
+        seed (int): jitter 난수 seed (같은 seed 면 같은 지연 순서)
+        repeat (bool): 기록을 다 쓴 요청에 마지막 응답을 다시 돌려줄지 (False 면 404)
+
+    Attributes:
+        replayed (int): 재생한 응답 수
+        missed (list): 카세트에 없어 404 로 응답한 요청 키
+    """
+
+    offline = True  # 실제 서버에 요청하지 않음 (발급되는 토큰을 영구 저장소에 두지 않음)
+
+    def __init__(self, cassette, latency: float = 0.0, jitter: float = 0.0, seed: int = 0, repeat: bool = True):
+        entries: Iterable[dict] = load_cassette(cassette) if isinstance(cassette, (str, os.PathLike)) else cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.repeat = repeat
+        self.replayed = 0
+        self.missed = []
+        self._random = random.Random(seed)
+        self._entries: Dict[tuple, deque] = {}
+        self._last: Dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+        for entry in entries:
+            key = (entry["method"], entry["path"], entry["tr_id"], entry["tr_cont"], entry["request"])
+            self._entries.setdefault(key, deque()).append(entry)
+
+    def _replay(self, key, url):
+        with self._lock:
+            queue = self._entries.get(key)
+            if queue:
+                entry = self._last[key] = queue.popleft()
+            else:
+                entry = self._last.get(key) if self.repeat else None
+            if entry is None:
+                self.missed.append(key)
+            else:
+                self.replayed += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if entry is None:
+            return CassetteResponse(404, {"Content-Type": "text/plain"},
+                                    f"no recorded response for {key[0]} {key[1]} tr_id={key[2]}", url)
+        return CassetteResponse(entry["status"], entry["headers"], entry["body"], url)
+
+    def get(self, url, headers=None, params=None, **kwargs):
+        return self._replay(_requestKey("GET", url, headers, params, None), url)
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        return self._replay(_requestKey("POST", url, headers, None, data), url)
+
+    def close(self):
+        pass
+
+
+def replay_from_env() -> bool:
+    """환경변수로 재생 모드(KIS_CASSETTE_MODE=replay)가 지정되었는지"""
+    return bool(os.getenv("KIS_CASSETTE")) and os.getenv("KIS_CASSETTE_MODE", "").lower() == "replay"
+
+
+def transport_from_env(session):
+    """
+    환경변수에 따라 session 을 기록/재생 transport 로 감쌉니다. (지정하지 않으면 session 그대로)
+        KIS_CASSETTE : 카세트 파일 경로
+        KIS_CASSETTE_MODE : record (실제 요청을 기록) / replay (기록된 응답 재생) / 비우면 사용 안 함
+        KIS_REPLAY_LATENCY : 재생 응답마다 기다릴 시간(초, 기본 0)
+    """
+    path = os.getenv("KIS_CASSETTE")
+    mode = os.getenv("KIS_CASSETTE_MODE", "").lower()
+    if not path or not mode:
+        return session
+    if mode == "record":
+        return RecordingTransport(path, session)
+    if mode == "replay":
+        session.close()
+        return ReplayTransport(path, latency=float(os.getenv("KIS_REPLAY_LATENCY", "0")))
+    raise ValueError(f"KIS_CASSETTE_MODE must be record or replay: {mode}")
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS 실시간(웹소켓) 시세 클라이언트  |=====================
+# 실시간 체결가(H0STCNT0), 호가(H0STASP0), 체결통보(H0STCNI0) 등을 구독해서 받은 데이터를
+# 구독자(listen)별 크기 제한 큐로 나눠 줍니다. 연결이 끊기면 지수 백오프로 다시 접속한 뒤 구독을 복원하므로,
+# 장중에는 inquire_price 를 반복 호출하지 않고 client.last("H0STCNT0", code) 로 최신 체결을 읽으면 됩니다.
+#
+# 사용 예:
+#     async with RealtimeClient() as client:
+#         await client.subscribe("H0STCNT0", "005930")
+#         async for msg in client.listen("H0STCNT0"):
+#             print(msg.tr_key, msg.data["STCK_PRPR"])
+#
+# 장 시작처럼 초당 수천 건이 들어올 때는 틱마다 dict 를 만들지 말고 listen_frames() 로 원본 메시지를 받아
+# kis_ws_decode.decode_frames 로 모아서 한 번에 디코딩합니다. (keep_last=False 이고 listen() 구독자가 없으면
+# 틱 단위 디코딩을 하지 않음)
+#
+# pip install websockets pycryptodome (pycryptodome 은 암호화되어 오는 체결통보 복호화에만 필요)
+# 로컬 테스트는 api.functions.kis_ws_stub.StubRealtimeServer 의 url 을 RealtimeClient(url=...) 로 넘기면 됩니다.
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import api.functions.kis_auth as ka
+from api.functions.kis_ws_decode import Frame, split_frame
+
+try:
+    from websockets.asyncio.client import connect
+    from websockets.exceptions import WebSocketException
+except ImportError:  # pip install websockets
+    connect = None
+    WebSocketException = OSError
+
+logger = logging.getLogger(__name__)
+
+MAX_SUBSCRIPTIONS = 41  # 접속키(세션) 하나당 등록 가능한 실시간 종목 수
+
+DEFAULT_QUEUE_SIZE = int(os.getenv("KIS_WS_QUEUE_SIZE", "1000"))  # 구독자 큐 크기 (가득 차면 오래된 것부터 버림)
+DEFAULT_RECONNECT_MAX = float(os.getenv("KIS_WS_RECONNECT_MAX", "30"))  # 재접속 대기 상한(초)
+
+# 실시간 TR 응답 컬럼 (API 문서 Response Body 순서)
+CCNL_COLUMNS = [
+    "MKSC_SHRN_ISCD", "STCK_CNTG_HOUR", "STCK_PRPR", "PRDY_VRSS_SIGN", "PRDY_VRSS", "PRDY_CTRT",
+    "WGHN_AVRG_STCK_PRC", "STCK_OPRC", "STCK_HGPR", "STCK_LWPR", "ASKP1", "BIDP1", "CNTG_VOL", "ACML_VOL",
+    "ACML_TR_PBMN", "SELN_CNTG_CSNU", "SHNU_CNTG_CSNU", "NTBY_CNTG_CSNU", "CTTR", "SELN_CNTG_SMTN",
+    "SHNU_CNTG_SMTN", "CCLD_DVSN", "SHNU_RATE", "PRDY_VOL_VRSS_ACML_VOL_RATE", "OPRC_HOUR",
+    "OPRC_VRSS_PRPR_SIGN", "OPRC_VRSS_PRPR", "HGPR_HOUR", "HGPR_VRSS_PRPR_SIGN", "HGPR_VRSS_PRPR", "LWPR_HOUR",
+    "LWPR_VRSS_PRPR_SIGN", "LWPR_VRSS_PRPR", "BSOP_DATE", "NEW_MKOP_CLS_CODE", "TRHT_YN", "ASKP_RSQN1",
+    "BIDP_RSQN1", "TOTAL_ASKP_RSQN", "TOTAL_BIDP_RSQN", "VOL_TNRT", "PRDY_SMNS_HOUR_ACML_VOL",
+    "PRDY_SMNS_HOUR_ACML_VOL_RATE", "HOUR_CLS_CODE", "MRKT_TRTM_CLS_CODE", "VI_STND_PRC",
+]
+ASKING_PRICE_COLUMNS = (
+    ["MKSC_SHRN_ISCD", "BSOP_HOUR", "HOUR_CLS_CODE"]
+    + [f"ASKP{i}" for i in range(1, 11)] + [f"BIDP{i}" for i in range(1, 11)]
+    + [f"ASKP_RSQN{i}" for i in range(1, 11)] + [f"BIDP_RSQN{i}" for i in range(1, 11)]
+    + ["TOTAL_ASKP_RSQN", "TOTAL_BIDP_RSQN", "OVTM_TOTAL_ASKP_RSQN", "OVTM_TOTAL_BIDP_RSQN", "ANTC_CNPR",
+       "ANTC_CNQN", "ANTC_VOL", "ANTC_CNTG_VRSS", "ANTC_CNTG_VRSS_SIGN", "ANTC_CNTG_PRDY_CTRT", "ACML_VOL",
+       "TOTAL_ASKP_RSQN_ICDC", "TOTAL_BIDP_RSQN_ICDC", "OVTM_TOTAL_ASKP_ICDC", "OVTM_TOTAL_BIDP_ICDC",
+       "STCK_DEAL_CLS_CODE"]
+)
+CCNL_NOTICE_COLUMNS = [
+    "CUST_ID", "ACNT_NO", "ODER_NO", "OODER_NO", "SELN_BYOV_CLS", "RCTF_CLS", "ODER_KIND", "ODER_COND",
+    "STCK_SHRN_ISCD", "CNTG_QTY", "CNTG_UNPR", "STCK_CNTG_HOUR", "RFUS_YN", "CNTG_YN", "ACPT_YN", "BRNC_NO",
+    "ODER_QTY", "ACNT_NAME", "ORD_COND_PRC", "ORD_EXG_GB", "POPUP_YN", "FILLER", "CRDT_CLS", "CRDT_LOAN_DATE",
+    "CNTG_ISNM40", "ODER_PRC",
+]
+REALTIME_COLUMNS = {
+    "H0STCNT0": CCNL_COLUMNS,  # 실시간 체결가 (KRX)
+    "H0STASP0": ASKING_PRICE_COLUMNS,  # 실시간 호가 (KRX)
+    "H0STCNI0": CCNL_NOTICE_COLUMNS,  # 실시간 체결통보
+    "H0STCNI9": CCNL_NOTICE_COLUMNS,  # 실시간 체결통보 (모의투자)
+}
+
+for _tr_id, _columns in REALTIME_COLUMNS.items():
+    ka.add_data_map(_tr_id, columns=_columns)
+
+
+class RealtimeError(Exception):
+    """구독 요청 실패 (응답 rt_cd != 0, 응답 없음, 연결 끊김)"""
+
+
+class RealtimeMessage(NamedTuple):
+    tr_id: str
+    tr_key: str  # 종목코드 (체결통보는 고객 ID)
+    data: Dict[str, str]  # 컬럼명 → 값 (모두 문자열)
+    received: float  # 수신 시각 (time.time())
+
+
+def decode_records(tr_id: str, count: int, body: str) -> List[Dict[str, str]]:
+    """'^' 로 구분된 데이터 본문을 data_map 의 컬럼명으로 count 개의 레코드로 나눕니다."""
+    values = body.split("^")
+    columns = ka.data_map.get(tr_id, {}).get("columns")
+    if not columns:
+        width = len(values) // max(count, 1)
+        columns = [str(i) for i in range(width)]
+    width = len(columns)
+    return [dict(zip(columns, values[i * width:(i + 1) * width])) for i in range(count)]
+
+
+class Subscriber:
+    """
+    FanOut 에서 받은 메시지를 담는 크기 제한 큐. 큐가 가득 차면 가장 오래된 메시지를 버립니다(dropped).
+    async for 로 읽으며, 클라이언트가 닫히면 반복이 끝납니다.
+    """
+
+    _CLOSED = object()
+
+    def __init__(self, fanout, maxsize: int, tr_ids=None, tr_keys=None):
+        self._fanout = fanout
+        self.queue = asyncio.Queue(maxsize)
+        self.tr_ids = set(tr_ids) if tr_ids else None
+        self.tr_keys = set(tr_keys) if tr_keys else None
+        self.dropped = 0
+        self.closed = False
+
+    def matches(self, msg: RealtimeMessage) -> bool:
+        return (self.tr_ids is None or msg.tr_id in self.tr_ids) and (
+            self.tr_keys is None or msg.tr_key in self.tr_keys)
+
+    def _put(self, item):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+
+    async def get(self) -> RealtimeMessage:
+        item = await self.queue.get()
+        if item is self._CLOSED:
+            self.queue.put_nowait(item)  # 다른 대기자도 끝나도록
+            raise StopAsyncIteration
+        return item
+
+    async def get_batch(self, max_items: int = None) -> list:
+        """하나가 올 때까지 기다린 뒤, 큐에 쌓여 있는 것을 최대 max_items 개까지 함께 꺼냅니다."""
+        items = [await self.get()]
+        while not self.queue.empty() and (max_items is None or len(items) < max_items):
+            item = self.queue.get_nowait()
+            if item is self._CLOSED:
+                self.queue.put_nowait(item)
+                break
+            items.append(item)
+        return items
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> RealtimeMessage:
+        return await self.get()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._fanout.remove(self)
+            self._put(self._CLOSED)
+
+
+class FanOut:
+    """받은 메시지를 조건이 맞는 모든 구독자 큐에 나눠 넣습니다. (느린 구독자가 수신 루프를 막지 않음)"""
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self._subscribers: List[Subscriber] = []
+
+    def subscribe(self, tr_ids: Iterable[str] = None, tr_keys: Iterable[str] = None,
+                  maxsize: int = None) -> Subscriber:
+        subscriber = Subscriber(self, maxsize or self.maxsize, tr_ids, tr_keys)
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def remove(self, subscriber: Subscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def publish(self, msg: RealtimeMessage):
+        for subscriber in self._subscribers:
+            if subscriber.matches(msg):
+                subscriber._put(msg)
+
+    def close(self):
+        for subscriber in list(self._subscribers):
+            subscriber.close()
+
+
+class RealtimeClient:
+    """
+    KIS 실시간 웹소켓 클라이언트.
+
+    Args:
+        url (str): 웹소켓 주소 (기본: 인증된 환경의 my_url_ws, 없으면 환경변수 ops/vops)
+        approval_key (str): 웹소켓 접속키 (기본: kis_auth.auth_ws 로 발급받은 키, 없으면 접속 시 발급)
+        svr (str): "prod" 실전 / "vps" 모의
+        custtype (str): 고객 타입 (P: 개인, B: 법인)
+        queue_size (int): 구독자 큐 기본 크기
+        keep_last (bool): 종목별 마지막 메시지 보관 여부 (last() 사용, False 이면 listen() 구독자가 있을 때만 틱 단위 디코딩)
+        reconnect_delay (float): 첫 재접속 대기(초), 실패할 때마다 두 배 (최대 max_reconnect_delay)
+        ack_timeout (float): 구독/해제 응답 대기(초)
+
+    Attributes:
+        reconnects (int): 재접속 횟수
+    """
+
+    def __init__(self, url: str = None, approval_key: str = None, svr: str = "prod", custtype: str = "P",
+                 queue_size: int = DEFAULT_QUEUE_SIZE, keep_last: bool = True, reconnect_delay: float = 1.0,
+                 max_reconnect_delay: float = DEFAULT_RECONNECT_MAX, ack_timeout: float = 5.0):
+        if connect is None:
+            raise ImportError("websockets 패키지가 필요합니다: pip install websockets")
+        self.url = url
+        self.approval_key = approval_key
+        self.svr = svr
+        self.custtype = custtype
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.ack_timeout = ack_timeout
+        self.keep_last = keep_last
+        self.fanout = FanOut(queue_size)
+        self.frames = FanOut(queue_size)
+        self.reconnects = 0
+        self._subs: Dict[tuple, None] = {}  # (tr_id, tr_key), 등록 순서 유지
+        self._pending: Dict[tuple, asyncio.Future] = {}
+        self._last: Dict[tuple, RealtimeMessage] = {}
+        self._ws = None
+        self._connected = asyncio.Event()
+        self._closing = False
+        self._task = None
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def start(self):
+        """수신/재접속 루프를 백그라운드 태스크로 시작합니다."""
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self.run(), name="kis-realtime")
+        return self
+
+    async def close(self):
+        self._closing = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.fanout.close()
+        self.frames.close()
+
+    async def wait_connected(self, timeout: float = None):
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    @property
+    def subscriptions(self) -> List[tuple]:
+        return list(self._subs)
+
+    def listen(self, tr_ids: Iterable[str] = None, tr_keys: Iterable[str] = None,
+               maxsize: int = None) -> Subscriber:
+        """
+        받은 메시지를 읽을 구독자 큐를 만듭니다.
+
+        Args:
+            tr_ids, tr_keys: 받을 TR ID / 종목코드 (None 이면 전부)
+            maxsize (int): 큐 크기 (가득 차면 오래된 메시지부터 버림)
+        """
+        if isinstance(tr_ids, str):
+            tr_ids = [tr_ids]
+        if isinstance(tr_keys, str):
+            tr_keys = [tr_keys]
+        return self.fanout.subscribe(tr_ids, tr_keys, maxsize)
+
+    def listen_frames(self, tr_ids: Iterable[str] = None, maxsize: int = None) -> Subscriber:
+        """
+        복호화만 한 원본 메시지(kis_ws_decode.Frame)를 읽을 구독자 큐를 만듭니다.
+        get_batch() 로 모아서 kis_ws_decode.decode_frames 로 한 번에 디코딩하는 용도입니다.
+        """
+        if isinstance(tr_ids, str):
+            tr_ids = [tr_ids]
+        return self.frames.subscribe(tr_ids, None, maxsize)
+
+    def last(self, tr_id: str, tr_key: str) -> Optional[RealtimeMessage]:
+        """tr_id/tr_key 로 마지막으로 받은 메시지 (없으면 None)"""
+        return self._last.get((tr_id, tr_key))
+
+    async def subscribe(self, tr_id: str, tr_key: str):
+        """실시간 등록. 연결되어 있으면 응답을 기다리고, 아니면 접속할 때 등록합니다."""
+        key = (tr_id, tr_key)
+        if key in self._subs:
+            return
+        if len(self._subs) >= MAX_SUBSCRIPTIONS:
+            raise RealtimeError(f"실시간 등록은 최대 {MAX_SUBSCRIPTIONS}건까지 가능합니다.")
+        self._subs[key] = None
+        if self._ws is not None:
+            try:
+                await self._request(self._ws, tr_id, tr_key, "1")
+            except RealtimeError:
+                self._subs.pop(key, None)
+                raise
+
+    async def unsubscribe(self, tr_id: str, tr_key: str):
+        """실시간 해제"""
+        if self._subs.pop((tr_id, tr_key), False) is not False and self._ws is not None:
+            await self._request(self._ws, tr_id, tr_key, "2")
+
+    def _url(self) -> str:
+        if self.url:
+            return self.url
+        trenv = ka.getTREnv()
+        if trenv and trenv.my_url_ws:
+            return trenv.my_url_ws
+        return os.getenv("ops" if self.svr == "prod" else "vops")
+
+    async def _approvalKey(self) -> str:
+        if self.approval_key is None and "approval_key" not in ka._base_headers_ws:
+            await asyncio.get_running_loop().run_in_executor(None, ka.auth_ws, self.svr)
+        return self.approval_key or ka._base_headers_ws.get("approval_key")
+
+    def _message(self, tr_id, tr_key, tr_type, approval_key) -> str:
+        headers = {"custtype": self.custtype}
+        if approval_key:
+            headers["approval_key"] = approval_key
+        return json.dumps(ka.data_fetch(tr_id, tr_type, {"tr_key": tr_key}, headers))
+
+    async def _request(self, ws, tr_id, tr_key, tr_type, wait=True):
+        key = (tr_id, tr_key)
+        future = asyncio.get_running_loop().create_future()
+        if wait:
+            self._pending[key] = future
+        try:
+            await ws.send(self._message(tr_id, tr_key, tr_type, await self._approvalKey()))
+            if not wait:
+                return None
+            resp = await asyncio.wait_for(future, self.ack_timeout)
+        except (asyncio.TimeoutError, WebSocketException, OSError) as e:
+            raise RealtimeError(f"{tr_id} {tr_key}: {e!r}") from e
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        if not resp.isOk and not (resp.tr_msg or "").startswith("ALREADY"):
+            raise RealtimeError(f"{tr_id} {tr_key}: {resp.tr_msg}")
+        return resp
+
+    async def run(self):
+        """접속 → 구독 복원 → 수신을 반복합니다. (close() 전까지 끊기면 다시 접속)"""
+        delay = self.reconnect_delay
+        while not self._closing:
+            try:
+                await self._approvalKey()
+                # KIS 는 PINGPONG 메시지로 연결을 확인하므로 라이브러리 ping 은 사용하지 않음
+                async with connect(self._url(), ping_interval=None, max_queue=None) as ws:
+                    self._ws = ws
+                    delay = self.reconnect_delay
+                    for tr_id, tr_key in list(self._subs):
+                        await self._request(ws, tr_id, tr_key, "1", wait=False)
+                    self._connected.set()
+                    async for raw in ws:
+                        await self._handle(ws, raw)
+                logger.warning("Realtime connection closed by server")
+            except asyncio.CancelledError:
+                raise
+            except (WebSocketException, OSError, RealtimeError) as e:
+                logger.warning("Realtime connection failed: %r", e)
+            finally:
+                self._ws = None
+                self._connected.clear()
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(RealtimeError("connection closed"))
+            if self._closing:
+                break
+            self.reconnects += 1
+            await asyncio.sleep(delay * (0.5 + random.random() / 2))
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _handle(self, ws, raw):
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        if raw[:1] in ("0", "1"):
+            self._dispatch(raw)
+            return
+
+        try:
+            resp = ka.system_resp(raw)
+        except (ValueError, TypeError, AttributeError, KeyError) as e:
+            logger.warning("Dropping malformed realtime message: %r (%r)", e, raw[:80])
+            return
+        if resp.isPingPong:
+            await ws.pong(raw)
+            return
+        if resp.iv and resp.ekey:
+            ka.add_data_map(resp.tr_id, encrypt=resp.encrypt, key=resp.ekey, iv=resp.iv)
+        future = self._pending.get((resp.tr_id, resp.tr_key))
+        if future is not None and not future.done():
+            future.set_result(resp)
+        elif not resp.isOk:
+            logger.warning("Realtime %s %s: %s", resp.tr_id, resp.tr_key, resp.tr_msg)
+
+    def _dispatch(self, raw):
+        # 데이터 형식: 암호화 여부(0/1)|TR ID|데이터 건수|데이터(^ 구분)
+        # 잘린 메시지나 복호화 실패는 그 메시지만 버리고 수신을 계속함 (수신 태스크가 끝나면 재접속도 멈춤)
+        try:
+            frame: Frame = split_frame(raw, time.time())
+            records = decode_records(frame.tr_id, frame.count, frame.body) \
+                if self.keep_last or self.fanout._subscribers else ()
+        except (ValueError, TypeError, AttributeError, KeyError) as e:
+            logger.warning("Dropping malformed realtime frame: %r (%r)", e, raw[:80])
+            return
+        self.frames.publish(frame)
+        for record in records:
+            msg = RealtimeMessage(frame.tr_id, next(iter(record.values()), ""), record, frame.received)
+            if self.keep_last:
+                self._last[(frame.tr_id, msg.tr_key)] = msg
+            self.fanout.publish(msg)
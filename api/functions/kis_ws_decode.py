@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# ====|  실시간 데이터 일괄(컬럼 단위) 디코더  |=====================
+# 실시간 데이터는 "0|TR ID|건수|값^값^..." 형식으로 한 메시지에 여러 건이 이어 붙어 오므로,
+# 틱마다 dict 를 만드는 대신 여러 메시지를 한 번에 모아 pandas C 파서로 컬럼별 타입(int64/float64/str)
+# 배열로 나눕니다. 컬럼명은 kis_auth.data_map[tr_id]["columns"] 를 따르고,
+# 컬럼 타입은 아래 INT_COLUMNS / FLOAT_COLUMNS 에 없으면 문자열입니다. (부호/시간/코드 값의 앞자리 0 유지)
+#
+# 사용 예:
+#     frames = client.listen_frames("H0STCNT0")
+#     while True:
+#         batch = await frames.get_batch()              # 쌓여 있는 메시지를 한 번에
+#         df = decode_frames(batch)["H0STCNT0"]         # 틱 단위 DataFrame
+
+import csv
+import io
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+import api.functions.kis_auth as ka
+
+logger = logging.getLogger(__name__)
+
+# 정수 컬럼 (가격/수량/금액/건수)
+INT_COLUMNS = {
+    # 체결가 H0STCNT0
+    "STCK_PRPR", "PRDY_VRSS", "STCK_OPRC", "STCK_HGPR", "STCK_LWPR", "ASKP1", "BIDP1", "CNTG_VOL", "ACML_VOL",
+    "ACML_TR_PBMN", "SELN_CNTG_CSNU", "SHNU_CNTG_CSNU", "NTBY_CNTG_CSNU", "SELN_CNTG_SMTN", "SHNU_CNTG_SMTN",
+    "OPRC_VRSS_PRPR", "HGPR_VRSS_PRPR", "LWPR_VRSS_PRPR", "ASKP_RSQN1", "BIDP_RSQN1", "TOTAL_ASKP_RSQN",
+    "TOTAL_BIDP_RSQN", "PRDY_SMNS_HOUR_ACML_VOL", "VI_STND_PRC",
+    # 호가 H0STASP0
+    *(f"{prefix}{i}" for prefix in ("ASKP", "BIDP", "ASKP_RSQN", "BIDP_RSQN") for i in range(1, 11)),
+    "OVTM_TOTAL_ASKP_RSQN", "OVTM_TOTAL_BIDP_RSQN", "ANTC_CNPR", "ANTC_CNQN", "ANTC_VOL", "ANTC_CNTG_VRSS",
+    "TOTAL_ASKP_RSQN_ICDC", "TOTAL_BIDP_RSQN_ICDC", "OVTM_TOTAL_ASKP_ICDC", "OVTM_TOTAL_BIDP_ICDC",
+    # 체결통보 H0STCNI0 (주문/계좌 번호는 앞자리 0 유지를 위해 문자열)
+    "CNTG_QTY", "CNTG_UNPR", "ODER_QTY", "ORD_COND_PRC", "ODER_PRC",
+}
+# 실수 컬럼 (등락률/비율/가중평균가)
+FLOAT_COLUMNS = {
+    "PRDY_CTRT", "WGHN_AVRG_STCK_PRC", "CTTR", "SHNU_RATE", "PRDY_VOL_VRSS_ACML_VOL_RATE", "VOL_TNRT",
+    "PRDY_SMNS_HOUR_ACML_VOL_RATE", "ANTC_CNTG_PRDY_CTRT",
+}
+
+
+class Frame(NamedTuple):
+    tr_id: str
+    count: int  # 데이터 건수
+    body: str  # 복호화된 데이터 (^ 구분)
+    received: float = 0.0
+
+
+def split_frame(raw: str, received: float = 0.0) -> Frame:
+    """'암호화 여부|TR ID|건수|데이터' 를 나누고, 암호화된 데이터는 data_map 의 key/iv 로 복호화합니다."""
+    encrypted, tr_id, count, body = raw.split("|", 3)
+    if encrypted == "1":
+        info = ka.data_map.get(tr_id, {})
+        body = ka.aes_cbc_base64_dec(info.get("key"), info.get("iv"), body)
+    return Frame(tr_id, int(count), body, received)
+
+
+def _columns(tr_id: str, width: int = None) -> List[str]:
+    columns = ka.data_map.get(tr_id, {}).get("columns")
+    return list(columns) if columns else [str(i) for i in range(width or 0)]
+
+
+def decode_batch(tr_id: str, bodies: List[str], count: int) -> pd.DataFrame:
+    """
+    같은 TR 의 데이터 본문들을 한 번에 DataFrame 으로 바꿉니다.
+
+    Args:
+        tr_id (str): 실시간 TR ID (컬럼명은 data_map 에서)
+        bodies (List[str]): 데이터 본문 목록 (^ 구분, 본문마다 여러 건 가능)
+        count (int): 전체 건수 (본문별 건수의 합)
+
+    Returns:
+        pd.DataFrame: 한 행이 한 건, INT_COLUMNS 는 int64, FLOAT_COLUMNS 는 float64, 나머지 문자열
+    """
+    if count == 0:
+        return pd.DataFrame(columns=_columns(tr_id))
+
+    # 모든 건을 ^ 로 이어 붙인 뒤 한 건의 컬럼 수마다 구분자를 줄바꿈으로 바꿔 CSV 로 파싱
+    buf = np.frombuffer("^".join(bodies).encode("utf-8"), dtype=np.uint8).copy()
+    delimiters = np.flatnonzero(buf == ord("^"))
+    if (len(delimiters) + 1) % count:
+        raise ValueError(f"{tr_id}: {len(delimiters) + 1} values cannot be split into {count} records")
+    width = (len(delimiters) + 1) // count
+    buf[delimiters[width - 1::width]] = ord("\n")
+
+    columns = _columns(tr_id, width)
+    if len(columns) != width:
+        raise ValueError(f"{tr_id}: expected {len(columns)} columns per record, got {width}")
+    dtype = {c: "int64" if c in INT_COLUMNS else "float64" if c in FLOAT_COLUMNS else str for c in columns}
+    options = dict(sep="^", header=None, names=columns, quoting=csv.QUOTE_NONE, engine="c")
+    try:
+        return pd.read_csv(io.BytesIO(buf.tobytes()), dtype=dtype, na_filter=False, **options)
+    except ValueError:
+        # 빈 값/비정상 값이 섞인 경우: 문자열로 읽고 숫자 컬럼만 결측 허용 타입으로 변환
+        df = pd.read_csv(io.BytesIO(buf.tobytes()), dtype=str, keep_default_na=False, **options)
+        for column in columns:
+            if column in INT_COLUMNS:
+                df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
+            elif column in FLOAT_COLUMNS:
+                df[column] = pd.to_numeric(df[column], errors="coerce").astype("float64")
+        return df
+
+
+def decode_frames(frames: Iterable[Union[str, Frame]], received: bool = False) -> Dict[str, pd.DataFrame]:
+    """
+    여러 실시간 메시지를 TR ID 별로 모아 한 번에 디코딩합니다.
+
+    Args:
+        frames: 원본 메시지 문자열 또는 split_frame() 결과 (RealtimeClient.listen_frames 의 항목)
+        received (bool): True 이면 메시지 수신 시각 'received' 컬럼 추가
+
+    Returns:
+        Dict[str, pd.DataFrame]: TR ID → 수신 순서대로의 틱 DataFrame
+    """
+    groups: Dict[str, List[Frame]] = {}
+    for frame in frames:
+        if isinstance(frame, str):
+            try:
+                frame = split_frame(frame)
+            except ValueError as e:
+                logger.warning("Dropping malformed realtime frame: %s (%r)", e, frame[:80])
+                continue
+        groups.setdefault(frame.tr_id, []).append(frame)
+
+    result = {}
+    for tr_id, group in groups.items():
+        try:
+            df = decode_batch(tr_id, [f.body for f in group], sum(f.count for f in group))
+        except ValueError:
+            # 잘못된 메시지 하나 때문에 같은 TR 전체를 버리지 않도록 메시지별로 다시 디코딩해 그 메시지만 버림
+            group, df = _decodeEach(tr_id, group)
+        if received:
+            df["received"] = np.repeat([f.received for f in group], [f.count for f in group])
+        result[tr_id] = df
+    return result
+
+
+def _decodeEach(tr_id: str, group: List[Frame]):
+    decoded, parts = [], []
+    for frame in group:
+        try:
+            parts.append(decode_batch(tr_id, [frame.body], frame.count))
+        except ValueError as e:
+            logger.warning("Dropping malformed realtime frame: %s", e)
+            continue
+        decoded.append(frame)
+    if not parts:
+        return decoded, decode_batch(tr_id, [], 0)
+    return decoded, pd.concat(parts, ignore_index=True)
+
+
+def _sampleFrames(n, tr_id="H0STCNT0", seed=0):
+    # 녹화된 메시지가 없을 때 쓰는 체결가 메시지 (한 메시지 1~3건, 종목 300개)
+    rng = np.random.default_rng(seed)
+    columns = _columns(tr_id)
+    codes = [f"{i:06d}" for i in rng.choice(999999, 300, replace=False)]
+    frames = []
+    for _ in range(n):
+        records = []
+        for _ in range(int(rng.choice([1, 1, 1, 2, 3]))):
+            values = []
+            for column in columns:
+                if column in INT_COLUMNS:
+                    values.append(str(int(rng.integers(-1000, 10_000_000))))
+                elif column in FLOAT_COLUMNS:
+                    values.append(f"{rng.uniform(-30, 300):.2f}")
+                else:
+                    values.append("093015")
+            values[0] = codes[int(rng.integers(len(codes)))]
+            records.append("^".join(values))
+        frames.append(f"0|{tr_id}|{len(records):03d}|{'^'.join(records)}")
+    return frames
+
+
+def benchmark(path: str = None, n: int = 20000, repeat: int = 5):
+    """
+    메시지별 dict 디코딩(kis_ws.decode_records) 대비 일괄 디코딩 처리량 비교.
+
+    Args:
+        path (str): 녹화된 메시지 파일 (한 줄에 메시지 하나, 없으면 체결가 메시지 n 개 생성)
+    """
+    import timeit
+
+    from api.functions.kis_ws import decode_records  # kis_ws 에서 H0STCNT0 등 컬럼을 data_map 에 등록
+
+    if path:
+        with open(path, encoding="utf-8") as f:
+            frames = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        frames = _sampleFrames(n)
+    ticks = sum(split_frame(frame).count for frame in frames)
+
+    def per_tick(typed):
+        out = []
+        for frame in frames:
+            frame = split_frame(frame)
+            for record in decode_records(frame.tr_id, frame.count, frame.body):
+                if typed:
+                    for column, value in record.items():
+                        if column in INT_COLUMNS:
+                            record[column] = int(value)
+                        elif column in FLOAT_COLUMNS:
+                            record[column] = float(value)
+                out.append(record)
+        return out
+
+    t_dict = min(timeit.repeat(lambda: per_tick(False), number=1, repeat=repeat))
+    t_typed = min(timeit.repeat(lambda: per_tick(True), number=1, repeat=repeat))
+    t_batch = min(timeit.repeat(lambda: decode_frames(frames), number=1, repeat=repeat))
+    print(f"frames={len(frames)} ticks={ticks}")
+    for label, elapsed in (("dict (str)", t_dict), ("dict (typed)", t_typed), ("batch", t_batch)):
+        print(f"{label:13s} {elapsed * 1000:8.1f}ms  {ticks / elapsed:12,.0f} ticks/s  x{t_typed / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# ====|  KIS 실시간(웹소켓) 로컬 스텁 서버  |=====================
+# 실제 서버 없이 kis_ws.RealtimeClient 를 확인할 수 있도록 KIS 실시간 서버의 동작을 흉내 냅니다.
+#   - 등록/해제 요청에 SUBSCRIBE SUCCESS / UNSUBSCRIBE SUCCESS 응답 (체결통보는 복호화 key/iv 포함)
+#   - push() 로 등록한 연결에만 "0|TR|건수|데이터" 형식(체결통보는 "1|..." 암호화) 데이터 전송
+#   - ping() 으로 PINGPONG 전송, drop() 으로 연결을 끊어 재접속/구독 복원 확인, send() 로 임의 메시지 전송
+#
+# 사용 예:
+#     async with StubRealtimeServer() as server:
+#         async with RealtimeClient(url=server.url, approval_key="test") as client:
+#             await client.wait_connected()
+#             await client.subscribe("H0STCNT0", "005930")
+#             await server.push("H0STCNT0", [["005930", "093000", "71000", ...]])
+
+import asyncio
+import json
+import os
+from base64 import b64encode
+from datetime import datetime
+from typing import Dict, List, Set
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+from api.functions.kis_ws import REALTIME_COLUMNS, RealtimeClient
+
+ENCRYPTED_TR_IDS = ("H0STCNI0", "H0STCNI9")
+
+
+def aes_cbc_base64_enc(key: str, iv: str, plain_text: str) -> str:
+    """kis_auth.aes_cbc_base64_dec 의 역 (스텁 데이터 암호화용)"""
+    try:
+        from Crypto.Cipher import AES
+        from Crypto.Util.Padding import pad
+
+        cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+        return b64encode(cipher.encrypt(pad(plain_text.encode("utf-8"), AES.block_size))).decode()
+    except ImportError:
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        padder = padding.PKCS7(128).padder()
+        data = padder.update(plain_text.encode("utf-8")) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(key.encode("utf-8")), modes.CBC(iv.encode("utf-8"))).encryptor()
+        return b64encode(encryptor.update(data) + encryptor.finalize()).decode()
+
+
+class StubRealtimeServer:
+    """
+    KIS 실시간 서버 스텁.
+
+    Attributes:
+        url (str): start() 후 접속 주소 (ws://127.0.0.1:<port>)
+        requests (list): 받은 요청 (header, body) 목록
+        connections (int): 지금까지 받은 연결 수
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.url = None
+        self.key = os.urandom(16).hex()  # AES-256 key (32자)
+        self.iv = os.urandom(8).hex()  # 16자
+        self.requests: List[dict] = []
+        self.connections = 0
+        self._subs: Dict[object, Set[tuple]] = {}
+        self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def start(self):
+        self._server = await serve(self._handler, self.host, self.port, ping_interval=None)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://{self.host}:{port}"
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handler(self, ws):
+        self.connections += 1
+        subs = self._subs[ws] = set()
+        try:
+            async for raw in ws:
+                request = json.loads(raw)
+                self.requests.append(request)
+                header, body = request["header"], request["body"]["input"]
+                tr_id, tr_key = body["tr_id"], body["tr_key"]
+                if header["tr_type"] == "1":
+                    subs.add((tr_id, tr_key))
+                    msg = "SUBSCRIBE SUCCESS"
+                else:
+                    subs.discard((tr_id, tr_key))
+                    msg = "UNSUBSCRIBE SUCCESS"
+                encrypt = "Y" if tr_id in ENCRYPTED_TR_IDS else "N"
+                resp = {"header": {"tr_id": tr_id, "tr_key": tr_key, "encrypt": encrypt},
+                        "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": msg}}
+                if header["tr_type"] == "1" and encrypt == "Y":
+                    resp["body"]["output"] = {"iv": self.iv, "key": self.key}
+                await ws.send(json.dumps(resp))
+        except ConnectionClosed:
+            pass
+        finally:
+            self._subs.pop(ws, None)
+
+    async def push(self, tr_id: str, records: List[List[str]]) -> int:
+        """tr_id 의 레코드들을 첫 컬럼(종목코드/고객 ID)을 등록한 연결로 보내고, 보낸 연결 수를 반환합니다."""
+        tr_key = records[0][0]
+        body = "^".join(value for record in records for value in record)
+        if tr_id in ENCRYPTED_TR_IDS:
+            frame = f"1|{tr_id}|{len(records):03d}|{aes_cbc_base64_enc(self.key, self.iv, body)}"
+        else:
+            frame = f"0|{tr_id}|{len(records):03d}|{body}"
+        sent = 0
+        for ws, subs in list(self._subs.items()):
+            if (tr_id, tr_key) in subs:
+                await ws.send(frame)
+                sent += 1
+        return sent
+
+    async def send(self, raw: str):
+        """모든 연결에 원본 메시지를 그대로 전송 (잘못된 메시지 처리 확인용)"""
+        for ws in list(self._subs):
+            await ws.send(raw)
+
+    async def ping(self):
+        """모든 연결에 PINGPONG 전송"""
+        msg = json.dumps({"header": {"tr_id": "PINGPONG", "datetime": datetime.now().strftime("%Y%m%d%H%M%S")}})
+        for ws in list(self._subs):
+            await ws.send(msg)
+
+    async def drop(self):
+        """모든 연결을 끊습니다. (클라이언트 재접속 확인용)"""
+        for ws in list(self._subs):
+            await ws.close(code=1011)
+
+
+def sample_record(tr_id: str, tr_key: str, **values) -> List[str]:
+    """tr_id 컬럼 순서의 레코드 (첫 컬럼은 tr_key, 나머지는 values 또는 '0')"""
+    columns = REALTIME_COLUMNS[tr_id]
+    return [tr_key] + [str(values.get(column, "0")) for column in columns[1:]]
+
+
+async def _demo():
+    async with StubRealtimeServer() as server:
+        async with RealtimeClient(url=server.url, approval_key="stub", reconnect_delay=0.05) as client:
+            await client.wait_connected(5)
+            await client.subscribe("H0STCNT0", "005930")
+            await client.subscribe("H0STCNI0", "HTSID")
+            listener = client.listen()
+
+            await server.push("H0STCNT0", [sample_record("H0STCNT0", "005930", STCK_PRPR=71000)])
+            await server.push("H0STCNI0", [sample_record("H0STCNI0", "HTSID", STCK_SHRN_ISCD="005930")])
+            await server.ping()
+            for _ in range(2):
+                msg = await asyncio.wait_for(listener.get(), 5)
+                print(msg.tr_id, msg.tr_key, {k: msg.data[k] for k in list(msg.data)[:3]})
+
+            await server.drop()
+            await asyncio.sleep(0.5)
+            await client.wait_connected(5)
+            await asyncio.sleep(0.1)  # 복원 등록 요청이 서버에 처리될 때까지
+            await server.push("H0STCNT0", [sample_record("H0STCNT0", "005930", STCK_PRPR=71100)])
+            msg = await asyncio.wait_for(listener.get(), 5)
+            print(f"reconnects={client.reconnects} connections={server.connections} "
+                  f"after reconnect STCK_PRPR={msg.data['STCK_PRPR']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
@@ -4,6 +4,7 @@ from api.nodes.gemini_node import GeminiNode
 from api.nodes.kis_node import StockBuyNode
 from api.nodes.gemini_summary_node import GeminiSummaryNode
 from api.nodes.youtube_node import YoutubeNode
+from api.nodes.registry import NodeRegistry
 
 
 NODES = [
@@ -14,3 +15,6 @@ NODES = [
     GeminiSummaryNode,
     YoutubeNode,
 ]
+
+# import 시점에 한 번만 만들어지는 NODE_ID 기반 레지스트리
+NODE_REGISTRY = NodeRegistry(NODES)
@@ -3,6 +3,7 @@ from typing import Type, Dict, Any, Optional
 
 from pydantic import BaseModel, Field, ValidationError
 
+from .cache import get_node_cache
 from .enums import NodeType
 
 # (NodeExecutionResult, NodeType 등 기존 클래스는 그대로 있다고 가정)
@@ -18,6 +19,7 @@ class NodeExecutionResult(BaseModel):
     outputs: Dict[str, Any] = Field(
         default_factory=dict, description="노드의 출력 데이터")
     error: Optional[str] = Field(default=None, description="에러 발생 시 메시지")
+    cached: bool = Field(default=False, description="캐시된 결과를 반환했는지 여부")
 
 
 class BaseNode(ABC):
@@ -34,6 +36,11 @@ class BaseNode(ABC):
     INPUT_MODEL: Type[BaseModel]
     OUTPUT_MODEL: Type[BaseModel]
 
+    # 결과 캐시 설정 (CACHE_TTL 을 초 단위로 지정한 노드만 캐시 사용)
+    CACHE_TTL: Optional[float] = None
+    CACHE_VERSION: str = "1"  # 노드 로직이 바뀌면 올려서 기존 캐시를 무효화
+    CACHEABLE: bool = True  # 주문처럼 부수효과가 있는 노드는 False
+
     def run(self, inputs: Dict[str, Any]) -> NodeExecutionResult:
         """
         입력 데이터를 Pydantic 모델로 검증하고 노드를 실행합니다.
@@ -48,18 +55,35 @@ class BaseNode(ABC):
             # 1. 입력 데이터 유효성 검사 및 모델 객체 생성
             validated_inputs = self.INPUT_MODEL.model_validate(inputs)
 
-            # 2. 실제 노드 로직 실행
+            # 2. 같은 입력으로 실행한 결과가 캐시에 있으면 그대로 반환
+            cache_key = None
+            if self.CACHEABLE and self.CACHE_TTL:
+                cache_key = get_node_cache().make_key(
+                    self.NODE_ID, self.CACHE_VERSION, validated_inputs)
+                cached_outputs = get_node_cache().get(cache_key)
+                if cached_outputs is not None:
+                    return NodeExecutionResult(
+                        success=True,
+                        outputs=cached_outputs,
+                        cached=True
+                    )
+
+            # 3. 실제 노드 로직 실행
             result_model = self.execute(validated_inputs)
 
-            # 3. 실행 결과가 올바른 출력 모델인지 확인
+            # 4. 실행 결과가 올바른 출력 모델인지 확인
             if not isinstance(result_model, self.OUTPUT_MODEL):
                 raise TypeError(
                     f"Execution result must be an instance of {self.OUTPUT_MODEL.__name__}")
 
-            # 4. 성공 결과 반환
+            outputs = result_model.model_dump()  # 모델 객체를 다시 딕셔너리로 변환
+            if cache_key is not None:
+                get_node_cache().set(cache_key, outputs, self.CACHE_TTL)
+
+            # 5. 성공 결과 반환
             return NodeExecutionResult(
                 success=True,
-                outputs=result_model.model_dump()  # 모델 객체를 다시 딕셔너리로 변환
+                outputs=outputs
             )
 
         except ValidationError as e:
@@ -89,15 +113,19 @@ class BaseNode(ABC):
         """
         pass
 
-    def get_info(self) -> Dict[str, Any]:
-        """노드 정보와 함께 입출력 JSON 스키마를 반환합니다."""
+    @classmethod
+    def get_info(cls) -> Dict[str, Any]:
+        """
+        노드 정보와 함께 입출력 JSON 스키마를 반환합니다.
+        클래스 변수만 사용하므로 인스턴스를 만들지 않고 호출할 수 있습니다.
+        """
         return {
-            "id": self.NODE_ID,
-            "name": self.NODE_NAME,
-            "description": self.NODE_DESCRIPTION,
-            "type": self.NODE_TYPE.value,
-            "category": self.NODE_CATEGORY,
+            "id": cls.NODE_ID,
+            "name": cls.NODE_NAME,
+            "description": cls.NODE_DESCRIPTION,
+            "type": cls.NODE_TYPE.value,
+            "category": cls.NODE_CATEGORY,
             # Pydantic 모델로부터 JSON 스키마 자동 생성
-            "inputs": self.INPUT_MODEL.model_json_schema(),
-            "outputs": self.OUTPUT_MODEL.model_json_schema()
+            "inputs": cls.INPUT_MODEL.model_json_schema(),
+            "outputs": cls.OUTPUT_MODEL.model_json_schema()
         }
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class DjangoCacheBackend:
+    """
+    Django cache 프레임워크를 영구 저장소로 사용하는 백엔드.
+    settings.CACHES 에 DatabaseCache(sqlite) 나 FileBasedCache 를 지정하면 프로세스 재시작 후에도 결과가 유지됩니다.
+    """
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+
+    @property
+    def _cache(self):
+        from django.core.cache import caches
+        return caches[self.alias]
+
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Tuple[float, str], ttl: float) -> None:
+        self._cache.set(key, value, timeout=ttl)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class NodeResultCache:
+    """
+    노드 실행 결과를 입력 내용으로 주소화(content-addressed)하는 캐시.
+
+    메모리에는 TTL 과 LRU 로 관리되는 최근 결과를 두고(UTF-8 크기 합이 max_bytes 를 넘으면 오래된 것부터 제거),
+    backend 가 지정되면 메모리에서 못 찾은 결과를 영구 저장소에서 다시 찾아 남은 TTL 동안 메모리에 올립니다.
+    값은 JSON 문자열로 보관하므로 호출자마다 독립된 복사본을 돌려받습니다.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, backend: Optional[DjangoCacheBackend] = None):
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self._entries: "OrderedDict[str, Tuple[float, str, int]]" = OrderedDict()  # key → (만료 시각, JSON, 바이트 수)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(node_id: str, version: str, inputs: BaseModel) -> str:
+        """NODE_ID, 노드 버전, 검증된 입력의 정규화된 JSON 으로 캐시 키를 만듭니다."""
+        canonical = json.dumps(inputs.model_dump(mode="json"), sort_keys=True,
+                               separators=(",", ":"), ensure_ascii=False)
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"node:{node_id}:{version}:{digest}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 출력 (없거나 만료되었으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload, _ = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(payload)
+                self._remove(key)
+
+        if self.backend is not None:
+            stored = self.backend.get(key)
+            if stored is not None:
+                # 영구 저장소에는 벽시계 만료 시각을 함께 저장 (프로세스 간 monotonic 시각은 비교할 수 없음)
+                expires_at, payload = stored
+                remaining = expires_at - time.time()
+                if remaining > 0:
+                    with self._lock:
+                        self._insert(key, time.monotonic() + remaining, payload)
+                        self.hits += 1
+                    return json.loads(payload)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, outputs: Dict[str, Any], ttl: float) -> None:
+        """출력을 ttl 초 동안 저장합니다."""
+        payload = json.dumps(outputs, ensure_ascii=False)
+        with self._lock:
+            self._insert(key, time.monotonic() + ttl, payload)
+
+        if self.backend is not None:
+            self.backend.set(key, (time.time() + ttl, payload), ttl)
+
+    def clear(self) -> None:
+        """메모리와 영구 저장소의 캐시를 모두 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.backend is not None:
+            self.backend.clear()
+
+    def _insert(self, key: str, expires_at: float, payload: str) -> None:
+        # 메모리 사용량은 문자 수가 아니라 UTF-8 로 인코딩한 바이트 수로 셈 (한글 종목명 등은 3바이트)
+        self._remove(key)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (expires_at, payload, size)
+        self._size += size
+        # 메모리 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_node_cache: Optional[NodeResultCache] = None
+_node_cache_lock = threading.Lock()
+
+
+def get_node_cache() -> NodeResultCache:
+    """
+    settings.NODE_RESULT_CACHE 설정으로 만든 전역 캐시를 반환합니다.
+
+    NODE_RESULT_CACHE = {
+        "MAX_BYTES": 64 * 1024 * 1024,  # 메모리 상한
+        "BACKEND": "default",           # 영구 저장소로 쓸 CACHES alias (None 이면 메모리만 사용)
+    }
+    """
+    global _node_cache
+    if _node_cache is None:
+        with _node_cache_lock:
+            if _node_cache is None:
+                from django.conf import settings
+                conf = getattr(settings, "NODE_RESULT_CACHE", {}) if settings.configured else {}
+                alias = conf.get("BACKEND")
+                _node_cache = NodeResultCache(
+                    max_bytes=conf.get("MAX_BYTES", 64 * 1024 * 1024),
+                    backend=DjangoCacheBackend(alias) if alias else None,
+                )
+    return _node_cache
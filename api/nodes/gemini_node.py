@@ -43,6 +43,9 @@ class GeminiNode(BaseNode):
     INPUT_MODEL = GeminiNodeInput
     OUTPUT_MODEL = GeminiNodeOutput
 
+    # 같은 분석 자료에 대한 추천은 5분간 재사용
+    CACHE_TTL = 300
+
     def execute(self, data: GeminiNodeInput) -> GeminiNodeOutput:
         """
         주식 추천 로직 실행
@@ -46,6 +46,9 @@ class GeminiSummaryNode(BaseNode):
     INPUT_MODEL = GeminiSummaryNodeInput
     OUTPUT_MODEL = GeminiSummaryNodeOutput
 
+    # 같은 URL 요약은 10분간 재사용
+    CACHE_TTL = 600
+
     def _fetch_webpage_content(self, url: str) -> tuple[str, str]:
         """웹페이지 내용을 가져오는 함수"""
         # URL 검증
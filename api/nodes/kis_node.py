@@ -1,62 +1,19 @@
 import json
 import os
-from pathlib import Path
 from typing import Type, Dict, Any
 
 from pydantic import BaseModel, Field
-import pandas as pd
 
 from api.functions import kis_auth as ka
 from api.nodes.enums import NodeType
 from api.nodes.base import BaseNode
 from api.functions.domestic_stock_functions import order_cash
-from api.data.kis_code import get_kosdaq_master_dataframe, get_kospi_master_dataframe
-
-# 전역 변수로 DataFrame 초기화 (None으로 시작)
-KOSPI_DF = None
-KOSDAQ_DF = None
-
-
-def load_stock_data():
-    """주식 데이터를 로드하는 함수"""
-    global KOSPI_DF, KOSDAQ_DF
-
-    if KOSPI_DF is None or KOSDAQ_DF is None:
-        try:
-            kospi_path = Path('api/data/kospi_code.mst')
-            kosdaq_path = Path('api/data/kosdaq_code.mst')
-
-            if kospi_path.exists() and kosdaq_path.exists():
-                KOSPI_DF = get_kospi_master_dataframe(str(kospi_path.parent))
-                KOSDAQ_DF = get_kosdaq_master_dataframe(
-                    str(kosdaq_path.parent))
-            else:
-                # 파일이 없으면 빈 DataFrame으로 초기화
-                KOSPI_DF = pd.DataFrame(columns=['단축코드', '한글명'])
-                KOSDAQ_DF = pd.DataFrame(columns=['단축코드', '한글종목명'])
-        except Exception as e:
-            # 에러 발생시 빈 DataFrame으로 초기화
-            KOSPI_DF = pd.DataFrame(columns=['단축코드', '한글명'])
-            KOSDAQ_DF = pd.DataFrame(columns=['단축코드', '한글종목명'])
+from api.data.symbol_index import get_symbol_index
 
 
 def find_stock_code(stock_name: str) -> str:
-    """주식 이름으로 종목 코드를 찾는 함수"""
-    load_stock_data()
-
-    # KOSPI에서 먼저 검색
-    kospi_matches = KOSPI_DF[KOSPI_DF['한글명'].str.contains(
-        stock_name, na=False)]
-    if not kospi_matches.empty:
-        return kospi_matches.iloc[0]['단축코드']
-
-    # KOSDAQ에서 검색
-    kosdaq_matches = KOSDAQ_DF[KOSDAQ_DF['한글종목명'].str.contains(
-        stock_name, na=False)]
-    if not kosdaq_matches.empty:
-        return kosdaq_matches.iloc[0]['단축코드']
-
-    return None
+    """주식 이름(또는 종목코드)으로 종목 코드를 찾는 함수, 여러 종목이 걸리면 가장 순위가 높은 종목"""
+    return get_symbol_index().lookup(stock_name)
 
 
 class StockBuyNodeInput(BaseModel):
@@ -90,6 +47,9 @@ class StockBuyNode(BaseNode):
     INPUT_MODEL = StockBuyNodeInput
     OUTPUT_MODEL = StockBuyNodeOutput
 
+    # 주문은 매번 실제로 실행되어야 하므로 결과 캐시를 사용하지 않음
+    CACHEABLE = False
+
     def execute(self, data: StockBuyNodeInput) -> StockBuyNodeOutput:
         """
         주식 매수 노드 실행 로직.
@@ -0,0 +1,72 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from api.nodes.base import BaseNode
+
+
+class NodeRegistry:
+    """
+    NODE_ID 로 노드 클래스를 찾는 레지스트리.
+
+    생성 시점에 한 번만 get_info() (pydantic JSON 스키마 생성 포함)를 계산하고,
+    /api/nodes/ 응답 본문까지 직렬화해 두어 요청 처리 중에는 딕셔너리 조회만 일어납니다.
+    """
+
+    def __init__(self, nodes: List[Any]):
+        self._classes: Dict[str, Type[BaseNode]] = {}
+        self._infos: Dict[str, Dict[str, Any]] = {}
+        infos: List[Dict[str, Any]] = []
+
+        for item in nodes:
+            # NODES 항목이 클래스이든 인스턴스이든 모두 대응
+            node_class = item if isinstance(item, type) else type(item)
+            node_id = getattr(node_class, 'NODE_ID', 'unknown')
+            if node_id in self._classes:
+                raise ValueError(f"duplicated NODE_ID: {node_id}")
+            # 정보 생성에 실패해도 실행은 가능하도록 클래스는 등록하고, 노드 목록에는 에러 항목만 내보냄
+            try:
+                info = node_class.get_info()
+            except Exception as e:
+                info = {
+                    "id": node_id,
+                    "error": f"failed to load node info: {e}"
+                }
+
+            self._classes[node_id] = node_class
+            self._infos[node_id] = info
+            infos.append(info)
+
+        self._infos_list = infos
+        self._infos_json = json.dumps(infos, ensure_ascii=False).encode("utf-8")
+
+    def get(self, node_id: str) -> Optional[Type[BaseNode]]:
+        """NODE_ID 에 해당하는 노드 클래스 (없으면 None)"""
+        return self._classes.get(node_id)
+
+    def get_info(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """미리 계산된 노드 정보 (없으면 None)"""
+        return self._infos.get(node_id)
+
+    @property
+    def classes(self) -> Dict[str, Type[BaseNode]]:
+        """NODE_ID -> 노드 클래스 매핑"""
+        return self._classes
+
+    @property
+    def infos(self) -> List[Dict[str, Any]]:
+        """등록 순서대로 정렬된 노드 정보 목록"""
+        return self._infos_list
+
+    @property
+    def infos_json(self) -> bytes:
+        """/api/nodes/ 응답으로 그대로 내보낼 직렬화된 노드 정보"""
+        return self._infos_json
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._classes
+
+    def __iter__(self) -> Iterator[Type[BaseNode]]:
+        return iter(self._classes.values())
+
+    def __len__(self) -> int:
+        return len(self._classes)
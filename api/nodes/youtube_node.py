@@ -45,6 +45,9 @@ class YoutubeNode(BaseNode):
     INPUT_MODEL = YoutubeNodeInput
     OUTPUT_MODEL = YoutubeNodeOutput
 
+    # 같은 영상 요약은 1시간 재사용
+    CACHE_TTL = 3600
+
     def _extract_video_id(self, url: str) -> str:
         """유튜브 URL에서 영상 ID를 추출하는 함수"""
         # 다양한 유튜브 URL 형식 지원
@@ -1,3 +1,882 @@
-from django.test import TestCase
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
 
-# Create your tests here.
+import pandas as pd
+import requests
+from django.test import SimpleTestCase
+
+import api.apps as api_apps
+import api.functions.kis_async as kaa
+import api.functions.kis_auth as ka
+from api.data.bar_store import BarFetchError, BarStore
+from api.data.minute_recorder import MINUTE_PERIOD, MinuteBarRecorder
+from api.data.trading_calendar import TradingCalendar
+from api.functions import domestic_stock_functions as dsf
+from api.functions import kis_quotes
+from api.functions.kis_paging import Paginator
+from api.functions.kis_quote_cache import QuoteCache
+from api.functions.kis_ratelimit import FileTokenBucket, RateLimiter, TokenBucket
+from api.functions.kis_retry import CircuitBreaker, RetryPolicy, call_with_retry
+from api.nodes.cache import NodeResultCache
+from api.nodes.registry import NodeRegistry
+from api.workflow import WorkflowGraph, WorkflowGraphError
+from api.functions.kis_schema import classify, to_frame
+from api.functions.kis_stub import STUB_ACCOUNT, STUB_PRODUCT, StubKisServer
+from api.functions.kis_token import TokenCache, TokenStore
+from api.functions.kis_ws_stub import StubRealtimeServer, sample_record
+from api.functions.kis_transport import RecordingTransport, ReplayTransport
+from api.functions.kis_ws import RealtimeClient
+from api.functions.kis_ws_decode import _sampleFrames, decode_frames, split_frame
+
+
+def _weekdays(start: str, end: str):
+    return [d.strftime("%Y%m%d") for d in pd.bdate_range(start, end)]
+
+
+class FakeDailyFetch:
+    """inquire_daily_itemchartprice output2 흉내 (평일마다 봉 하나, 최신 봉부터 최대 100개), fail_calls 번째 호출은 실패"""
+
+    def __init__(self, fail_calls=()):
+        self.fail_calls = set(fail_calls)
+        self.calls = 0
+
+    def __call__(self, code, start, end, period, adjusted, market):
+        self.calls += 1
+        if self.calls in self.fail_calls:
+            raise BarFetchError("EGW00201 초당 거래건수를 초과하였습니다.")
+        days = sorted(_weekdays(start, end), reverse=True)[:100]
+        return pd.DataFrame([{
+            "stck_bsop_date": d, "stck_oprc": "100", "stck_hgpr": "110", "stck_lwpr": "90",
+            "stck_clpr": "105", "acml_vol": "1000", "acml_tr_pbmn": "105000",
+        } for d in days])
+
+
+class BarStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.calendar = TradingCalendar(path="", fetch=lambda bass_dt: pd.DataFrame())
+
+    def store(self, fetch):
+        return BarStore(os.path.join(self.tmp.name, "bars.sqlite3"), fetch=fetch, calendar=self.calendar)
+
+    def test_failed_fetch_is_not_recorded_as_covered(self):
+        store = self.store(FakeDailyFetch(fail_calls={1}))
+        df = store.ensure_history("005930", "20240101", "20240331")
+        self.assertFalse(df.attrs["complete"])
+        self.assertEqual(len(df), 0)
+        self.assertEqual(store.coverage("005930"), [])
+
+        # 다음 호출은 같은 기간을 다시 받음
+        df = store.ensure_history("005930", "20240101", "20240331")
+        self.assertTrue(df.attrs["complete"])
+        self.assertEqual(len(df), len(_weekdays("20240101", "20240331")))
+        self.assertEqual(store.coverage("005930"), [(date(2024, 1, 1), date(2024, 3, 31))])
+
+    def test_partial_fetch_keeps_received_rows_without_coverage(self):
+        # 첫 페이지(최신 100봉)는 받고 두 번째 페이지에서 실패
+        store = self.store(FakeDailyFetch(fail_calls={2}))
+        df = store.ensure_history("005930", "20240101", "20240630")
+        self.assertFalse(df.attrs["complete"])
+        self.assertEqual(len(df), 100)
+        self.assertEqual(store.coverage("005930"), [])
+
+        df = store.ensure_history("005930", "20240101", "20240630")
+        self.assertTrue(df.attrs["complete"])
+        self.assertEqual(len(df), len(_weekdays("20240101", "20240630")))
+
+
+class FakeMinuteFetch:
+    """inquire_time_itemchartprice output2 흉내 (first ~ 15:30 매분 봉, hour 이전 최신 30개), fail_calls 번째 호출은 실패"""
+
+    def __init__(self, day="20250102", first="090000", fail_calls=()):
+        self.day = day
+        self.first = datetime.strptime(day + first, "%Y%m%d%H%M%S")
+        self.fail_calls = set(fail_calls)
+        self.calls = 0
+
+    def __call__(self, code, hour, market):
+        self.calls += 1
+        if self.calls in self.fail_calls:
+            raise BarFetchError("500 Internal Server Error")
+        end = datetime.strptime(self.day + hour, "%Y%m%d%H%M%S").replace(second=0)
+        rows = []
+        t = end
+        while t >= self.first and len(rows) < 30:
+            n = int((t - self.first).total_seconds() // 60) + 1
+            rows.append({
+                "stck_bsop_date": self.day, "stck_cntg_hour": t.strftime("%H%M%S"), "stck_prpr": "100",
+                "stck_oprc": "100", "stck_hgpr": "100", "stck_lwpr": "100", "cntg_vol": "10",
+                "acml_tr_pbmn": str(n * 1000),
+            })
+            t -= timedelta(minutes=1)
+        return pd.DataFrame(rows)
+
+
+class MinuteBarRecorderTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = BarStore(os.path.join(self.tmp.name, "bars.sqlite3"), fetch=FakeDailyFetch(),
+                              calendar=TradingCalendar(path="", fetch=lambda bass_dt: pd.DataFrame()))
+        self.now = datetime(2025, 1, 2, 12, 0)
+
+    def read(self):
+        return self.store.read("005930", "20250102", "20250102", MINUTE_PERIOD, False)
+
+    def test_failed_backfill_page_writes_nothing(self):
+        recorder = MinuteBarRecorder(["005930"], self.store, fetch=FakeMinuteFetch(fail_calls={2}))
+        self.assertEqual(recorder.sync("005930", self.now), 0)
+        self.assertEqual(len(self.read()), 0)
+
+        recorder.sync("005930", self.now)
+        df = self.read()
+        self.assertEqual(len(df), 181)  # 09:00 ~ 12:00
+        self.assertEqual(df.index[0], pd.Timestamp("2025-01-02 09:00"))
+        self.assertEqual(df["amount"].iloc[0], 1000)
+
+    def test_short_page_before_open_is_retried_once(self):
+        fetch = FakeMinuteFetch(first="101500")  # 10:15 부터 거래
+        recorder = MinuteBarRecorder(["005930"], self.store, fetch=fetch)
+        recorder.sync("005930", self.now)
+        self.assertEqual(len(self.read()), 106)
+        self.assertIn("005930", recorder._incomplete)
+
+        calls = fetch.calls
+        recorder.sync("005930", self.now)  # 장 시작까지 다시 거슬러 올라가 같은 곳에서 끝남
+        self.assertGreater(fetch.calls - calls, 1)
+        self.assertNotIn("005930", recorder._incomplete)
+
+        calls = fetch.calls
+        recorder.sync("005930", self.now + timedelta(minutes=5))  # 이후에는 새 분봉만
+        self.assertEqual(fetch.calls - calls, 1)
+        self.assertEqual(len(self.read()), 111)
+
+
+class ReplayTokenTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        saved = ka._token_cache, ka._live_token_cache, dict(ka._base_headers)
+
+        def restore():
+            ka.configure_session()
+            ka._token_cache, ka._live_token_cache = saved[:2]
+            ka._base_headers.clear()
+            ka._base_headers.update(saved[2])
+            ka._header_templates.clear()
+        self.addCleanup(restore)
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_replayed_token_is_not_persisted(self):
+        token_path = os.path.join(self.tmp.name, "token.json")
+        cassette = os.path.join(self.tmp.name, "cassette.jsonl")
+        live_cache = ka._token_cache = TokenCache(store=TokenStore(token_path))
+        ka._live_token_cache = None
+
+        with StubKisServer() as server:
+            server.install()
+            ka.configure_session(session=RecordingTransport(cassette))
+            ka.auth("prod", STUB_PRODUCT)
+        with open(token_path, encoding="utf-8") as f:
+            saved = f.read()
+        self.assertIn("stub-", saved)
+
+        ka.configure_session(session=ReplayTransport(cassette))
+        self.assertIsNot(ka._token_cache, live_cache)
+        self.assertIsNone(ka._token_cache.store)
+        ka.auth("prod", STUB_PRODUCT)
+        self.assertEqual(ka._base_headers["authorization"], "Bearer ***")
+        with open(token_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), saved)
+
+        ka.configure_session()  # 실제 세션으로 돌아오면 원래 토큰 캐시 사용
+        self.assertIs(ka._token_cache, live_cache)
+
+
+class RecordingLimiter(RateLimiter):
+    """reserve 호출마다 (스레드 이름, 서버 한도 포함 여부, TR id) 를 기록"""
+
+    def __init__(self, rates):
+        super().__init__(rates)
+        self.calls = []
+
+    def reserve(self, svr, tr_id=None, server=True):
+        self.calls.append((threading.current_thread().name, server, tr_id))
+        return super().reserve(svr, tr_id, server)
+
+
+class KisStubTestCase(SimpleTestCase):
+    """StubKisServer 에 인증한 상태로 실행하고, 끝나면 kis_auth 전역 상태를 되돌림"""
+
+    server_options = {}
+    saved_globals = ("_rate_limiter", "_quote_cache", "_token_cache", "_retry_policy", "_isPaper", "_smartSleep",
+                     "_TRENV", "_autoReAuth", "_reauth_at", "_auth_args")
+
+    def setUp(self):
+        saved = {name: getattr(ka, name) for name in self.saved_globals}
+        headers = dict(ka._base_headers)
+
+        def restore():
+            ka.configure_session()
+            for name, value in saved.items():
+                setattr(ka, name, value)
+            ka._base_headers.clear()
+            ka._base_headers.update(headers)
+            ka._header_templates.clear()
+        self.addCleanup(restore)
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        server = StubKisServer(**self.server_options)
+        self.server = server.__enter__()
+        self.addCleanup(server.__exit__, None, None, None)
+        server.install()
+        ka.configure_session()
+        ka._quote_cache = None
+        ka._retry_policy = None
+        ka._token_cache = TokenCache()
+        ka.auth("prod", STUB_PRODUCT)
+
+
+class AsyncRateLimitTests(KisStubTestCase):
+    server_options = {"holdings": {f"{i:06d}": (10, 1000) for i in range(45)}, "page_size": 20}
+
+    def test_wrapper_waits_for_server_limit_on_the_loop(self):
+        limiter = ka._rate_limiter = RecordingLimiter({"prod": 1000})
+
+        async def main():
+            return await asyncio.gather(*[
+                kaa.inquire_price(env_dv="real", fid_cond_mrkt_div_code="J", fid_input_iscd=code)
+                for code in ("005930", "000660", "035720")
+            ])
+        results = asyncio.run(main())
+        self.assertEqual([len(df) for df in results], [1, 1, 1])
+
+        main_thread = threading.current_thread().name
+        server_calls = [c for c in limiter.calls if c[1]]
+        self.assertEqual(len(server_calls), 3)
+        self.assertTrue(all(name == main_thread for name, _, _ in server_calls))
+        self.assertTrue(all(name.startswith("kis-async") for name, server, _ in limiter.calls if not server))
+
+    def test_next_pages_still_wait_for_server_limit(self):
+        limiter = ka._rate_limiter = RecordingLimiter({"prod": 1000})
+        d1, d2 = asyncio.run(kaa.inquire_balance("real", STUB_ACCOUNT, "01", "N", "02", "01", "N", "N", "00"))
+        self.assertEqual(len(d1), 45)
+        server_calls = [c for c in limiter.calls if c[1]]
+        self.assertEqual(len(server_calls), 3)  # 루프에서 1번 + 스레드에서 다음 두 페이지
+        self.assertEqual(sum(name.startswith("kis-async") for name, _, _ in server_calls), 2)
+
+    def price(self, code):
+        return kaa.url_fetch("/uapi/domestic-stock/v1/quotations/inquire-price", "FHKST01010100", "",
+                             {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": code})
+
+    def test_url_fetch_cache_hit_does_not_use_rate_budget(self):
+        limiter = ka._rate_limiter = RecordingLimiter({"prod": 1000})
+        ka._quote_cache = QuoteCache(ttl=60)
+
+        async def main():
+            first = await self.price("005930")
+            return first, await self.price("005930")
+        first, second = asyncio.run(main())
+        self.assertTrue(first.isOK())
+        self.assertIs(second, first)
+        self.assertEqual(len([c for c in limiter.calls if c[1]]), 1)
+        self.assertEqual(ka._quote_cache.hits, 1)
+
+    def test_url_fetch_retries_go_through_the_limiter(self):
+        limiter = ka._rate_limiter = RecordingLimiter({"prod": 1000})
+        ka._retry_policy = RetryPolicy(retries=2, backoff=0.001, deadline=0)
+        self.server.rate = 1  # 두 번째 요청부터 EGW00201
+
+        async def main():
+            await self.price("005930")
+            return await self.price("000660")
+        asyncio.run(main())
+        retried = [c for c in limiter.calls if c[1] and c[0].startswith("kis-async")]
+        self.assertEqual(len(retried), 2)  # 재시도 두 번 모두 스레드에서 서버 한도를 다시 받음
+
+
+class BackgroundStartupTests(SimpleTestCase):
+    def test_only_server_processes_start_jobs(self):
+        cases = [
+            (["manage.py", "migrate"], {}, False),
+            (["manage.py", "shell"], {}, False),
+            (["manage.py", "runserver"], {}, False),  # autoreload 감시 프로세스
+            (["manage.py", "runserver"], {"RUN_MAIN": "true"}, True),
+            (["manage.py", "runserver", "--noreload"], {}, True),
+            (["/venv/lib/python3.13/site-packages/django/__main__.py", "runserver"], {"RUN_MAIN": "true"}, True),
+            (["/venv/bin/gunicorn", "config.wsgi"], {}, True),
+            (["/venv/bin/uvicorn", "config.asgi:application"], {}, True),
+            (["/venv/lib/python3.13/site-packages/gunicorn/__main__.py", "config.wsgi"], {}, True),
+            (["/venv/bin/pytest"], {}, False),
+            (["/venv/bin/celery", "-A", "config", "worker"], {}, False),
+            (["scripts/backfill.py"], {}, False),
+            ([""], {}, False),  # python -c
+        ]
+        for argv, env, expected in cases:
+            with self.subTest(argv=argv, env=env), mock.patch("sys.argv", argv), \
+                    mock.patch.dict(os.environ, env):
+                if "RUN_MAIN" not in env:
+                    os.environ.pop("RUN_MAIN", None)
+                self.assertEqual(api_apps._isServerProcess(), expected)
+
+    def test_background_jobs_setting_overrides_detection(self):
+        with mock.patch("sys.argv", ["/venv/bin/celery", "worker"]):
+            self.assertTrue(api_apps._backgroundEnabled("1"))
+            self.assertFalse(api_apps._backgroundEnabled(""))
+        with mock.patch("sys.argv", ["/venv/bin/gunicorn", "config.wsgi"]):
+            self.assertFalse(api_apps._backgroundEnabled("0"))
+            self.assertTrue(api_apps._backgroundEnabled(""))
+
+    @unittest.skipIf(api_apps.fcntl is None, "fcntl 없음")
+    def test_job_lock_is_held_by_one_process(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "jobs.lock")
+            with open(path, "a") as other:  # 다른 워커가 잡고 있는 잠금
+                api_apps.fcntl.flock(other.fileno(), api_apps.fcntl.LOCK_EX | api_apps.fcntl.LOCK_NB)
+                with mock.patch.object(api_apps, "_job_lock", None):
+                    self.assertFalse(api_apps._acquireJobLock(path))
+            with mock.patch.object(api_apps, "_job_lock", None):
+                self.assertTrue(api_apps._acquireJobLock(path))
+                api_apps._job_lock.close()
+
+
+class DictBackend:
+    """영구 저장소 흉내 (get 호출 수를 셈)"""
+
+    def __init__(self):
+        self.data = {}
+        self.gets = 0
+
+    def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    def set(self, key, value, ttl):
+        self.data[key] = value
+
+    def clear(self):
+        self.data.clear()
+
+
+class NodeResultCacheTests(SimpleTestCase):
+    def test_memory_limit_counts_utf8_bytes(self):
+        outputs = {"name": "삼성전자" * 10}
+        size = len(json.dumps(outputs, ensure_ascii=False).encode("utf-8"))
+        cache = NodeResultCache(max_bytes=size * 2 - 1)
+        cache.set("a", outputs, 60)
+        cache.set("b", outputs, 60)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), outputs)
+
+    def test_backend_hit_is_promoted_to_memory(self):
+        backend = DictBackend()
+        NodeResultCache(backend=backend).set("k", {"v": 1}, 60)
+
+        cache = NodeResultCache(backend=backend)  # 재시작한 프로세스
+        self.assertEqual(cache.get("k"), {"v": 1})
+        self.assertEqual(cache.get("k"), {"v": 1})
+        self.assertEqual(backend.gets, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_expired_backend_entry_is_a_miss(self):
+        backend = DictBackend()
+        backend.set("k", (0.0, json.dumps({"v": 1})), 60)
+        cache = NodeResultCache(backend=backend)
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.misses, 1)
+
+
+class WorkflowGraphTests(SimpleTestCase):
+    def test_malformed_editor_data_raises_graph_error(self):
+        node = {"id": "node-1", "info": {"id": "constant"}, "data": {"values": {}}}
+        cases = [
+            {"nodes": "node-1"},
+            {"nodes": ["node-1"]},
+            {"nodes": [{**node, "data": "x"}]},
+            {"nodes": [{**node, "data": {"values": [1, 2]}}]},
+            {"nodes": [{**node, "info": "constant"}]},
+            {"nodes": [{**node, "id": None}]},
+            {"nodes": [node], "connections": [{"from": "node-1", "to": "node-1"}]},
+            {"nodes": [node], "connections": [{"from": {"node": "node-1"}, "to": {"node": "node-1", "port": "a"}}]},
+        ]
+        for data in cases:
+            with self.subTest(data=data), self.assertRaises(WorkflowGraphError):
+                WorkflowGraph.from_editor_data(data)
+
+    def test_valid_editor_data(self):
+        graph = WorkflowGraph.from_editor_data({
+            "nodes": [{"id": "a", "info": {"id": "constant"}}, {"id": "b", "data": {"info": {"id": "print"}}}],
+            "connections": [{"from": {"node": "a", "port": "out"}, "to": {"node": "b", "port": "in"}}],
+        })
+        self.assertEqual(graph.topological_order(), ["a", "b"])
+
+
+class NodeRegistryTests(SimpleTestCase):
+    def test_node_with_broken_info_is_still_registered(self):
+        class BrokenInfoNode:
+            NODE_ID = "broken"
+
+            @classmethod
+            def get_info(cls):
+                raise RuntimeError("schema failed")
+
+        class OkNode:
+            NODE_ID = "ok"
+
+            @classmethod
+            def get_info(cls):
+                return {"id": cls.NODE_ID}
+
+        registry = NodeRegistry([BrokenInfoNode, OkNode])
+        self.assertIs(registry.get("broken"), BrokenInfoNode)
+        self.assertIn("broken", registry)
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.infos[0], {"id": "broken", "error": "failed to load node info: schema failed"})
+        self.assertEqual(json.loads(registry.infos_json)[1], {"id": "ok"})
+
+    def test_duplicated_node_id_is_rejected(self):
+        class OkNode:
+            NODE_ID = "ok"
+
+            @classmethod
+            def get_info(cls):
+                return {"id": cls.NODE_ID}
+
+        with self.assertRaises(ValueError):
+            NodeRegistry([OkNode, OkNode])
+
+
+class RealtimeDecodeTests(SimpleTestCase):
+    def setUp(self):
+        import api.functions.kis_ws  # noqa: F401  H0STCNT0 컬럼을 data_map 에 등록
+
+    def test_bad_frame_is_dropped_without_losing_the_batch(self):
+        frames = _sampleFrames(20, seed=1)
+        bad = frames[5].rsplit("^", 1)[0]  # 값 하나가 빠진 메시지
+        good = frames[:5] + frames[6:]
+        expected = decode_frames(good)["H0STCNT0"]
+
+        with self.assertLogs("api.functions.kis_ws_decode", "WARNING"):
+            result = decode_frames(frames[:5] + [bad, "garbage"] + frames[6:], received=True)
+        df = result["H0STCNT0"]
+        self.assertEqual(len(df), sum(split_frame(f).count for f in good))
+        self.assertTrue(df.drop(columns="received").equals(expected))
+
+
+class SchemaClassifyTests(SimpleTestCase):
+    def test_sign_fields_stay_strings(self):
+        self.assertIsNone(classify("sign", "대비기호", ["2"]))
+        self.assertIsNone(classify("ovtm_untp_antc_cntg_vrsssign", "시간외단일가예상체결대비부호", ["5"]))
+        self.assertIsNone(classify("prdy_vrss_sign", "전일대비부호", ["2"]))
+        self.assertEqual(classify("prdy_vrss", "전일대비", ["-300"]), "int")
+        self.assertEqual(classify("stck_prpr", "주식현재가", ["70000"]), "int")
+
+
+    def test_to_frame_types_numeric_columns(self):
+        df = to_frame([
+            {"stck_prpr": "71000", "prdy_vrss": "-500", "prdy_ctrt": "-0.70", "prdy_vrss_sign": "5", "acml_vol": ""},
+            {"stck_prpr": "72000", "prdy_vrss": "1000", "prdy_ctrt": "1.41", "prdy_vrss_sign": "2", "acml_vol": "10"},
+        ], "FHKST01010100")
+        self.assertEqual(str(df["stck_prpr"].dtype), "int64")
+        self.assertEqual(df["prdy_vrss"].tolist(), [-500, 1000])
+        self.assertEqual(str(df["prdy_ctrt"].dtype), "float64")
+        self.assertEqual(df["prdy_vrss_sign"].tolist(), ["5", "2"])  # 부호는 문자열
+        self.assertEqual(str(df["acml_vol"].dtype), "Int64")  # 빈 값은 결측
+
+    def test_to_frame_keeps_sign_fields_as_strings(self):
+        df = to_frame([{"sign": "2", "tvol": "100"}], "HHDFS00000300")
+        self.assertEqual(df["sign"].tolist(), ["2"])
+        self.assertEqual(df["tvol"].tolist(), [100])
+
+    def test_to_frame_falls_back_to_float_beyond_int64(self):
+        df = to_frame([{"stck_prpr": "71000", "acml_tr_pbmn": "99999999999999999999"},
+                       {"stck_prpr": "72000", "acml_tr_pbmn": "100"}], "FHKST01010100")
+        self.assertEqual(str(df["acml_tr_pbmn"].dtype), "float64")
+        self.assertAlmostEqual(df["acml_tr_pbmn"].iloc[0] / 1e20, 1.0)
+        self.assertEqual(df["acml_tr_pbmn"].iloc[1], 100.0)
+        self.assertEqual(str(df["stck_prpr"].dtype), "int64")
+
+
+class RealtimeClientTests(SimpleTestCase):
+    def run_with_client(self, scenario):
+        async def main():
+            async with StubRealtimeServer() as server:
+                async with RealtimeClient(url=server.url, approval_key="stub", reconnect_delay=0.05) as client:
+                    await client.wait_connected(5)
+                    await scenario(server, client)
+        asyncio.run(main())
+
+    def test_subscribe_and_receive(self):
+        async def scenario(server, client):
+            await client.subscribe("H0STCNT0", "005930")
+            listener = client.listen("H0STCNT0")
+            self.assertEqual(await server.push("H0STCNT0", [sample_record("H0STCNT0", "005930", STCK_PRPR=71000)]), 1)
+            msg = await asyncio.wait_for(listener.get(), 5)
+            self.assertEqual((msg.tr_key, msg.data["STCK_PRPR"]), ("005930", "71000"))
+            self.assertEqual(client.last("H0STCNT0", "005930"), msg)
+        self.run_with_client(scenario)
+
+    def test_malformed_frame_is_dropped_and_receiving_continues(self):
+        async def scenario(server, client):
+            await client.subscribe("H0STCNT0", "005930")
+            listener = client.listen("H0STCNT0")
+            with self.assertLogs("api.functions.kis_ws", "WARNING"):
+                await server.send("0|H0STCNT0|bad")
+                await server.send("1|H0STCNI0|001|not-encrypted")  # 복호화 key/iv 없음
+                await server.send("{not json")
+                await asyncio.sleep(0.1)
+            self.assertTrue(client.connected)
+            await server.push("H0STCNT0", [sample_record("H0STCNT0", "005930", STCK_PRPR=71100)])
+            msg = await asyncio.wait_for(listener.get(), 5)
+            self.assertEqual(msg.data["STCK_PRPR"], "71100")
+            self.assertEqual(client.reconnects, 0)
+        self.run_with_client(scenario)
+
+    def test_subscriptions_are_restored_after_reconnect(self):
+        async def scenario(server, client):
+            await client.subscribe("H0STCNT0", "005930")
+            listener = client.listen("H0STCNT0")
+            await server.drop()
+            await asyncio.sleep(0.3)
+            await client.wait_connected(5)
+            for _ in range(50):  # 복원 등록 요청이 서버에 처리될 때까지
+                if await server.push("H0STCNT0", [sample_record("H0STCNT0", "005930", STCK_PRPR=71200)]):
+                    break
+                await asyncio.sleep(0.02)
+            msg = await asyncio.wait_for(listener.get(), 5)
+            self.assertEqual(msg.data["STCK_PRPR"], "71200")
+            self.assertGreaterEqual(client.reconnects, 1)
+            self.assertEqual(server.connections, 2)
+        self.run_with_client(scenario)
+
+    def test_pingpong_keeps_connection(self):
+        async def scenario(server, client):
+            await client.subscribe("H0STCNT0", "005930")
+            listener = client.listen("H0STCNT0")
+            with mock.patch.object(client._ws, "pong", wraps=client._ws.pong) as pong:
+                await server.ping()
+                await server.push("H0STCNT0", [sample_record("H0STCNT0", "005930", STCK_PRPR=71300)])
+                await asyncio.wait_for(listener.get(), 5)
+            pong.assert_called_once()
+            self.assertEqual((server.connections, client.reconnects), (1, 0))
+        self.run_with_client(scenario)
+
+
+class FakeMultprice:
+    """intstock_multprice 흉내 (호출마다 받은 종목코드 기록, unknown 에 있는 코드는 응답에서 빠짐)"""
+
+    def __init__(self, unknown=()):
+        self.unknown = set(unknown)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        codes = [kwargs[f"fid_input_iscd_{i}"] for i in range(1, 31) if f"fid_input_iscd_{i}" in kwargs]
+        with self.lock:
+            self.calls.append(codes)
+        return to_frame([{
+            "kospi_kosdaq_cls_name": "코스피", "inter_shrn_iscd": code, "inter_kor_isnm": f"종목{code}",
+            "inter2_prpr": str(1000 + int(code)), "prdy_vrss_sign": "2", "prdy_ctrt": "1.25",
+            "acml_vol": str(int(code) * 10),
+        } for code in codes if code not in self.unknown], "FHKST11300006")
+
+
+class GetQuotesTests(SimpleTestCase):
+    def test_codes_are_fetched_in_chunks_of_30_and_merged_in_order(self):
+        codes = [f"{i:06d}" for i in range(1, 71)]
+        fake = FakeMultprice()
+        with mock.patch.object(kis_quotes, "intstock_multprice", fake):
+            df = kis_quotes.get_quotes(codes + ["000001"], max_workers=3)
+        self.assertEqual(sorted(len(c) for c in fake.calls), [10, 30, 30])
+        self.assertEqual(sorted(c for chunk in fake.calls for c in chunk), codes)
+        self.assertEqual(df.index.tolist(), codes)
+        self.assertEqual(df.loc["000070", "inter2_prpr"], 1070)
+        self.assertEqual(str(df["acml_vol"].dtype), "int64")
+        self.assertEqual(df["prdy_vrss_sign"].iloc[0], "2")
+        self.assertEqual(df.attrs["missing"], [])
+
+    def test_missing_codes_are_filled_with_nulls(self):
+        fake = FakeMultprice(unknown={"000002"})
+        with mock.patch.object(kis_quotes, "intstock_multprice", fake):
+            df = kis_quotes.get_quotes(["000001", "000002", "000003"])
+        self.assertEqual(df.attrs["missing"], ["000002"])
+        self.assertEqual(df.index.tolist(), ["000001", "000002", "000003"])
+        self.assertTrue(pd.isna(df.loc["000002", "acml_vol"]))
+        self.assertEqual(str(df["acml_vol"].dtype), "Int64")
+        self.assertEqual(df.loc["000003", "inter_kor_isnm"], "종목000003")
+
+
+class ReAuthTests(KisStubTestCase):
+    def test_paper_session_stays_on_paper_after_refresh(self):
+        ka.auth("vps", STUB_PRODUCT)
+        self.assertTrue(ka.isPaperTrading())
+        ka._token_cache.invalidate("vps", os.environ["paper_app"])  # 재발급 시각이 지난 것처럼
+        ka._autoReAuth, ka._reauth_at = True, 0.0
+
+        with mock.patch.object(ka, "auth", wraps=ka.auth) as auth:
+            headers = ka._requestHeaders("FHKST01010100", "")
+        auth.assert_called_once_with("vps", STUB_PRODUCT)
+        self.assertTrue(ka.isPaperTrading())
+        self.assertEqual(ka.getTREnv().my_acct, os.environ["my_paper_stock"])
+        self.assertEqual(headers["tr_id"], "FHKST01010100")
+        self.assertGreater(ka._reauth_at, time.time())
+
+
+def _rateLimited():
+    return ka.APIRespError(500, '{"rt_cd":"1","msg_cd":"EGW00201","msg1":"초당 거래건수를 초과하였습니다."}')
+
+
+class RetryTests(SimpleTestCase):
+    def test_post_is_retried_only_when_not_sent(self):
+        policy = RetryPolicy(retries=2)
+        read_timeout = ka.APIRespError(0, "read timeout", exception=requests.ReadTimeout())
+        connect_timeout = ka.APIRespError(0, "connect timeout", exception=requests.ConnectTimeout())
+        gateway = ka.APIRespError(502, "Bad Gateway")
+        self.assertFalse(policy.should_retry(read_timeout, 0, idempotent=False))
+        self.assertFalse(policy.should_retry(gateway, 0, idempotent=False))
+        self.assertTrue(policy.should_retry(connect_timeout, 0, idempotent=False))
+        self.assertTrue(policy.should_retry(_rateLimited(), 0, idempotent=False))
+        # 조회는 응답을 못 받은 경우도 재시도, 재시도 횟수를 다 쓰면 멈춤
+        self.assertTrue(policy.should_retry(read_timeout, 0, idempotent=True))
+        self.assertFalse(policy.should_retry(read_timeout, 2, idempotent=True))
+
+    def test_call_with_retry_stops_after_success(self):
+        responses = [_rateLimited(), ka.APIRespError(503, "Service Unavailable"), "ok"]
+        sleeps = []
+
+        def send():
+            res = responses.pop(0)
+            return mock.Mock(isOK=lambda: True) if res == "ok" else res
+        res = call_with_retry(send, RetryPolicy(retries=3, deadline=0), sleep=sleeps.append)
+        self.assertTrue(res.isOK())
+        self.assertEqual(len(sleeps), 2)
+
+    def test_half_open_lets_exactly_one_probe_through(self):
+        breaker = CircuitBreaker(threshold=2, reset_timeout=0.05)
+        breaker.record("kis", False)
+        self.assertEqual(breaker.state("kis"), "closed")
+        breaker.record("kis", False)
+        self.assertEqual(breaker.state("kis"), "open")
+        self.assertFalse(breaker.allow("kis"))
+
+        time.sleep(0.06)
+        self.assertEqual(breaker.state("kis"), "half_open")
+        self.assertTrue(breaker.allow("kis"))
+        self.assertFalse(breaker.allow("kis"))  # 시험 요청이 끝날 때까지 나머지는 거절
+        breaker.record("kis", False)  # 시험 요청 실패 → 다시 open
+        self.assertEqual(breaker.state("kis"), "open")
+
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow("kis"))
+        breaker.record("kis", True)
+        self.assertEqual(breaker.state("kis"), "closed")
+        self.assertTrue(breaker.allow("kis"))
+
+    def test_rate_limited_responses_do_not_open_breaker(self):
+        breaker = CircuitBreaker(threshold=1, reset_timeout=60)
+        rejected = ka.APIRespError(0, "circuit open", circuit_open=True)
+        for _ in range(5):
+            res = call_with_retry(_rateLimited, None, breaker, "kis", on_reject=lambda: rejected)
+            self.assertEqual(res.getErrorCode(), "500")
+        self.assertEqual(breaker.state("kis"), "closed")
+
+        call_with_retry(lambda: ka.APIRespError(503, "Service Unavailable"), None, breaker, "kis",
+                        on_reject=lambda: rejected)
+        self.assertEqual(breaker.state("kis"), "open")
+        self.assertIs(call_with_retry(_rateLimited, None, breaker, "kis", on_reject=lambda: rejected), rejected)
+
+
+class RateLimiterTests(SimpleTestCase):
+    def test_token_bucket_paces_calls(self):
+        bucket = TokenBucket(rate=10)
+        waits = [bucket.reserve() for _ in range(5)]
+        for expected, wait in zip([0.0, 0.1, 0.2, 0.3, 0.4], waits):
+            self.assertAlmostEqual(wait, expected, delta=0.02)
+
+    def test_burst_capacity_allows_back_to_back_calls(self):
+        bucket = TokenBucket(rate=10, capacity=3)
+        waits = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.1, delta=0.02)
+
+    def test_tr_limit_is_separate_from_server_limit(self):
+        limiter = RateLimiter({"prod": 100})
+        limiter.set_tr_rate("FHKST01010100", 2)
+        self.assertEqual(limiter.reserve("prod", "FHKST01010100"), 0.0)
+        self.assertAlmostEqual(limiter.reserve("prod", "FHKST01010100"), 0.5, delta=0.02)
+        self.assertAlmostEqual(limiter.reserve("prod", "FHKST01010100", server=False), 1.0, delta=0.02)
+        self.assertAlmostEqual(limiter.reserve("prod"), 0.02, delta=0.005)  # 서버 한도는 앞의 두 번만 예약
+        self.assertEqual(limiter.reserve("vps"), 0.0)  # 한도가 없는 서버
+
+    @unittest.skipIf(api_apps.fcntl is None, "fcntl 없음")
+    def test_file_bucket_is_shared_across_processes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "prod.bucket")
+            # 다른 워커 프로세스가 초당 5건 한도에서 5건을 먼저 예약
+            code = ("from api.functions.kis_ratelimit import FileTokenBucket; import sys; "
+                    "b = FileTokenBucket(sys.argv[1], 5); [b.reserve() for _ in range(5)]")
+            subprocess.run([sys.executable, "-c", code, path], check=True, timeout=60,
+                           env={**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(api_apps.__file__))})
+            wait = FileTokenBucket(path, 5).reserve()
+        self.assertGreater(wait, 0.5)
+        self.assertLessEqual(wait, 1.0)
+
+
+BALANCE_URL = "/uapi/domestic-stock/v1/trading/inquire-balance"
+BALANCE_CURSOR = {"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"}
+
+
+class PaginatorTests(KisStubTestCase):
+    server_options = {"holdings": {f"{i:06d}": (10, 1000) for i in range(45)}, "page_size": 20}
+
+    def setUp(self):
+        super().setUp()
+        self.sent = []
+        fetch = ka._url_fetch
+
+        def recordingFetch(api_url, ptr_id, tr_cont, params, **kwargs):
+            self.sent.append((tr_cont, params.get("CTX_AREA_NK100")))
+            return fetch(api_url, ptr_id, tr_cont, params, **kwargs)
+        patcher = mock.patch.object(ka, "_url_fetch", recordingFetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def params(self):
+        return {"CANO": STUB_ACCOUNT, "ACNT_PRDT_CD": "01", "AFHR_FLPR_YN": "N", "OFL_YN": "", "INQR_DVSN": "02",
+                "UNPR_DVSN": "01", "FUND_STTL_ICLD_YN": "N", "FNCG_AMT_AUTO_RDPT_YN": "N", "PRCS_DVSN": "00",
+                "CTX_AREA_FK100": "", "CTX_AREA_NK100": ""}
+
+    def test_cursor_and_tr_cont_are_forwarded(self):
+        pages = Paginator(BALANCE_URL, "TTTC8434R", self.params(), cursor=BALANCE_CURSOR)
+        rows = list(pages.rows("output1"))
+        self.assertEqual([r["pdno"] for r in rows], [f"{i:06d}" for i in range(45)])
+        self.assertEqual(self.sent, [("", ""), ("N", "20"), ("N", "40")])
+        self.assertEqual((pages.pages, pages.truncated, pages.error), (3, False, None))
+
+    def test_max_depth_sets_truncated(self):
+        df1, df2 = dsf.inquire_balance("real", STUB_ACCOUNT, "01", "N", "02", "01", "N", "N", "00", max_depth=2)
+        self.assertEqual(len(df1), 40)
+        self.assertTrue(df1.attrs["truncated"])
+        self.assertEqual(df1.attrs["pages"], 2)
+        self.assertEqual(len(self.sent), 2)
+
+    def test_collect_appends_to_existing_frames(self):
+        prev1 = pd.DataFrame([{"pdno": "999999", "hldg_qty": 1}])
+        prev2 = pd.DataFrame([{"dnca_tot_amt": 1}])
+        pages = Paginator(BALANCE_URL, "TTTC8434R", self.params(), cursor=BALANCE_CURSOR)
+        df1, df2 = pages.collect("output1", "output2", frames=(prev1, prev2))
+        self.assertEqual(len(df1), 46)
+        self.assertEqual(df1["pdno"].iloc[0], "999999")
+        self.assertEqual(df1["pdno"].iloc[-1], "000044")
+        self.assertEqual(len(df2), 4)  # 기존 1행 + 페이지마다 요약 1행
+        self.assertFalse(df1.attrs["truncated"])
+
+    def test_failed_page_returns_empty_frames(self):
+        params = dict(self.params(), CANO="00000000")
+        pages = Paginator(BALANCE_URL, "TTTC8434R", params, cursor=BALANCE_CURSOR)
+        df1 = pages.collect("output1")
+        self.assertTrue(df1.empty)
+        self.assertIsNotNone(pages.error)
+
+
+class QuoteCacheTests(KisStubTestCase):
+    server_options = {"latency": 0.3}
+
+    def test_concurrent_misses_share_one_fetch(self):
+        cache = QuoteCache(ttl=60)
+        release = threading.Event()
+        fetched = []
+
+        def fetch():
+            fetched.append(1)
+            release.wait(5)
+            return "body"
+        key = cache.key("prod", "FHKST01010100", "/quote", {"FID_INPUT_ISCD": "005930"})
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch(key, fetch)))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 5
+        while cache.coalesced < 7 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(results, ["body"] * 8)
+        self.assertEqual(len(fetched), 1)
+        self.assertEqual((cache.misses, cache.coalesced, cache.hits), (1, 7, 0))
+        self.assertEqual(cache.get_or_fetch(key, fetch), "body")
+        self.assertEqual(cache.hits, 1)
+
+    def test_concurrent_url_fetch_sends_one_request(self):
+        ka._quote_cache = QuoteCache(ttl=60)
+        barrier = threading.Barrier(6)
+        results = []
+
+        def price():
+            barrier.wait()
+            results.append(ka._url_fetch("/uapi/domestic-stock/v1/quotations/inquire-price", "FHKST01010100", "",
+                                         {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"}))
+        threads = [threading.Thread(target=price) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(res is results[0] for res in results))
+        self.assertEqual(self.server.requests.get("quote"), 1)
+        self.assertEqual(ka._quote_cache.misses, 1)
+        self.assertEqual(ka._quote_cache.coalesced, 5)
+
+
+
+class HeaderTemplateTests(KisStubTestCase):
+    def setUp(self):
+        super().setUp()
+        os.environ.update({"paper_app": "stub-paper-app", "paper_sec": "stub-paper-secret"})
+
+    def test_auth_switch_rebuilds_templates(self):
+        prod = ka._requestHeaders("FHKST01010100", "")
+        self.assertEqual(prod["appkey"], "stub-app")
+        self.assertEqual(list(ka._header_templates), [(False, "FHKST01010100")])
+
+        ka.auth("vps", STUB_PRODUCT)
+        paper = ka._requestHeaders("FHKST01010100", "N")
+        self.assertEqual((paper["appkey"], paper["appsecret"]), ("stub-paper-app", "stub-paper-secret"))
+        self.assertNotEqual(paper["authorization"], prod["authorization"])
+        self.assertEqual(paper["tr_cont"], "N")
+        self.assertEqual(list(ka._header_templates), [(True, "FHKST01010100")])
+
+        ka.auth("prod", STUB_PRODUCT)
+        again = ka._requestHeaders("FHKST01010100", "")
+        self.assertEqual(again["appkey"], "stub-app")
+        self.assertEqual(again["authorization"], prod["authorization"])  # 캐시된 실전 토큰 재사용
+        self.assertEqual(list(ka._header_templates), [(False, "FHKST01010100")])
+
+    def test_change_tr_env_drops_templates(self):
+        ka._requestHeaders("FHKST01010100", "")
+        ka.changeTREnv(None, "vps", STUB_PRODUCT)
+        self.assertEqual(ka._header_templates, {})
+        ka._requestHeaders("FHKST01010100", "")
+        self.assertEqual(list(ka._header_templates), [(True, "FHKST01010100")])
+
+    def test_append_headers_do_not_leak_into_template(self):
+        ka._requestHeaders("FHKST01010100", "", {"gt_uid": "abc"})
+        headers = ka._requestHeaders("FHKST01010100", "")
+        self.assertNotIn("gt_uid", headers)
+        self.assertNotIn("tr_cont", ka._header_templates[(False, "FHKST01010100")])
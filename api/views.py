@@ -1,10 +1,13 @@
 import json
-from typing import Any, Dict, List
 
-from django.http import JsonResponse, HttpResponseNotAllowed
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, HttpResponseNotAllowed
 from django.views.decorators.csrf import csrf_exempt
+from pydantic import ValidationError
 
-from api.nodes import NODES
+from api.functions.kis_metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_prometheus
+from api.nodes import NODE_REGISTRY
+from api.workflow import WorkflowExecutor, WorkflowGraph, WorkflowGraphError, apply_run_result
 from .models import Workflow
 
 
@@ -14,21 +17,14 @@ def health_check(request):
     return JsonResponse({'status': 'healthy', 'message': 'API is running'})
 
 
+def metrics(request):
+    """KIS REST 호출 지표 (TR 별 요청 수/지연 분포/전송량, 시세 캐시) 를 Prometheus text format 으로 반환"""
+    return HttpResponse(render_prometheus(), content_type=METRICS_CONTENT_TYPE)
+
+
 def nodes_list(request):
-    """등록된 모든 노드의 정보(get_info)를 반환"""
-    nodes_info: List[Dict[str, Any]] = []
-    for item in NODES:
-        try:
-            # NODES 항목이 클래스이든 인스턴스이든 모두 대응
-            obj = item if not isinstance(item, type) else item()
-            info = obj.get_info()
-            nodes_info.append(info)
-        except Exception as e:
-            nodes_info.append({
-                "id": getattr(item, 'NODE_ID', 'unknown'),
-                "error": f"failed to load node info: {e}"
-            })
-    return JsonResponse(nodes_info, safe=False)
+    """등록된 모든 노드의 정보(get_info)를 반환 (레지스트리에 미리 직렬화된 값을 그대로 사용)"""
+    return HttpResponse(NODE_REGISTRY.infos_json, content_type='application/json')
 
 
 def workflows_list(request):
@@ -80,6 +76,36 @@ def workflows_create(request):
     return JsonResponse({'ok': True, 'id': wf.id})
 
 
+@csrf_exempt
+def workflow_run(request, wf_id: int):
+    """저장된 워크플로우를 서버에서 위상 정렬 순서대로 실행하는 엔드포인트"""
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    try:
+        wf = Workflow.objects.get(id=wf_id)
+    except Workflow.DoesNotExist:
+        return JsonResponse({'error': 'not found'}, status=404)
+
+    editor_data = wf.data.get('custom_editor') if isinstance(wf.data, dict) else None
+    try:
+        graph = WorkflowGraph.from_editor_data(editor_data)
+    except (WorkflowGraphError, ValidationError) as e:
+        return JsonResponse({'success': False, 'error': f'invalid workflow: {e}'}, status=400)
+
+    try:
+        executor = WorkflowExecutor(max_workers=settings.WORKFLOW_MAX_WORKERS)
+        run_result = executor.run(graph)
+    except WorkflowGraphError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    # 실행 결과를 저장해서 에디터에서 다시 열었을 때 값이 보이도록 함
+    apply_run_result(editor_data, run_result)
+    wf.save()
+
+    return JsonResponse({'workflow_id': wf.id, **run_result.model_dump()})
+
+
 @csrf_exempt
 def node_execute(request, node_id: str):
     """특정 ID를 가진 노드를 실행하는 엔드포인트"""
@@ -92,20 +118,8 @@ def node_execute(request, node_id: str):
     except Exception:
         return JsonResponse({'error': 'invalid json'}, status=400)
 
-    # NODES에서 해당 ID를 가진 노드 클래스 찾기
-    target_node_class = None
-    for node_class in NODES:
-        # 클래스인 경우 임시 인스턴스를 만들어서 NODE_ID 확인
-        if isinstance(node_class, type):
-            temp_instance = node_class()
-            if hasattr(temp_instance, 'NODE_ID') and temp_instance.NODE_ID == node_id:
-                target_node_class = node_class
-                break
-        else:
-            # 이미 인스턴스인 경우
-            if hasattr(node_class, 'NODE_ID') and node_class.NODE_ID == node_id:
-                target_node_class = type(node_class)
-                break
+    # 레지스트리에서 해당 ID를 가진 노드 클래스 찾기
+    target_node_class = NODE_REGISTRY.get(node_id)
 
     if target_node_class is None:
         return JsonResponse({'error': f'node with id "{node_id}" not found'}, status=404)
@@ -0,0 +1,2 @@
+from api.workflow.graph import WorkflowGraph, WorkflowGraphError
+from api.workflow.executor import WorkflowExecutor, WorkflowRunResult, NodeRunResult, apply_run_result
@@ -0,0 +1,180 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, Field
+
+from api.nodes import NODE_REGISTRY
+from api.nodes.base import BaseNode
+from api.workflow.graph import WorkflowGraph
+
+
+class NodeRunResult(BaseModel):
+    """워크플로우 안에서 노드 하나를 실행한 결과"""
+    node: str = Field(description="에디터 상의 노드 ID")
+    node_id: str = Field(description="노드 클래스의 NODE_ID")
+    status: str = Field(description="success / failed / skipped")
+    inputs: Dict[str, Any] = Field(
+        default_factory=dict, description="실제로 주입된 입력값")
+    outputs: Dict[str, Any] = Field(
+        default_factory=dict, description="노드의 출력 데이터")
+    error: Optional[str] = Field(default=None, description="에러 발생 시 메시지")
+    elapsed: float = Field(default=0.0, description="실행 시간 (초)")
+
+
+class WorkflowRunResult(BaseModel):
+    """워크플로우 전체 실행 결과"""
+    success: bool = Field(..., description="모든 노드가 성공했는지 여부")
+    order: List[str] = Field(
+        default_factory=list, description="위상 정렬된 실행 순서")
+    results: Dict[str, NodeRunResult] = Field(
+        default_factory=dict, description="노드별 실행 결과")
+    elapsed: float = Field(default=0.0, description="전체 실행 시간 (초)")
+
+
+class WorkflowExecutor:
+    """
+    WorkflowGraph 를 위상 정렬 순서대로 서버 안에서 실행합니다.
+
+    각 노드의 입력은 에디터에 저장된 값(values)에 상위 노드의 출력을 연결대로 덮어써서 만듭니다.
+    상위 노드가 실패하면 하위 노드는 실행하지 않고 skipped 로 표시합니다.
+
+    max_workers 가 2 이상이면 입력이 모두 준비된 노드들을 스레드 풀에서 동시에 실행하므로,
+    서로 독립적인 분기(웹페이지 요약 여러 개 등)는 병렬로 진행되고
+    전체 소요 시간은 가장 긴 경로(critical path)에 수렴합니다.
+    """
+
+    def __init__(self, node_classes: Optional[Dict[str, Type[BaseNode]]] = None,
+                 max_workers: int = 4):
+        if node_classes is None:
+            node_classes = NODE_REGISTRY.classes
+        self.node_classes = node_classes
+        self.max_workers = max(1, max_workers)
+
+    def run(self, graph: WorkflowGraph) -> WorkflowRunResult:
+        """
+        그래프 전체를 실행합니다.
+
+        Args:
+            graph (WorkflowGraph): 실행할 워크플로우 그래프
+
+        Returns:
+            WorkflowRunResult: 노드별 실행 결과
+        """
+        started = time.perf_counter()
+        order = graph.topological_order()
+
+        if self.max_workers == 1:
+            results: Dict[str, NodeRunResult] = {}
+            for node in order:
+                results[node] = self._run_node(graph, node, results)
+        else:
+            done_results = self._run_parallel(graph, order)
+            results = {node: done_results[node] for node in order}
+
+        return WorkflowRunResult(
+            success=all(r.status == "success" for r in results.values()),
+            order=order,
+            results=results,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def _run_parallel(self, graph: WorkflowGraph, order: List[str]) -> Dict[str, NodeRunResult]:
+        """
+        준비된(모든 상위 노드가 끝난) 노드를 즉시 스레드 풀에 제출하는 스케줄러.
+        노드 하나가 끝날 때마다 하위 노드의 남은 의존성 수를 줄이고, 0 이 되면 바로 제출합니다.
+        """
+        results: Dict[str, NodeRunResult] = {}
+        pending = {node: len(graph.predecessors(node)) for node in order}
+        ready = [node for node in order if pending[node] == 0]
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="workflow") as pool:
+            while ready or running:
+                for node in ready:
+                    # 워커에는 이미 끝난 상위 노드 결과만 복사해서 넘김
+                    upstream = {p: results[p] for p in graph.predecessors(node)}
+                    running[pool.submit(self._run_node, graph, node, upstream)] = node
+                ready = []
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    results[node] = future.result()
+                    for nxt in graph.successors(node):
+                        pending[nxt] -= 1
+                        if pending[nxt] == 0:
+                            ready.append(nxt)
+
+        return results
+
+    def _collect_inputs(self, graph: WorkflowGraph, node: str,
+                        results: Dict[str, NodeRunResult]) -> Dict[str, Any]:
+        """저장된 입력값에 상위 노드 출력을 연결대로 반영합니다."""
+        inputs = dict(graph.nodes[node].values)
+        for edge in graph.incoming(node):
+            outputs = results[edge.source].outputs
+            if edge.source_port in outputs:
+                inputs[edge.target_port] = outputs[edge.source_port]
+        return inputs
+
+    def _run_node(self, graph: WorkflowGraph, node: str,
+                  results: Dict[str, NodeRunResult]) -> NodeRunResult:
+        """노드 하나를 실행하고 결과를 NodeRunResult 로 감쌉니다."""
+        spec = graph.nodes[node]
+
+        failed = [p for p in graph.predecessors(node)
+                  if results[p].status != "success"]
+        if failed:
+            return NodeRunResult(
+                node=node,
+                node_id=spec.node_id,
+                status="skipped",
+                error=f"upstream node failed: {', '.join(failed)}",
+            )
+
+        node_class = self.node_classes.get(spec.node_id)
+        if node_class is None:
+            return NodeRunResult(
+                node=node,
+                node_id=spec.node_id,
+                status="failed",
+                error=f'node with id "{spec.node_id}" not found',
+            )
+
+        inputs = self._collect_inputs(graph, node, results)
+        started = time.perf_counter()
+        execution_result = node_class().run(inputs)
+
+        return NodeRunResult(
+            node=node,
+            node_id=spec.node_id,
+            status="success" if execution_result.success else "failed",
+            inputs=inputs,
+            outputs=execution_result.outputs,
+            error=execution_result.error,
+            elapsed=time.perf_counter() - started,
+        )
+
+
+def apply_run_result(editor_data: Dict[str, Any], result: WorkflowRunResult) -> Dict[str, Any]:
+    """
+    실행 결과를 에디터 데이터에 반영합니다.
+    브라우저에서 워크플로우를 다시 열었을 때 입력/출력 값이 그대로 보이도록 합니다.
+
+    Args:
+        editor_data (Dict[str, Any]): Workflow.data["custom_editor"]
+        result (WorkflowRunResult): 실행 결과
+
+    Returns:
+        Dict[str, Any]: 값이 갱신된 에디터 데이터 (원본을 직접 수정)
+    """
+    for raw in editor_data.get("nodes") or []:
+        node_result = result.results.get(raw.get("id"))
+        if node_result is None or node_result.status != "success":
+            continue
+        data = raw.setdefault("data", {})
+        data["values"] = node_result.inputs
+        data["outputs"] = node_result.outputs
+    return editor_data
@@ -0,0 +1,151 @@
+from collections import deque
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+class WorkflowGraphError(ValueError):
+    """워크플로우 그래프를 구성할 수 없을 때 발생하는 예외 (잘못된 연결, 순환 등)"""
+
+
+def _listOf(data: Dict[str, Any], key: str) -> List[Any]:
+    # 에디터 데이터의 nodes / connections 목록 (없으면 빈 목록)
+    items = data.get(key) or []
+    if not isinstance(items, list):
+        raise WorkflowGraphError(f"custom_editor {key} must be a list")
+    return items
+
+
+class GraphNode(BaseModel):
+    """에디터에 배치된 노드 하나"""
+    id: str = Field(description="에디터 상의 노드 ID (예: node-1)")
+    node_id: str = Field(description="실행할 노드 클래스의 NODE_ID")
+    values: Dict[str, Any] = Field(
+        default_factory=dict, description="사용자가 입력한 값")
+
+
+class GraphEdge(BaseModel):
+    """출력 포트 -> 입력 포트 연결"""
+    source: str = Field(description="출발 노드 ID")
+    source_port: str = Field(description="출발 노드의 출력 포트")
+    target: str = Field(description="도착 노드 ID")
+    target_port: str = Field(description="도착 노드의 입력 포트")
+
+
+class WorkflowGraph:
+    """
+    custom-node-editor 의 toJSON() 결과로부터 만든 DAG.
+
+    노드는 에디터에 배치된 순서를 유지하며, 간선은 출력 포트에서 입력 포트로 향합니다.
+    """
+
+    def __init__(self, nodes: List[GraphNode], edges: List[GraphEdge]):
+        self.nodes: Dict[str, GraphNode] = {}
+        for node in nodes:
+            if node.id in self.nodes:
+                raise WorkflowGraphError(f"duplicated node id: {node.id}")
+            self.nodes[node.id] = node
+
+        self.edges: List[GraphEdge] = []
+        self._incoming: Dict[str, List[GraphEdge]] = {n: [] for n in self.nodes}
+        self._outgoing: Dict[str, List[GraphEdge]] = {n: [] for n in self.nodes}
+        for edge in edges:
+            if edge.source not in self.nodes or edge.target not in self.nodes:
+                raise WorkflowGraphError(
+                    f"connection refers to unknown node: {edge.source} -> {edge.target}")
+            self.edges.append(edge)
+            self._incoming[edge.target].append(edge)
+            self._outgoing[edge.source].append(edge)
+
+    @classmethod
+    def from_editor_data(cls, data: Dict[str, Any]) -> "WorkflowGraph":
+        """
+        Workflow.data["custom_editor"] 로부터 그래프를 생성합니다.
+
+        Args:
+            data (Dict[str, Any]): {"nodes": [...], "connections": [...]} 형태의 에디터 데이터
+
+        Returns:
+            WorkflowGraph: 생성된 그래프
+        """
+        if not isinstance(data, dict):
+            raise WorkflowGraphError("custom_editor data is empty")
+
+        nodes = []
+        for raw in _listOf(data, "nodes"):
+            if not isinstance(raw, dict):
+                raise WorkflowGraphError(f"node must be an object: {raw!r}")
+            node_data = raw.get("data") or {}
+            if not isinstance(node_data, dict):
+                raise WorkflowGraphError(f"node {raw.get('id')} data must be an object")
+            info = raw.get("info") or node_data.get("info") or {}
+            if not isinstance(info, dict) or not info.get("id"):
+                raise WorkflowGraphError(
+                    f"node {raw.get('id')} has no node type id")
+            values = node_data.get("values") or {}
+            if not isinstance(values, dict):
+                raise WorkflowGraphError(f"node {raw.get('id')} values must be an object")
+            try:
+                nodes.append(GraphNode(id=raw.get("id"), node_id=info["id"], values=dict(values)))
+            except ValidationError as e:
+                raise WorkflowGraphError(f"invalid node {raw.get('id')}: {e}") from e
+
+        edges = []
+        for raw in _listOf(data, "connections"):
+            src = raw.get("from") if isinstance(raw, dict) else None
+            dst = raw.get("to") if isinstance(raw, dict) else None
+            if not isinstance(src, dict) or not isinstance(dst, dict):
+                raise WorkflowGraphError(f"connection must have from/to objects: {raw!r}")
+            try:
+                edges.append(GraphEdge(
+                    source=src.get("node"),
+                    source_port=src.get("port"),
+                    target=dst.get("node"),
+                    target_port=dst.get("port"),
+                ))
+            except ValidationError as e:
+                raise WorkflowGraphError(f"invalid connection {src.get('node')} -> {dst.get('node')}: {e}") from e
+
+        return cls(nodes, edges)
+
+    def incoming(self, node: str) -> List[GraphEdge]:
+        """node 로 들어오는 연결 목록"""
+        return self._incoming[node]
+
+    def outgoing(self, node: str) -> List[GraphEdge]:
+        """node 에서 나가는 연결 목록"""
+        return self._outgoing[node]
+
+    def predecessors(self, node: str) -> List[str]:
+        """node 가 의존하는 노드 ID 목록 (중복 제거)"""
+        return list(dict.fromkeys(e.source for e in self._incoming[node]))
+
+    def successors(self, node: str) -> List[str]:
+        """node 에 의존하는 노드 ID 목록 (중복 제거)"""
+        return list(dict.fromkeys(e.target for e in self._outgoing[node]))
+
+    def topological_order(self) -> List[str]:
+        """
+        Kahn 알고리즘으로 위상 정렬한 노드 ID 목록을 반환합니다.
+        같은 단계의 노드는 에디터에 배치된 순서를 따릅니다.
+
+        Raises:
+            WorkflowGraphError: 그래프에 순환이 있는 경우
+        """
+        indegree = {n: len(self.predecessors(n)) for n in self.nodes}
+        queue = deque(n for n, d in indegree.items() if d == 0)
+        order: List[str] = []
+
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for nxt in self.successors(node):
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    queue.append(nxt)
+
+        if len(order) != len(self.nodes):
+            cyclic = [n for n, d in indegree.items() if d > 0]
+            raise WorkflowGraphError(
+                f"workflow has a cycle: {', '.join(cyclic)}")
+        return order
@@ -128,6 +128,37 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Workflow execution
+# 서버에서 워크플로우를 실행할 때 독립적인 분기를 동시에 실행할 스레드 수 (1이면 순차 실행)
+
+WORKFLOW_MAX_WORKERS = int(os.getenv('WORKFLOW_MAX_WORKERS', '4'))
+
+# Node result cache
+# CACHE_TTL 이 지정된 노드의 실행 결과를 입력 기준으로 재사용 (MAX_BYTES: 메모리 상한)
+# BACKEND 에 CACHES alias 를 지정하면 해당 캐시(DatabaseCache 등)에도 저장해 재시작 후에도 유지
+
+NODE_RESULT_CACHE = {
+    'MAX_BYTES': int(os.getenv('NODE_RESULT_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+    'BACKEND': os.getenv('NODE_RESULT_CACHE_BACKEND') or None,
+}
+
+# KIS stock master refresh
+# 매일 지정한 시각(HH:MM)에 kospi/kosdaq 종목 마스터를 내려받아 검색 인덱스를 교체 (비우면 사용 안 함)
+
+KIS_MASTER_REFRESH_AT = os.getenv('KIS_MASTER_REFRESH_AT', '')
+
+# KIS intraday minute bar recorder
+# 장중 주기적으로 당일 분봉을 받아 로컬 봉 저장소에 기록할 종목코드 (쉼표 구분, 비우면 사용 안 함)
+
+KIS_MINUTE_WATCHLIST = [c.strip() for c in os.getenv('KIS_MINUTE_WATCHLIST', '').split(',') if c.strip()]
+KIS_MINUTE_INTERVAL = float(os.getenv('KIS_MINUTE_INTERVAL', '60'))
+
+# Background jobs (master refresh, minute recorder)
+# runserver(자동 재시작 자식 프로세스)와 gunicorn/uvicorn 등 WSGI/ASGI 서버에서만 시작하고, 여러 워커 중 이 파일 잠금을 잡은 프로세스 하나에서만 실행
+
+KIS_BACKGROUND_JOBS = os.getenv('KIS_BACKGROUND_JOBS', '')  # 1: 항상 시작, 0: 시작 안 함, 비우면 서버 프로세스에서만
+KIS_BACKGROUND_LOCK = os.getenv('KIS_BACKGROUND_LOCK', os.path.join('api', 'data', '.background.lock'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 